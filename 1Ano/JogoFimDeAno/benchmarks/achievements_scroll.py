@@ -0,0 +1,66 @@
+"""Micro-benchmark of the AchievementsGrid's scrolling: latency of a mouse wheel tick (event + draw) by the amount of achievements.
+
+    The achievements are copies of the real ones (half of them unlocked). The ticks scroll down the grid, so the cards
+    entering the view are rendered during them (the first time), like when the player scrolls.
+
+    Run from the game's folder with: python -m benchmarks.achievements_scroll
+"""
+from os import environ
+environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+environ.setdefault("SDL_VIDEODRIVER", "dummy") # Doesn't need a real window
+
+import pygame as pg
+from .harness import get_percentile
+from time import perf_counter_ns
+
+AMOUNTS: list[int] = [7, 100, 1000, 5000]
+TICKS: int = 300
+
+def benchmark_scroll(amount: int, resolution: tuple[int, int] = (800, 600)) -> dict[str, float]:
+    """Returns the milliseconds to create the grid and draw its first frame, and the latencies (in microseconds) of the ticks."""
+    from entities import AchievementsGrid
+    from scripts import get_achievements
+
+    real_achievements = list(get_achievements().values())
+    achievements = { str(i + 1) : real_achievements[i % len(real_achievements)] for i in range(amount) }
+    unlocked = { str(i + 1) : i % 2 == 0 for i in range(amount) }
+    screen = pg.display.get_surface()
+    wheel_down = pg.event.Event(pg.MOUSEWHEEL, x=0, y=1)
+
+    start = perf_counter_ns()
+    grid = AchievementsGrid(resolution, (255, 255, 255), (120, 120, 120), (30, 30, 30), 20, 1.5, 10, achievements=achievements, achievements_unlocked=unlocked)
+    grid.draw(screen)
+    first_frame = (perf_counter_ns() - start) / 1e6
+
+    times: list[float] = []
+    for _ in range(TICKS):
+        start = perf_counter_ns()
+        grid.update_by_event(wheel_down)
+        grid.draw(screen)
+        times.append((perf_counter_ns() - start) / 1000)
+    times.sort()
+
+    return {
+        "first_frame_ms" : first_frame,
+        "mean_us" : sum(times) / len(times),
+        "p50_us" : get_percentile(times, 0.5),
+        "p99_us" : get_percentile(times, 0.99),
+        "max_us" : times[-1]
+    }
+
+def main() -> None:
+    pg.init()
+    pg.display.set_mode((800, 600))
+
+    print(f"{TICKS} mouse wheel ticks (event + draw) scrolling down:")
+    for amount in AMOUNTS:
+        result = benchmark_scroll(amount)
+        print(
+            f"{amount:>5} achievements | first frame {result['first_frame_ms']:>8.2f} ms | tick mean {result['mean_us']:>9.1f} us"
+            f" | p50 {result['p50_us']:>9.1f} us | p99 {result['p99_us']:>9.1f} us | max {result['max_us']:>9.1f} us"
+        )
+
+    pg.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Micro-benchmark of the Player x obstacles collision on the obstacles the game really tests.
+
+    'check_collision' only tests the obstacles within the Player's reach, found by bisecting the obstacles sorted by y (see
+    'BaseObstaclesManager._get_window'). This plays the random mode and a late level headless, with random keys and the
+    Player passing through the obstacles, and every frame times that check (the window plus the obstacles' tests) and counts
+    the obstacles in the window. The times are reported by the size of the window.
+
+    Run from the game's folder with: python -m benchmarks.collision
+"""
+from os import environ
+environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+environ.setdefault("SDL_VIDEODRIVER", "dummy") # Doesn't need a real window
+
+import pygame as pg
+from time import perf_counter
+
+FRAMES: int = 20000 # Of each mode
+RUNS: tuple[tuple[str, int], ...] = (("random", 1), ("level", 12))
+
+def measure(mode: str, level: int) -> dict[int, list[float]]:
+    """Returns the seconds of each frame's collision check, by the amount of obstacles tested."""
+    from entities import Simulation, ScriptedInput
+
+    timeline = ScriptedInput.random_timeline(0, FRAMES / 60, (pg.K_a, pg.K_d, pg.K_SPACE, pg.K_LSHIFT))
+    simulation = Simulation(mode, level, 2, 0, 1 / 60, timeline, reset_on_collision=False)
+    player, manager = simulation.get_player(), simulation.get_obstacles_manager()
+    times: dict[int, list[float]] = {}
+
+    for _ in range(FRAMES):
+        simulation.step()
+
+        start = perf_counter() # The same as 'check_collision', without posting the collisions again
+        reach = player.get_distance() + player.get_radius()
+        window = manager._get_window(player.get_center()[1] - reach, player.get_center()[1] + reach)
+        manager._get_collisions(player, manager._obstacles[window.start:window.stop])
+        times.setdefault(len(window), []).append(perf_counter() - start)
+
+    simulation.close()
+    return times
+
+def main() -> None:
+    pg.init()
+    pg.display.set_mode((800, 600))
+
+    for mode, level in RUNS:
+        times = measure(mode, level)
+        all_times = [ time for sizes_times in times.values() for time in sizes_times ]
+        name = f"level {level}" if mode == "level" else mode
+        print(f"{name}, {FRAMES} frames: {sum(all_times) / len(all_times) * 1e6:.1f} us/frame on average")
+        for size in sorted(times):
+            print(f"    {size} obstacles tested: {len(times[size]):>6} frames, {sum(times[size]) / len(times[size]) * 1e6:>6.1f} us/frame")
+
+    pg.quit()
+
+if __name__ == "__main__":
+    main()
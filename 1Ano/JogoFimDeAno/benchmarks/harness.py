@@ -0,0 +1,110 @@
+"""Helpers of the benchmark suite: the cases, the per-call measurements (latency percentiles and allocations) and the JSON results.
+
+    The allocations are the Python ones traced by 'tracemalloc', the pixels of the Surfaces are allocated by SDL and aren't counted.
+"""
+import gc
+import tracemalloc
+from json import dump as json_dump, load as json_load
+from time import perf_counter_ns
+from typing import Any, Callable
+
+class BenchmarkCase:
+    """A benchmarked call: 'setup(resolution, dt)' prepares the objects and returns the function called in each measurement.
+
+        The cases that don't depend on the framerate ('uses_dt' False) run once per resolution, the slow ones can limit their calls.
+    """
+    def __init__(self, name: str, setup: Callable[[tuple[int, int], float], Callable[[], Any]], uses_dt: bool = True, max_calls: int | None = None) -> None:
+        self.name = name
+        self.setup = setup
+        self.uses_dt = uses_dt
+        self.max_calls = max_calls
+
+def get_percentile(sorted_values: list[float], fraction: float) -> float:
+    """Returns the nearest-rank percentile of the already sorted values."""
+    return sorted_values[min(len(sorted_values) - 1, round(fraction * (len(sorted_values) - 1)))]
+
+def measure(call: Callable[[], Any], calls: int, warmup: int = 10) -> dict[str, float]:
+    """Returns the latency (in microseconds) of 'calls' calls and the Python memory allocated by each call.
+
+        The latencies are measured first without tracing (tracemalloc slows every allocation), then the same amount of
+        calls runs traced, giving the mean peak allocated in a call and the mean retained after it (not freed, like caches).
+    """
+    for _ in range(warmup):
+        call()
+
+    gc.collect()
+    times: list[float] = []
+    for _ in range(calls):
+        start = perf_counter_ns()
+        call()
+        times.append((perf_counter_ns() - start) / 1000)
+    times.sort()
+
+    tracemalloc.start()
+    peak_total = 0
+    start_memory = tracemalloc.get_traced_memory()[0]
+    for _ in range(calls):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        call()
+        peak_total += tracemalloc.get_traced_memory()[1] - before
+    retained = tracemalloc.get_traced_memory()[0] - start_memory
+    tracemalloc.stop()
+
+    return {
+        "mean_us" : round(sum(times) / calls, 3),
+        "p50_us" : round(get_percentile(times, 0.5), 3),
+        "p90_us" : round(get_percentile(times, 0.9), 3),
+        "p99_us" : round(get_percentile(times, 0.99), 3),
+        "max_us" : round(times[-1], 3),
+        "alloc_peak_bytes" : round(peak_total / calls, 1),
+        "alloc_retained_bytes" : round(retained / calls, 1)
+    }
+
+def run_cases(cases: list[BenchmarkCase], resolutions: list[tuple[int, int]], framerates: list[int], calls: int, log: Callable[[str], None] = print) -> list[dict[str, Any]]:
+    """Measures every case in every resolution (and framerate, for the cases that use the 'dt'), returning one result per run."""
+    results: list[dict[str, Any]] = []
+
+    for case in cases:
+        for resolution in resolutions:
+            for fps in (framerates if case.uses_dt else [None]):
+                case_calls = calls if case.max_calls == None else min(calls, case.max_calls)
+                call = case.setup(resolution, 1 / (fps or framerates[0]))
+                result = { "case" : case.name, "resolution" : list(resolution), "fps" : fps, "calls" : case_calls, **measure(call, case_calls) }
+                results.append(result)
+                log(format_result(result))
+
+    return results
+
+def format_result(result: dict[str, Any]) -> str:
+    resolution = "x".join(str(i) for i in result["resolution"])
+    fps = "-" if result["fps"] == None else result["fps"]
+    return (f"{result['case']:<38} {resolution:>9} {fps:>5} | p50 {result['p50_us']:>10.2f} us | p90 {result['p90_us']:>10.2f} us | "
+            f"p99 {result['p99_us']:>10.2f} us | peak {result['alloc_peak_bytes']:>10.0f} B | retained {result['alloc_retained_bytes']:>8.0f} B")
+
+def get_result_key(result: dict[str, Any]) -> tuple[str, tuple[int, ...], int | None]:
+    return (result["case"], tuple(result["resolution"]), result["fps"])
+
+def save_results(path: str, metadata: dict[str, Any], results: list[dict[str, Any]]) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json_dump({ "metadata" : metadata, "results" : results }, file, ensure_ascii=False, indent=4)
+
+def load_results(path: str) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as file:
+        return json_load(file)
+
+def compare_results(old: dict[str, Any], new: dict[str, Any], threshold: float = 0.1) -> list[str]:
+    """Returns one line per run present in both results, with the p50 change, marking the ones slower than 'threshold' (10%)."""
+    old_results = { get_result_key(result) : result for result in old["results"] }
+    lines: list[str] = []
+
+    for result in new["results"]:
+        old_result = old_results.get(get_result_key(result))
+        if old_result == None or old_result["p50_us"] <= 0: continue
+
+        change = result["p50_us"] / old_result["p50_us"] - 1
+        mark = "REGRESSION" if change > threshold else "faster" if change < -threshold else ""
+        case, resolution, fps = get_result_key(result)
+        lines.append(f"{case:<38} {'x'.join(str(i) for i in resolution):>9} {fps or '-':>5} | p50 {old_result['p50_us']:>10.2f} -> {result['p50_us']:>10.2f} us ({change:+7.1%}) {mark}")
+
+    return lines
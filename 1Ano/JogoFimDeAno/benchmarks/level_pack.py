@@ -0,0 +1,86 @@
+"""Micro-benchmark of the level packs: what starting a level costs by the size of the pack, parsing the json vs the compiled pack.
+
+    The packs are made of random levels (20 obstacles each, from the level mode's templates) written to a temporary folder.
+    "json" is parsing the whole json to get one level (what the game did), "pack" is opening the compiled pack and reading
+    one level's placements (what it does now). The compile time is the one-time cost when the json changes.
+
+    Run from the game's folder with: python -m benchmarks.level_pack
+"""
+from os import environ
+environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+environ.setdefault("SDL_VIDEODRIVER", "dummy") # Doesn't need a real window
+
+import pygame as pg
+from .harness import get_percentile
+from json import dumps as json_dumps, loads as json_loads
+from os.path import join
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter_ns
+
+AMOUNTS: list[int] = [12, 1000, 10000, 100000]
+OBSTACLES_PER_LEVEL: int = 20
+REPEATS: int = 30
+
+def benchmark_pack(amount: int, folder: str) -> dict[str, float]:
+    """Returns the milliseconds to compile the pack and the medians (in microseconds) of getting a random level from the json and from the pack."""
+    from entities import LevelPack, compile_level_pack, get_level_templates
+
+    templates = get_level_templates()
+    rng = Random(amount)
+    levels = { str(level) : [ rng.randrange(len(templates)) for _ in range(OBSTACLES_PER_LEVEL) ] for level in range(1, amount + 1) }
+    json_path, pack_path = join(folder, f"levels{amount}.json"), join(folder, f"levels{amount}.pack")
+
+    with open(json_path, "w") as file:
+        file.write(json_dumps(levels))
+
+    start = perf_counter_ns()
+    with open(json_path, "rb") as file:
+        data = compile_level_pack(json_loads(file.read()), templates)
+    with open(pack_path, "wb") as file:
+        file.write(data)
+    compile_time = (perf_counter_ns() - start) / 1e6
+
+    json_times: list[float] = []
+    pack_times: list[float] = []
+    for _ in range(REPEATS):
+        level = rng.randint(1, amount)
+
+        start = perf_counter_ns()
+        with open(json_path) as file:
+            json_loads(file.read())[str(level)]
+        json_times.append((perf_counter_ns() - start) / 1000)
+
+        start = perf_counter_ns()
+        pack = LevelPack.open(pack_path)
+        pack.get_level(level)
+        pack_times.append((perf_counter_ns() - start) / 1000)
+        pack.close()
+
+    json_times.sort()
+    pack_times.sort()
+
+    return {
+        "compile_ms" : compile_time,
+        "pack_bytes" : len(data),
+        "json_p50_us" : get_percentile(json_times, 0.5),
+        "pack_p50_us" : get_percentile(pack_times, 0.5)
+    }
+
+def main() -> None:
+    pg.init()
+    pg.display.set_mode((800, 600))
+
+    print(f"Getting one level ({OBSTACLES_PER_LEVEL} obstacles) of a pack, median of {REPEATS}:")
+    with TemporaryDirectory() as folder:
+        for amount in AMOUNTS:
+            result = benchmark_pack(amount, folder)
+            print(
+                f"{amount:>6} levels | json {result['json_p50_us']:>10.1f} us | pack {result['pack_p50_us']:>6.1f} us"
+                f" | compile {result['compile_ms']:>8.2f} ms ({result['pack_bytes']} bytes)"
+            )
+
+    pg.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Micro-benchmark of the LevelsOrganizer: latency of a mouse wheel tick (event + draw) and of a click by the amount of levels.
+
+    The clicks are on the first level's button (the level function only counts them, nothing is opened). Then the ticks
+    scroll down the grid, so the rows entering the view create their buttons during them, like when the player scrolls.
+
+    Run from the game's folder with: python -m benchmarks.levels_scroll
+"""
+from os import environ
+environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+environ.setdefault("SDL_VIDEODRIVER", "dummy") # Doesn't need a real window
+
+import pygame as pg
+from .harness import get_percentile
+from time import perf_counter_ns
+
+AMOUNTS: list[int] = [12, 100, 1000, 10000]
+TICKS: int = 300
+
+def benchmark_levels(amount: int, resolution: tuple[int, int] = (800, 600)) -> dict[str, float]:
+    """Returns the milliseconds to create the grid and draw its first frame, and the latencies (in microseconds) of the ticks and the clicks."""
+    from entities import LevelsOrganizer, InputHandler, ScriptedInput
+    from scripts import get_font
+
+    screen = pg.display.get_surface()
+    clicks = [0]
+    def level_function(level: int):
+        def count() -> None:
+            clicks[0] += 1
+        return count
+
+    wheel_down = pg.event.Event(pg.MOUSEWHEEL, x=0, y=-1)
+    click = pg.event.Event(pg.MOUSEBUTTONDOWN, button=1, pos=(resolution[0] * 3 // 5, resolution[1] * 2 // 15)) # The first button's center
+
+    start = perf_counter_ns()
+    organizer = LevelsOrganizer(400, (600, 0), 75, 3, level_function, get_font(), amount)
+    organizer.resize(resolution)
+    organizer.draw(screen)
+    first_frame = (perf_counter_ns() - start) / 1e6
+
+    click_times: list[float] = []
+    for _ in range(TICKS):
+        start = perf_counter_ns()
+        organizer.update_by_event(click)
+        click_times.append((perf_counter_ns() - start) / 1000)
+    click_times.sort()
+
+    ticks: list[float] = []
+    InputHandler.set_scripted_input(ScriptedInput(mouse_pos=(resolution[0] * 3 // 4, resolution[1] // 2))) # The wheel only scrolls with the mouse over the grid
+    try:
+        for _ in range(TICKS):
+            start = perf_counter_ns()
+            organizer.update_by_event(wheel_down)
+            organizer.draw(screen)
+            ticks.append((perf_counter_ns() - start) / 1000)
+    finally:
+        InputHandler.set_scripted_input(None)
+    ticks.sort()
+
+    return {
+        "first_frame_ms" : first_frame,
+        "tick_p50_us" : get_percentile(ticks, 0.5),
+        "tick_p99_us" : get_percentile(ticks, 0.99),
+        "click_p50_us" : get_percentile(click_times, 0.5),
+        "clicks" : clicks[0]
+    }
+
+def main() -> None:
+    pg.init()
+    pg.display.set_mode((800, 600))
+
+    print(f"{TICKS} mouse wheel ticks (event + draw) scrolling down and {TICKS} clicks:")
+    for amount in AMOUNTS:
+        result = benchmark_levels(amount)
+        print(
+            f"{amount:>5} levels | first frame {result['first_frame_ms']:>8.2f} ms | tick p50 {result['tick_p50_us']:>8.1f} us"
+            f" | p99 {result['tick_p99_us']:>8.1f} us | click p50 {result['click_p50_us']:>6.1f} us ({result['clicks']} clicks hit)"
+        )
+
+    pg.quit()
+
+if __name__ == "__main__":
+    main()
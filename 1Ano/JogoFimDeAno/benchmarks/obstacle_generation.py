@@ -0,0 +1,53 @@
+"""Micro-benchmark of the obstacles' generation spike ("Novos Obstáculos Gerados"): copying the templates against the ObstaclePool.
+
+    Run from the game's folder with: python -m benchmarks.obstacle_generation
+"""
+from os import environ
+environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+environ.setdefault("SDL_VIDEODRIVER", "dummy") # Doesn't need a real window
+
+import pygame as pg
+from copy import deepcopy
+from random import seed
+from time import perf_counter
+
+GENERATIONS: int = 300
+
+def benchmark_generations(pooled: bool, resolution: tuple[int, int] = (800, 600)) -> list[float]:
+    """Returns the milliseconds spent by each generation of a RandomObstaclesManager (the work of the generation's frame)."""
+    from entities import Player, RandomObstaclesManager
+    from entities.obstaclesmanager.obstacle_pool import ObstaclePool
+
+    class CopyingPool(ObstaclePool):
+        """Copies the templates in every generation, like the managers did before the pool."""
+        def acquire(self, template_index: int):
+            return deepcopy(self._templates[template_index])
+
+    seed(0)
+    player = Player([i // 2 for i in resolution], 2, 20)
+    manager = RandomObstaclesManager(player.get_center(), player.get_normal_distance(), player.get_angular_speed(), 3)
+    if not pooled: manager._obstacle_pool = CopyingPool(manager._possibles_obstacles)
+    manager.resize(resolution, player.get_center(), player.get_normal_distance())
+
+    times: list[float] = []
+    for _ in range(GENERATIONS):
+        start = perf_counter()
+        manager._generate_obstacles()
+        times.append((perf_counter() - start) * 1000)
+        pg.event.clear() # The NEWGENERATIONWARNING events
+
+    return times
+
+def main() -> None:
+    pg.init()
+    pg.display.set_mode((800, 600))
+
+    print(f"{GENERATIONS} generations (10-20 obstacles each):")
+    for name, pooled in (("deepcopy", False), ("ObstaclePool", True)):
+        times = sorted(benchmark_generations(pooled))
+        print(f"{name:<12} mean {sum(times) / len(times):>6.2f} ms, p95 {times[int(len(times) * 0.95)]:>6.2f} ms, max {times[-1]:>6.2f} ms")
+
+    pg.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark of the Player's trail (tracker) update and draw with different framerates.
+
+    The trails keep one sample per fixed spacing of time (see 'TrailHistory'), so from 60 FPS up the frame time should stay
+    flat: the last line is the slowest framerate's time over the fastest one's.
+
+    Run from the game's folder with: python -m benchmarks.player_trail
+"""
+from os import environ
+environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+environ.setdefault("SDL_VIDEODRIVER", "dummy") # Doesn't need a real window
+
+import pygame as pg
+from time import perf_counter
+
+FRAMERATES: tuple[int, ...] = (60, 144, 240, 500, 1000)
+SIMULATED_SECONDS: float = 2.0
+
+def benchmark_framerate(fps: int, resolution: tuple[int, int] = (800, 600)) -> float:
+    """Returns the mean time (in ms) of one frame of the Player (update + draw) running at 'fps'."""
+    from entities import Player
+
+    screen = pg.display.get_surface()
+    player = Player([i // 2 for i in resolution], 2, 20)
+    player.set_circle_colors([(255, 30, 30), (35, 172, 255)])
+    player.toggle_control() # Rotates by itself, like the menus' background
+    dt = 1 / fps
+
+    for _ in range(fps): # 1 second to fill the tracker
+        player.update(dt)
+
+    frames = round(fps * SIMULATED_SECONDS)
+    start = perf_counter()
+    for _ in range(frames):
+        screen.fill((0, 0, 0))
+        player.update(dt)
+        player.draw(screen)
+    
+    return (perf_counter() - start) / frames * 1000
+
+def main() -> None:
+    pg.init()
+    pg.display.set_mode((800, 600))
+
+    print(f"{'FPS':>6} | {'ms/frame':>9} | {'% of the frame budget':>22}")
+    frame_times = []
+    for fps in FRAMERATES:
+        frame_time = benchmark_framerate(fps)
+        frame_times.append(frame_time)
+        print(f"{fps:>6} | {frame_time:>9.3f} | {frame_time / (1000 / fps) * 100:>21.1f}%")
+
+    print(f"Spread of the frame time from {FRAMERATES[0]} to {FRAMERATES[-1]} FPS: {max(frame_times) / min(frame_times):.2f}x")
+
+    pg.quit()
+
+if __name__ == "__main__":
+    main()
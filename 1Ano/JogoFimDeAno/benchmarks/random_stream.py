@@ -0,0 +1,72 @@
+"""Micro-benchmark of the random mode's obstacles over a long run: the latency of each frame's update, the obstacles alive and the memory.
+
+    The RandomObstaclesManager runs alone (no Player input, no collisions) for 'MINUTES' simulated minutes at 60 FPS, so the score
+    goes past the 1000 points of the achievements. The memory is what 'tracemalloc' sees allocated and kept after the first minute.
+
+    Run from the game's folder with: python -m benchmarks.random_stream
+"""
+from os import environ
+environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+environ.setdefault("SDL_VIDEODRIVER", "dummy") # Doesn't need a real window
+
+import pygame as pg
+import tracemalloc
+from .harness import get_percentile
+from array import array
+from random import seed
+from time import perf_counter_ns
+
+MINUTES: int = 30
+FPS: int = 60
+
+def benchmark_stream(resolution: tuple[int, int] = (800, 600)) -> dict[str, float]:
+    """Returns the latencies (in microseconds) of the updates, the most obstacles alive, the final score and the memory kept."""
+    from entities import RandomObstaclesManager, Player
+    from scripts import BASE_RESOLUTION
+
+    seed(0)
+    player = Player([i // 2 for i in BASE_RESOLUTION], 2, 20)
+    manager = RandomObstaclesManager(player.get_center(), player.get_normal_distance(), player.get_angular_speed(), 3)
+    manager.resize(resolution, player.get_center(), player.get_normal_distance())
+
+    frames = MINUTES * 60 * FPS
+    times = array("d", bytes(8 * frames)) # Allocated before, so it isn't counted as kept memory
+    most_obstacles = 0
+
+    tracemalloc.start()
+    for frame in range(frames):
+        if frame == 60 * FPS:
+            memory_start = tracemalloc.get_traced_memory()[0]
+
+        start = perf_counter_ns()
+        manager.update(1 / FPS)
+        times[frame] = (perf_counter_ns() - start) / 1000
+        most_obstacles = max(most_obstacles, len(manager._obstacles))
+
+    memory_kept = tracemalloc.get_traced_memory()[0] - memory_start
+    tracemalloc.stop()
+    sorted_times = sorted(times)
+
+    return {
+        "p50_us" : get_percentile(sorted_times, 0.5),
+        "p99_us" : get_percentile(sorted_times, 0.99),
+        "max_us" : sorted_times[-1],
+        "most_obstacles" : most_obstacles,
+        "score" : manager.get_score(),
+        "memory_kept_bytes" : memory_kept
+    }
+
+def main() -> None:
+    pg.init()
+    pg.display.set_mode((800, 600))
+
+    result = benchmark_stream()
+    print(
+        f"{MINUTES} minutes at {FPS} FPS | update p50 {result['p50_us']:.1f} us | p99 {result['p99_us']:.1f} us | max {result['max_us']:.1f} us"
+        f" | most obstacles {result['most_obstacles']} | score {result['score']} | memory kept {result['memory_kept_bytes'] / 1024:.1f} KiB"
+    )
+
+    pg.quit()
+
+if __name__ == "__main__":
+    main()
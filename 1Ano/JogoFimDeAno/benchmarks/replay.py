@@ -0,0 +1,129 @@
+"""Micro-benchmark of the replays over an hour of the level mode: the size of the file and what seeking costs. Then a check
+    of the windowed game modes' replays.
+
+    The run is recorded with random keys (changing every 0.1 to 1 second, more often than a player) at 60 FPS. "cold" seeks a
+    new player of the replay, which has to fast-forward from the start once (taking the snapshots on the way); "warm" seeks the
+    same player again (it restores the nearest snapshot); "recorded" seeks a player given the snapshots taken while recording.
+    Every playback is checked against the recorded run.
+
+    The check plays each game mode in the real 'Game' window for a while, with random keys in real time and a resize in the
+    middle, and plays the replay it saved: the playback must get the same result as the windowed run.
+
+    Run from the game's folder with: python -m benchmarks.replay
+"""
+from os import environ
+environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+environ.setdefault("SDL_VIDEODRIVER", "dummy") # Doesn't need a real window
+
+import pygame as pg
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any
+
+MINUTES: int = 60
+SEEK_MINUTE: int = 40
+FPS: int = 60
+WINDOW_SECONDS: int = 20 # Played in each windowed game mode, in real time
+
+def get_state(simulation: Any) -> tuple:
+    """What must be the same in the recorded run and its playback, in a frame."""
+    player, manager = simulation.get_player(), simulation.get_obstacles_manager()
+    return (simulation.get_frame(), [ tuple(position) for position in player.get_positions() ], [ obstacle.get_y() for obstacle in manager._obstacles ], manager.get_player_collision_count())
+
+def benchmark_replay() -> dict[str, float]:
+    """Returns the size of the replay, the seconds of each seek and if all the playbacks were the same as the run."""
+    from entities import Simulation, Replay, ReplayRecorder, ReplayPlayer, ScriptedInput
+
+    frames = MINUTES * 60 * FPS
+    timeline = ScriptedInput.random_timeline(0, MINUTES * 60, (pg.K_a, pg.K_d, pg.K_SPACE, pg.K_LSHIFT))
+
+    start = perf_counter()
+    recorder = ReplayRecorder("level", 1, 2, 0, 1 / FPS)
+    simulation = Simulation("level", 1, 2, 0, 1 / FPS, timeline, recorder=recorder)
+    snapshots = { 0 : simulation.get_snapshot() }
+    expected = {}
+    for frame in range(1, frames + 1):
+        simulation.step()
+        if frame % (30 * FPS) == 0:
+            snapshots[frame] = simulation.get_snapshot()
+        if frame in (SEEK_MINUTE * 60 * FPS, frames):
+            expected[frame] = get_state(simulation)
+    record_time = perf_counter() - start
+
+    data = recorder.get_replay().to_bytes()
+    simulation.close()
+    replay = Replay.from_bytes(data)
+
+    def seek(replay_player: ReplayPlayer, minute: int) -> float:
+        start = perf_counter()
+        replay_player.seek(minute * 60)
+        return perf_counter() - start
+
+    cold_player = ReplayPlayer(replay)
+    cold_time = seek(cold_player, SEEK_MINUTE)
+    same = get_state(cold_player.get_simulation()) == expected[SEEK_MINUTE * 60 * FPS]
+    seek(cold_player, 10)
+    warm_time = seek(cold_player, SEEK_MINUTE)
+    same = same and get_state(cold_player.get_simulation()) == expected[SEEK_MINUTE * 60 * FPS]
+    cold_player.close()
+
+    recorded_player = ReplayPlayer(replay, snapshots=snapshots)
+    recorded_time = seek(recorded_player, SEEK_MINUTE)
+    same = same and get_state(recorded_player.get_simulation()) == expected[SEEK_MINUTE * 60 * FPS]
+    recorded_player.seek(MINUTES * 60)
+    same = same and get_state(recorded_player.get_simulation()) == expected[frames]
+    recorded_player.close()
+
+    return {
+        "replay_bytes" : len(data),
+        "changes" : replay.get_amount_changes(),
+        "record_s" : record_time,
+        "cold_seek_s" : cold_time,
+        "warm_seek_s" : warm_time,
+        "recorded_seek_s" : recorded_time,
+        "same" : same
+    }
+
+def check_windowed_replays() -> dict[str, bool]:
+    """Returns, for each game mode, if the replay saved by the windowed run got the same result when played."""
+    from entities import ReplayLibrary, ReplayPlayer, ScriptedInput
+    from game import Game, WindowsKeys
+
+    game = Game()
+    results = {}
+
+    with TemporaryDirectory() as folder:
+        ReplayLibrary.set_folder(folder) # Not among the player's replays
+
+        for mode, window, size in (("random", WindowsKeys.MAINGAMERANDOM, (1000, 700)), ("level", WindowsKeys.MAINGAMELEVEL, (700, 800))):
+            timeline = ScriptedInput.random_timeline(len(results), WINDOW_SECONDS, (pg.K_a, pg.K_d, pg.K_SPACE, pg.K_LSHIFT))
+            pg.time.set_timer(pg.event.Event(pg.VIDEORESIZE, size=size, w=size[0], h=size[1]), WINDOW_SECONDS * 500, 1)
+            pg.time.set_timer(pg.QUIT, WINDOW_SECONDS * 1000, 1) # Leaves the window, which saves the replay
+            game.run_window(window, ScriptedInput(timeline))
+
+            replay = ReplayLibrary.get_last()
+            replay_player = ReplayPlayer(replay)
+            replay_player.run()
+            results[mode] = replay.get_mode() == mode and replay_player.get_simulation().get_result() == replay.get_result()
+            replay_player.close()
+
+    return results
+
+def main() -> None:
+    pg.init()
+    pg.display.set_mode((800, 600))
+
+    result = benchmark_replay()
+    print(
+        f"{MINUTES} minutes at {FPS} FPS | replay {result['replay_bytes']} bytes ({result['changes']} input changes) | recorded in {result['record_s']:.1f} s"
+        f" | seek to minute {SEEK_MINUTE}: cold {result['cold_seek_s']:.2f} s, warm {result['warm_seek_s'] * 1000:.1f} ms, recorded {result['recorded_seek_s'] * 1000:.1f} ms"
+        f" | same as the run: {result['same']}"
+    )
+
+    windowed = check_windowed_replays()
+    print(f"windowed runs ({WINDOW_SECONDS} s each) played again the same: " + ", ".join(f"{mode} {same}" for mode, same in windowed.items()))
+
+    pg.quit()
+
+if __name__ == "__main__":
+    main()
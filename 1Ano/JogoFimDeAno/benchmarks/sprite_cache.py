@@ -0,0 +1,53 @@
+"""Micro-benchmark of the SpriteCache: frames/s drawing a Player with 3 overlapping circles and active particles.
+
+    Run from the game's folder with: python -m benchmarks.sprite_cache
+"""
+from os import environ
+environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+environ.setdefault("SDL_VIDEODRIVER", "dummy") # Doesn't need a real window
+
+import pygame as pg
+from time import perf_counter
+
+FRAMES: int = 2000
+
+def benchmark_frames(cache_enabled: bool, resolution: tuple[int, int] = (800, 600)) -> float:
+    """Returns the frames/s drawing the Player (3 circles intersecting) and 3 particle explosions."""
+    from entities import Player, ParticleManager, SpriteCache
+
+    SpriteCache.set_enabled(cache_enabled)
+    screen = pg.display.get_surface()
+    player = Player([i // 2 for i in resolution], 3, 20, distance=15) # Close enough to always draw the intersection
+    player.set_circle_colors([(255, 30, 30), (35, 172, 255), (30, 255, 30)])
+    player.toggle_control()
+    colors = player.get_colors()
+    dt = 1 / 240
+    particles: list[ParticleManager] = []
+
+    start = perf_counter()
+    for frame in range(FRAMES):
+        if frame % 120 == 0: # New explosions before the old ones disappear
+            particles = [ ParticleManager(pos.copy(), 20, 400, 2, color, resolution) for pos, color in zip(player.get_positions(), colors) ]
+
+        screen.fill((0, 0, 0))
+        player.update(dt)
+        player.draw(screen)
+        for p in particles:
+            p.update(dt)
+            p.draw(screen)
+
+    return FRAMES / (perf_counter() - start)
+
+def main() -> None:
+    pg.init()
+    pg.display.set_mode((800, 600))
+
+    uncached = benchmark_frames(False)
+    cached = benchmark_frames(True)
+    print(f"Without SpriteCache: {uncached:>8.1f} frames/s")
+    print(f"With SpriteCache:    {cached:>8.1f} frames/s ({cached / uncached:.2f}x)")
+
+    pg.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Profile of the imports left for the first use: what opening each window that needs them costs the first time.
+
+    'python game.py --startup-profile' times the start until the first frame; the modules 'entities' imports lazily (see its
+    '_LAZY_ATTRIBUTES') aren't part of it, they're imported by the windows. This times each of them, once 'entities' is
+    imported, with the same 'StartupProfiler'. Only the first access imports, so it's run once per process.
+
+    Run from the game's folder with: python -m benchmarks.startup
+"""
+from os import environ
+environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+environ.setdefault("SDL_VIDEODRIVER", "dummy") # Doesn't need a real window
+
+import pygame as pg
+
+def profile_lazy_imports() -> str:
+    """Returns the report of the first access to each lazy attribute of 'entities' (a phase each)."""
+    import entities
+    from entities.profiler import StartupProfiler
+
+    profiler = StartupProfiler.start()
+    for name in entities._LAZY_ATTRIBUTES:
+        getattr(entities, name)
+        profiler.mark(name)
+    profiler.finish("fim")
+
+    return profiler.report(title="Tempo dos imports no primeiro uso")
+
+def main() -> None:
+    pg.init()
+    pg.display.set_mode((800, 600))
+
+    print(profile_lazy_imports())
+
+    pg.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+"""Benchmark suite of the per-frame hot paths: the Player, each obstacle class, the particles, the stains, the backgrounds and the texts.
+
+    Every case runs off-screen in several resolutions and framerates (the 'dt' of the updates, the trackers' sizes depend on it),
+    reporting the per-call latency percentiles and the allocations. The results are saved as JSON, so two commits can be compared.
+
+    Run from the game's folder with: python -m benchmarks.suite [--output results.json] [--compare old_results.json] [--quick]
+"""
+from os import environ
+environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+environ.setdefault("SDL_VIDEODRIVER", "dummy") # Doesn't need a real window
+environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+import platform
+from .harness import BenchmarkCase, run_cases, save_results, load_results, compare_results
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from random import seed
+from subprocess import run, DEVNULL
+from typing import Any, Callable
+
+RESOLUTIONS: list[tuple[int, int]] = [(800, 600), (1280, 720), (1920, 1080)]
+FRAMERATES: list[int] = [60, 144, 240]
+CALLS: int = 300
+
+def create_player(resolution: tuple[int, int], dt: float) -> Any:
+    """Returns a Player like the game's one, resized to 'resolution' and with 1 second of tracker."""
+    from entities import Player
+    from scripts import BASE_RESOLUTION, COLORS
+
+    player = Player([i // 2 for i in BASE_RESOLUTION], 2, 20)
+    player.set_circle_colors([COLORS["RED"], COLORS["BLUE"]])
+    player.toggle_control() # Rotates by itself, the benchmark doesn't press keys
+    player.resize(resolution)
+
+    for _ in range(round(1 / dt)):
+        player.update(dt)
+
+    return player
+
+def get_obstacles_speed(player: Any) -> float:
+    """Returns the obstacles' speed (pixels per second) used by the obstacles managers."""
+    return player.get_normal_distance() * 2 / (180 / player.get_angular_speed())
+
+def create_obstacles(resolution: tuple[int, int], player: Any) -> dict[str, Any]:
+    """Returns the first obstacle of each class in the obstacles list, created for 'resolution' (like the obstacles managers' ones)."""
+    from entities import get_obstacle_list
+    from scripts import OBSTACLES_HEIGHT, COLORS, scale_dimension
+
+    speed = get_obstacles_speed(player)
+    obstacles: dict[str, Any] = {}
+
+    for obstacle in get_obstacle_list(player.get_center(), player.get_normal_distance(), player.get_angular_speed(), scale_dimension(OBSTACLES_HEIGHT, resolution), speed, COLORS["WHITE"]):
+        obstacles.setdefault(type(obstacle).__name__, obstacle)
+
+    return obstacles
+
+def get_obstacle_cases() -> list[BenchmarkCase]:
+    cases: list[BenchmarkCase] = []
+
+    for class_name in ("StationaryObstacle", "RotatingObstacle", "ObstacleGroup", "InvisibleObstacle", "HorizontalMovingObstacle"):
+        def setup_update(resolution: tuple[int, int], dt: float, class_name: str = class_name) -> Callable[[], Any]:
+            obstacle = create_obstacles(resolution, create_player(resolution, dt))[class_name]
+            return lambda: obstacle.update(dt)
+
+        def setup_draw(resolution: tuple[int, int], dt: float, class_name: str = class_name) -> Callable[[], Any]:
+            player = create_player(resolution, dt)
+            obstacle = create_obstacles(resolution, player)[class_name]
+            obstacle.set_y(player.get_center()[1] - get_obstacles_speed(player)) # 1 second above the Player, after the updates it's next to it
+            for _ in range(round(1 / dt)):
+                obstacle.update(dt)
+
+            screen = pg.Surface(resolution)
+            return lambda: obstacle.draw(screen)
+
+        def setup_check_collision(resolution: tuple[int, int], dt: float, class_name: str = class_name) -> Callable[[], Any]:
+            player = create_player(resolution, dt)
+            obstacle = create_obstacles(resolution, player)[class_name]
+            obstacle.set_y(player.get_center()[1] - player.get_distance() - player.get_radius() - 1) # Near miss, all the circles are tested
+            return lambda: obstacle.check_collision(player)
+
+        cases.append(BenchmarkCase(f"{class_name}.update", setup_update))
+        cases.append(BenchmarkCase(f"{class_name}.draw", setup_draw))
+        cases.append(BenchmarkCase(f"{class_name}.check_collision", setup_check_collision, uses_dt=False))
+
+    cases.append(BenchmarkCase("RotatingObstacle.update+draw (stained)", setup_stained_rotating_obstacle))
+
+    return cases
+
+def setup_stained_rotating_obstacle(resolution: tuple[int, int], dt: float) -> Callable[[], Any]:
+    """Updates and draws a rotating obstacle with a stain of each Player's circle, kept next to the Player."""
+    player = create_player(resolution, dt)
+    obstacle = create_obstacles(resolution, player)["RotatingObstacle"]
+    obstacle.set_y(player.get_center()[1])
+    for i in range(player.get_amount()):
+        obstacle.register_collision(i, ((i - 0.5) * obstacle._width / 2, 0), player)
+
+    screen = pg.Surface(resolution)
+
+    def call() -> None:
+        obstacle.update(dt)
+        obstacle.set_y(player.get_center()[1])
+        obstacle.draw(screen)
+
+    return call
+
+def setup_player_update(resolution: tuple[int, int], dt: float) -> Callable[[], Any]:
+    player = create_player(resolution, dt)
+    return lambda: player.update(dt)
+
+def setup_player_draw(resolution: tuple[int, int], dt: float) -> Callable[[], Any]:
+    player = create_player(resolution, dt)
+    screen = pg.Surface(resolution)
+    return lambda: player.draw(screen)
+
+def setup_particles_update(resolution: tuple[int, int], dt: float) -> Callable[[], Any]:
+    """Updates the lost particles of a Player's circle, creating new ones when they disappear (after 0.5 seconds)."""
+    from entities import ParticleManager
+
+    player = create_player(resolution, dt)
+    particles = [None]
+
+    def call() -> None:
+        if particles[0] == None or not particles[0]._particles:
+            particles[0] = ParticleManager(player.get_positions()[0], 20, 400, player.get_radius() / 10, (255, 30, 30), resolution)
+        particles[0].update(dt)
+
+    return call
+
+def setup_particles_draw(resolution: tuple[int, int], dt: float) -> Callable[[], Any]:
+    from entities import ParticleManager
+
+    player = create_player(resolution, dt)
+    particles = ParticleManager(player.get_positions()[0], 20, 400, player.get_radius() / 10, (255, 30, 30), resolution)
+    particles.update(0.1)
+    screen = pg.Surface(resolution)
+    return lambda: particles.draw(screen)
+
+def setup_generate_stain(resolution: tuple[int, int], dt: float) -> Callable[[], Any]:
+    """Paints the stain of a Player's circle in an obstacle's stain surface (the size of the biggest obstacles)."""
+    from entities import generate_stain
+    from scripts import OBSTACLES_HEIGHT, scale_dimension
+
+    surface = pg.Surface((scale_dimension(200, resolution), scale_dimension(OBSTACLES_HEIGHT, resolution)), pg.SRCALPHA)
+    radius = scale_dimension(20, resolution)
+    return lambda: generate_stain(surface, (surface.width // 2, 0), radius, (255, 30, 30), radius * 1.5)
+
+def setup_stain_layer_paint(resolution: tuple[int, int], dt: float) -> Callable[[], Any]:
+    """Paints a stain in an obstacle's stain layer (like 'generate_stain' followed by the old rescale), cleared when full."""
+    from entities import StainLayer
+    from scripts import OBSTACLES_HEIGHT, scale_dimension
+
+    base_size = (200, OBSTACLES_HEIGHT)
+    layer = [StainLayer(base_size)]
+    layer[0].resize((scale_dimension(base_size[0], resolution), scale_dimension(base_size[1], resolution)))
+    stains = [0]
+
+    def call() -> None:
+        stains[0] += 1
+        if stains[0] % 20 == 0:
+            layer[0].reset_from(layer[0])
+        layer[0].paint((stains[0] * 37 % base_size[0], 0), 20, (255, 30, 30))
+
+    return call
+
+def get_background_cases() -> list[BenchmarkCase]:
+    from scripts import COLORS
+
+    def setup_checkered(resolution: tuple[int, int], dt: float) -> Callable[[], Any]:
+        from entities import Checkered
+
+        background = Checkered(resolution, 15, COLORS["GRAY"], COLORS["BLACK"], 1.0, 30)
+        screen = pg.Surface(resolution)
+        return lambda: (background.update(dt), background.draw(screen))
+
+    def setup_lines(resolution: tuple[int, int], dt: float) -> Callable[[], Any]:
+        from entities import Lines
+
+        background = Lines(15, resolution, 1.0, COLORS["GRAY"], COLORS["BLACK"])
+        screen = pg.Surface(resolution)
+        return lambda: (background.update(dt), background.draw(screen))
+
+    def setup_random_background(resolution: tuple[int, int], dt: float) -> Callable[[], Any]:
+        """Gets a new random background, like every window does when it's opened."""
+        from entities import BackgroundGetter
+
+        return lambda: BackgroundGetter.random_background(resolution)
+
+    return [
+        BenchmarkCase("Checkered.update+draw", setup_checkered, uses_dt=False),
+        BenchmarkCase("Lines.update+draw", setup_lines, uses_dt=False),
+        BenchmarkCase("BackgroundGetter.random_background", setup_random_background, uses_dt=False)
+    ]
+
+def setup_score_text(resolution: tuple[int, int], dt: float) -> Callable[[], Any]:
+    """Sets a new score in every call, like the random mode does in every frame."""
+    from entities import ScoreText
+    from scripts import get_font
+
+    score_text = ScoreText(0, (60, 60, 60), (255, 255, 255), get_font(), 20, (10, 55), "topleft", 10)
+    score_text.resize(resolution)
+    score = [0]
+
+    def call() -> None:
+        score[0] += 1
+        score_text.set_score(score[0])
+
+    return call
+
+def setup_fps_text(resolution: tuple[int, int], dt: float) -> Callable[[], Any]:
+    """Sets a new FPS text in every call, like the FPS counter does when its value changes."""
+    from entities import Text
+    from scripts import get_font
+
+    text = Text("FPS: 0.0", get_font(), (100, 100, 100), (10, 10), "topleft", 15)
+    text.resize(resolution)
+    fps = [0]
+
+    def call() -> None:
+        fps[0] = (fps[0] + 7) % 1000
+        text.set_text(f"FPS: {fps[0] / 10:.1f}")
+
+    return call
+
+def setup_achievements_grid(resolution: tuple[int, int], dt: float) -> Callable[[], Any]:
+    """A full rebuild: the layout again and the first frame (rendering the visible cards)."""
+    from entities import AchievementsGrid
+
+    grid = AchievementsGrid(resolution, (255, 255, 255), (120, 120, 120), (30, 30, 30), 20, 1.5, 10)
+    screen = pg.Surface(resolution)
+
+    def call() -> None:
+        grid.resize(resolution)
+        grid.draw(screen)
+    return call
+
+def setup_achievements_scroll(resolution: tuple[int, int], dt: float) -> Callable[[], Any]:
+    """A mouse wheel tick (the event and the frame), going down and up (see 'benchmarks.achievements_scroll' for more achievements)."""
+    from entities import AchievementsGrid
+
+    grid = AchievementsGrid(resolution, (255, 255, 255), (120, 120, 120), (30, 30, 30), 20, 1.5, 10)
+    grid.resize(resolution)
+    screen = pg.Surface(resolution)
+    ticks = [ pg.event.Event(pg.MOUSEWHEEL, x=0, y=1 if i < 10 else -1) for i in range(20) ]
+    tick_index = 0
+
+    def call() -> None:
+        nonlocal tick_index
+        grid.update_by_event(ticks[tick_index])
+        grid.draw(screen)
+        tick_index = (tick_index + 1) % len(ticks)
+    return call
+
+def setup_levels_scroll(resolution: tuple[int, int], dt: float) -> Callable[[], Any]:
+    """A mouse wheel tick (the event and the frame) over the level select, going down and up (see 'benchmarks.levels_scroll' for more levels)."""
+    from entities import LevelsOrganizer, InputHandler, ScriptedInput
+    from scripts import get_font
+
+    organizer = LevelsOrganizer(400, (600, 0), 75, 3, lambda level: (lambda: None), get_font(), 60)
+    organizer.resize(resolution)
+    screen = pg.Surface(resolution)
+    mouse_over_grid = ScriptedInput(mouse_pos=(resolution[0] * 3 // 4, resolution[1] // 2)) # The wheel only scrolls with the mouse over the grid
+    ticks = [ pg.event.Event(pg.MOUSEWHEEL, x=0, y=-1 if i < 10 else 1) for i in range(20) ]
+    tick_index = 0
+
+    def call() -> None:
+        nonlocal tick_index
+        InputHandler.set_scripted_input(mouse_over_grid) # Only during the call, the next cases read the real mouse
+        try:
+            organizer.update_by_event(ticks[tick_index])
+            organizer.draw(screen)
+        finally:
+            InputHandler.set_scripted_input(None)
+        tick_index = (tick_index + 1) % len(ticks)
+    return call
+
+def get_cases() -> list[BenchmarkCase]:
+    return [
+        BenchmarkCase("Player.update", setup_player_update),
+        BenchmarkCase("Player.draw", setup_player_draw),
+        *get_obstacle_cases(),
+        BenchmarkCase("ParticleManager.update", setup_particles_update),
+        BenchmarkCase("ParticleManager.draw", setup_particles_draw, uses_dt=False),
+        BenchmarkCase("generate_stain", setup_generate_stain, uses_dt=False),
+        BenchmarkCase("StainLayer.paint", setup_stain_layer_paint, uses_dt=False),
+        *get_background_cases(),
+        BenchmarkCase("ScoreText.set_score", setup_score_text, uses_dt=False),
+        BenchmarkCase("Text.set_text", setup_fps_text, uses_dt=False),
+        BenchmarkCase("AchievementsGrid.resize+draw", setup_achievements_grid, uses_dt=False, max_calls=30),
+        BenchmarkCase("AchievementsGrid scroll tick", setup_achievements_scroll, uses_dt=False),
+        BenchmarkCase("LevelsOrganizer scroll tick", setup_levels_scroll, uses_dt=False)
+    ]
+
+def get_metadata(calls: int) -> dict[str, Any]:
+    """Returns where the results came from: the commit (when in a git repository), the versions and the settings."""
+    try:
+        commit = run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, stdin=DEVNULL).stdout.strip() or None
+    except OSError:
+        commit = None
+
+    return {
+        "commit" : commit,
+        "date" : datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python" : platform.python_version(),
+        "pygame" : pg.version.ver,
+        "machine" : platform.machine(),
+        "calls" : calls
+    }
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark suite of the game's per-frame hot paths.")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file of the results")
+    parser.add_argument("--compare", metavar="OLD_RESULTS", help="JSON file of older results to compare with")
+    parser.add_argument("--threshold", type=float, default=0.1, help="p50 change marked as a regression (default: 0.1, 10%%)")
+    parser.add_argument("--calls", type=int, default=CALLS, help="measured calls of each case")
+    parser.add_argument("--filter", default="", help="only the cases with this text in the name")
+    parser.add_argument("--quick", action="store_true", help="only the base resolution and 60 FPS")
+    args = parser.parse_args()
+
+    pg.init()
+    pg.display.set_mode((800, 600))
+    seed(0)
+
+    resolutions = RESOLUTIONS[:1] if args.quick else RESOLUTIONS
+    framerates = FRAMERATES[:1] if args.quick else FRAMERATES
+    cases = [ case for case in get_cases() if args.filter in case.name ]
+
+    print(f"{len(cases)} cases, {len(resolutions)} resolutions, {len(framerates)} framerates, {args.calls} calls:")
+    results = run_cases(cases, resolutions, framerates, args.calls)
+    save_results(args.output, get_metadata(args.calls), results)
+    print(f"Results saved in {args.output}")
+
+    if args.compare:
+        print(f"\nCompared with {args.compare}:")
+        for line in compare_results(load_results(args.compare), load_results(args.output), args.threshold):
+            print(line)
+
+    pg.quit()
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,6 @@ from .backgrounds import *
 from .eventhandler import *
 from .buttons import *
 from .obstacles import *
-from .obstaclesmanager import *
 from .player import *
 from .text import *
 from .limiter import *
@@ -13,3 +12,39 @@ from .lines import *
 from .achievements import *
 from .perfection_levels import *
 from .mousehandler import *
+from .trail import *
+from .sprites import *
+from .assets import *
+from .audio import *
+from .save import *
+from .levelpack import *
+from .render import *
+from .inputhandler import *
+from .profiler import *
+
+from importlib import import_module
+
+# Not needed by the first frame (the main menu), they're imported on the first use ('from entities import X' inside the windows)
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "AchievementsGrid" : ".achievements",
+    "LevelsOrganizer" : ".organizer",
+    "BaseObstaclesManager" : ".obstaclesmanager",
+    "RandomObstaclesManager" : ".obstaclesmanager",
+    "LevelObstaclesManager" : ".obstaclesmanager",
+    "Gameplay" : ".simulation",
+    "Simulation" : ".simulation",
+    "validate_level" : ".simulation",
+    "validate_levels" : ".simulation",
+    "Replay" : ".replay",
+    "ReplayRecorder" : ".replay",
+    "ReplayPlayer" : ".replay",
+    "ReplayLibrary" : ".replay"
+}
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = globals()[name] = getattr(import_module(module_name, __name__), name)
+    return value
@@ -1,3 +1,9 @@
 from .achievements_handler import *
-from .achievements_grid import *
 from .achievements_drawer import *
+
+def __getattr__(name: str):
+    if name == "AchievementsGrid": # Only the achievements' window uses it, so it's imported on the first use
+        from .achievements_grid import AchievementsGrid
+        return AchievementsGrid
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,14 @@
 import pygame as pg
 import pygame.freetype as pgft
-from scripts import ACHIEVEMENTS, get_file_path, scale_dimension
+from scripts import get_achievements, scale_dimension
 from ..eventhandler import CustomEventList
-from os.path import isfile
+from ..text import TextRenderer
+from ..assets import AssetManager
 
 class AchievementsDrawer:
     def __init__(self, size: tuple[int, int], font: pgft.Font, warn_size: int, title_size: int, gap: int, fgcolor: tuple[int, int, int], bgcolor: tuple[int, int, int]) -> None:
         self._size = size
-        self._achievements = ACHIEVEMENTS
+        self._achievements = get_achievements()
         self._font = font
         self._font_sizes = ( warn_size, title_size )
         self._gap = gap
@@ -53,17 +54,17 @@ class AchievementsDrawer:
     def _create_surface(self) -> None:
         if self._current_id == None: return
         
-        warn_surf, warn_rect = self._font.render("Conquista Desbloqueada!", self._colors[0], size=self._font_sizes[0])
-        title_surf, title_rect = self._font.render(self._achievements[self._current_id]["title"], self._colors[0], size=self._font_sizes[1])
+        warn_surf, warn_rect = TextRenderer.render(self._font, "Conquista Desbloqueada!", self._colors[0], self._font_sizes[0])
+        title_surf, title_rect = TextRenderer.render(self._font, self._achievements[self._current_id]["title"], self._colors[0], self._font_sizes[1])
         img_size = warn_surf.height + title_surf.height + self._gap
 
         self._current_surface = pg.Surface((max(warn_surf.width, title_surf.width) + img_size + self._gap * 3, img_size + self._gap * 2), pg.SRCALPHA)
         self._current_surface.fill((0, 0, 0, 0))
         pg.draw.rect(self._current_surface, self._colors[1], self._current_surface.get_rect(topleft=(0, 0)), border_radius=img_size//10)
         
-        if isfile(get_file_path(f"../images/achievements/achiev{self._current_id}.svg")): # Check if the achievement's image exist.
-            achiev_img = pg.image.load(get_file_path(f"../images/achievements/achiev{self._current_id}.svg")).convert_alpha()
-            achiev_img = pg.transform.scale(achiev_img, ( # Scale achievement's image to be inside the "img_rect".
+        if AssetManager.exists(f"achievements/achiev{self._current_id}.svg"): # Check if the achievement's image exist.
+            achiev_img = AssetManager.get_image(f"achievements/achiev{self._current_id}.svg")
+            achiev_img = AssetManager.get_scaled(f"achievements/achiev{self._current_id}.svg", ( # Scale achievement's image to be inside the "img_rect".
                 round(achiev_img.width * img_size / max(achiev_img.size)),
                 round(achiev_img.height * img_size / max(achiev_img.size))
             ))
@@ -1,55 +1,92 @@
 import pygame as pg
 import pygame.freetype as pgft
+from ..eventhandler import CustomEventList
 from ..lines import GradientLine
-from scripts import ACHIEVEMENTS, ACHIEVEMENTS_UNLOCKED, FONT, get_file_path, scale_dimension
-from os.path import isfile
+from ..render import DirtyTracker
+from ..text import TextRenderer
+from ..assets import AssetManager
+from scripts import get_achievements, get_achievements_unlocked, get_font, scale_dimension
+from bisect import bisect_left, bisect_right
 
 class AchievementsGrid:
-    def __init__(self, screen_size: tuple[int, int], base_color: tuple[int, int, int], locked_color: tuple[int, int, int], bgcolor: tuple[int, int, int], font_size: int, title_font_size_mult: float, gap: int, font: pgft.Font = FONT) -> None:
-        self._achievements = ACHIEVEMENTS
-        self._achievements_unlocked = ACHIEVEMENTS_UNLOCKED
+    """The achievements' cards in two columns, scrolled by the mouse wheel.
+
+        The grid is virtualized: each card is rendered once (when it first enters the view) and kept, and drawing just blits
+        the cards inside the screen at the scroll offset (found by bisecting the columns), so scrolling doesn't render anything
+        and the cost doesn't grow with the amount of achievements. The cards are laid out in order, as far as the view needs.
+    """
+    def __init__(self, screen_size: tuple[int, int], base_color: tuple[int, int, int], locked_color: tuple[int, int, int], bgcolor: tuple[int, int, int], font_size: int, title_font_size_mult: float, gap: int, font: pgft.Font | None = None, achievements: dict[str, dict[str, str | bool | int]] | None = None, achievements_unlocked: dict[str, bool] | None = None) -> None:
+        self._achievements = achievements if achievements != None else get_achievements()
+        self._achievements_unlocked = achievements_unlocked if achievements_unlocked != None else get_achievements_unlocked()
         self._size = screen_size
         self._base_color = base_color
         self._locked_color = locked_color
         self._bgcolor = bgcolor
         self._gap = gap
-        self._font = font
+        self._font = font if font != None else get_font()
         self._font_sizes = [ font_size, font_size * title_font_size_mult ]
         self._mouse_wheel_speed = 10
         self._y_shiftness = 0
-        self._max_y_shiftness = 0
-        self._lock_img = pg.image.load(get_file_path("../images/lock.svg"))
-        self._surface = self._create_surface()
+        self._lock_img = AssetManager.get_image("lock.svg")
+        self._dirty_tracker = DirtyTracker()
+        self._create_layout()
 
         self._save_values = [ self._gap, self._font_sizes.copy(), self._mouse_wheel_speed ]
 
-    def _create_surface(self) -> pg.Surface:
-        surf = pg.Surface(self._size) # Change this
-
+    def _create_layout(self) -> None:
+        """Forgets the rendered cards and renders the middle line, the cards are rendered again when drawn."""
+        layer = pg.Surface(self._size)
         line = GradientLine([(0, 0, 0), self._base_color, (0, 0, 0)], (self._size[0] // 2, 0), (self._size[0] // 2, self._size[1]), self._gap // 2)
-        line.draw(surf)
-        surf.set_colorkey((0, 0, 0))
-
-        max_width_achievement = round(self._size[0] / 2 - 2 * self._gap - self._gap / 2)
-        amount_achievements = len(self._achievements)
-        actual_heights = [ self._gap - self._y_shiftness, self._gap - self._y_shiftness ]
-
-        for i in range(amount_achievements):
-            x = self._gap if i % 2 == 0 else round(self._size[0] / 2 + self._gap + self._gap / 2)
-            achievement_surf = self._draw_achievement_surface(max_width_achievement, i+1)
-            surf.blit(achievement_surf, (x, actual_heights[i % 2]))
-            actual_heights[i % 2] += achievement_surf.height + self._gap
-        
-        self._max_y_shiftness = max(actual_heights)
+        line.draw(layer)
+        line_rect = line.get_rect().clip(layer.get_rect())
+        self._line_surface = layer.subsurface(line_rect).copy()
+        self._line_surface.set_colorkey((0, 0, 0), pg.RLEACCEL) # The black pixels (the line's ends and the cards' corners) are transparent
+        self._line_pos = line_rect.topleft
+
+        self._card_width = round(self._size[0] / 2 - 2 * self._gap - self._gap / 2)
+        self._columns_x = (self._gap, round(self._size[0] / 2 + self._gap + self._gap / 2))
+        self._columns_cards: tuple[list[pg.Surface], list[pg.Surface]] = ([], []) # Rendered cards of each column, in order
+        self._columns_tops: tuple[list[int], list[int]] = ([], []) # Without the scroll
+        self._columns_bottoms: tuple[list[int], list[int]] = ([], [])
+        self._columns_next_top = [self._gap, self._gap]
+        self._amount_laid_out = 0
+
+        self._dirty_tracker.mark()
+
+    def _lay_out_until(self, y: int) -> None:
+        """Renders the next cards (in order, each one goes below the last one of its column) until both columns pass 'y'."""
+        while self._amount_laid_out < len(self._achievements) and min(self._columns_next_top) <= y:
+            column = self._amount_laid_out % 2
+            card = self._draw_achievement_surface(self._card_width, self._amount_laid_out + 1)
+            card.set_colorkey((0, 0, 0), pg.RLEACCEL) # Static, so the run-length encoded blits are faster
+            top = self._columns_next_top[column]
+
+            self._columns_cards[column].append(card)
+            self._columns_tops[column].append(top)
+            self._columns_bottoms[column].append(top + card.height)
+            self._columns_next_top[column] = top + card.height + self._gap
+            self._amount_laid_out += 1
 
-        return surf
-    
     def draw(self, screen: pg.Surface) -> None:
-        screen.blit(self._surface)
+        self._lay_out_until(self._y_shiftness + self._size[1])
+        blits = [(self._line_surface, self._line_pos)]
+
+        for column in range(2):
+            tops = self._columns_tops[column]
+            first = bisect_right(self._columns_bottoms[column], self._y_shiftness) # First card ending below the screen's top
+            last = bisect_left(tops, self._y_shiftness + self._size[1]) # First card starting after the screen's bottom
+            x = self._columns_x[column]
+            blits += [ (self._columns_cards[column][i], (x, tops[i] - self._y_shiftness)) for i in range(first, last) ]
+
+        screen.fblits(blits)
     
+    def get_dirty_rects(self) -> list[pg.Rect]: return self._dirty_tracker.collect(pg.Rect((0, 0), self._size))
+
     def update_by_event(self, event: pg.Event) -> None:
         if event.type == pg.MOUSEWHEEL:
             self._moving_y(event.y)
+        elif event.type == CustomEventList.ACHIEVEMENTUNLOCKED:
+            self._create_layout() # The card (and the ones below it) changed
 
     def resize(self, new_resolution: tuple[int, int]) -> None:
         self._y_shiftness = 0
@@ -57,12 +94,14 @@ class AchievementsGrid:
         self._gap = scale_dimension(self._save_values[0], new_resolution)
         self._font_sizes = [ scale_dimension(i, new_resolution) for i in self._save_values[1] ]
         self._mouse_wheel_speed = scale_dimension(self._save_values[2], new_resolution)
-        self._surface = self._create_surface()
+        self._create_layout()
 
     def _moving_y(self, mouse_wheel_value: int) -> None:
-        """Moves the surface in the 'y' direction in relation to the mouse wheel button (UP or DOWN)."""
+        """Moves the cards in the 'y' direction in relation to the mouse wheel button (UP or DOWN)."""
         if mouse_wheel_value < 0 and self._y_shiftness <= 0: return
-        if mouse_wheel_value > 0 and self._y_shiftness >= self._max_y_shiftness: return
+        if mouse_wheel_value > 0:
+            self._lay_out_until(2 * self._y_shiftness) # Enough cards to compare with the bottom, see '_get_max_y_shiftness'
+            if self._y_shiftness >= self._get_max_y_shiftness(): return
         
         shiftness = abs(self._mouse_wheel_speed * mouse_wheel_value)
 
@@ -70,8 +109,11 @@ class AchievementsGrid:
             shiftness *= -1
 
         self._y_shiftness = self._y_shiftness + shiftness
+        self._dirty_tracker.mark()
 
-        self._surface = self._create_surface()
+    def _get_max_y_shiftness(self) -> int:
+        """The scroll stops when it's farther than the distance from the screen's top to the bottom of the cards."""
+        return max(self._columns_next_top) - self._y_shiftness
 
     def _draw_achievement_surface(self, max_width: int, achievement_id: int) -> pg.Surface:
         if self._gap * 3 >= max_width: raise ValueError("Achievements Grid Draw Individual Achievement Surface : Gap too big or Max Width too low.")
@@ -98,11 +140,11 @@ class AchievementsGrid:
         pg.draw.rect(surf, self._locked_color, img_rect, border_radius=(self._gap // 5))
         
         if not is_unlocked:
-            lock_img = pg.transform.scale(self._lock_img, (round(self._lock_img.width * (img_size * 0.9) / self._lock_img.height), round(img_size * 0.9)))
+            lock_img = AssetManager.get_scaled("lock.svg", (round(self._lock_img.width * (img_size * 0.9) / self._lock_img.height), round(img_size * 0.9)))
             surf.blit(lock_img, lock_img.get_rect(center=img_rect.center))
-        elif isfile(get_file_path(f"../images/achievements/achiev{achievement_id}.svg")): # Check if the achievement's image exist.
-            achiev_img = pg.image.load(get_file_path(f"../images/achievements/achiev{achievement_id}.svg")).convert_alpha()
-            achiev_img = pg.transform.scale(achiev_img, ( # Scale achievement's image to be inside the "img_rect".
+        elif AssetManager.exists(f"achievements/achiev{achievement_id}.svg"): # Check if the achievement's image exist.
+            achiev_img = AssetManager.get_image(f"achievements/achiev{achievement_id}.svg")
+            achiev_img = AssetManager.get_scaled(f"achievements/achiev{achievement_id}.svg", ( # Scale achievement's image to be inside the "img_rect".
                 round(achiev_img.width * img_size * 0.8 / max(achiev_img.size)),
                 round(achiev_img.height * img_size * 0.8 / max(achiev_img.size))
             ))
@@ -119,7 +161,7 @@ class AchievementsGrid:
         if font.get_rect("---", size=size).width > max_width: raise ValueError("Max Width too Low for the font size.")
         
         if font.get_rect(text, size=size).width <= max_width:
-            text_surf, text_rect = font.render(text, fgcolor, size=size)
+            text_surf, text_rect = TextRenderer.render(font, text, fgcolor, size)
             text_rect.topleft = (0, 0)
 
             surf = pg.Surface(text_surf.size, pg.SRCALPHA)
@@ -156,7 +198,7 @@ class AchievementsGrid:
                         actual_word -= 1
                         actual_text = " ".join(actual_text.split(" ")[:-1])
                 
-                text_surf, text_rect = font.render(actual_text, fgcolor, size=size)
+                text_surf, text_rect = TextRenderer.render(font, actual_text, fgcolor, size)
                 text_rect.topleft = (0, 0)
                 surf_group.append((text_surf, text_rect))
                 actual_height += text_surf.height + vertical_gap
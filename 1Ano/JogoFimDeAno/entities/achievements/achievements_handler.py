@@ -1,18 +1,26 @@
 from ..eventhandler import CustomEventHandler, CustomEventList
-from scripts import get_file_path, ACHIEVEMENTS_UNLOCKED
-from json import dump as json_dump
+from ..save import SaveStore
+from scripts import get_file_path, get_achievements_unlocked
 
 class AchievementsHandler:
     """Class with methods to handle the achievement's logic."""
-    @staticmethod
-    def unlock_achievement(achievement_id: int) -> None:
-        """Unlock and edit the json file keeping the player achievements progress."""
-        if ACHIEVEMENTS_UNLOCKED.get(str(achievement_id)) == None: # Achievement doesn't exist
+    _save_progress = True
+
+    @classmethod
+    def unlock_achievement(self, achievement_id: int) -> None:
+        """Unlock and save (in the background, see 'SaveStore') the json file keeping the player achievements progress."""
+        achievements_unlocked = get_achievements_unlocked()
+        if achievements_unlocked.get(str(achievement_id)) == None: # Achievement doesn't exist
             raise IndexError(f"AchievementsHandler: Unknown Achievement ID: {achievement_id}")
-        elif ACHIEVEMENTS_UNLOCKED[str(achievement_id)]: return # Achievement already unlocked
+        elif achievements_unlocked[str(achievement_id)]: return # Achievement already unlocked
 
-        ACHIEVEMENTS_UNLOCKED[str(achievement_id)] = True
-        with open(get_file_path("../data/player_achievements_unlocked.json"), "w", encoding="utf-8") as file: # Modern way to write a file.
-            json_dump(ACHIEVEMENTS_UNLOCKED, file, ensure_ascii=False, indent=4)
+        achievements_unlocked[str(achievement_id)] = True
+        if self._save_progress:
+            SaveStore.save(get_file_path("../data/player_achievements_unlocked.json"), achievements_unlocked)
         
         CustomEventHandler.post_event(CustomEventList.ACHIEVEMENTUNLOCKED, { "id" : str(achievement_id) })
+
+    @classmethod
+    def set_save_progress(self, save: bool) -> None:
+        """Enables or disables writing the unlocked achievements to the json file (disabled by the headless simulations)."""
+        self._save_progress = save
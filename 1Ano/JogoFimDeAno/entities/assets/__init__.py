@@ -0,0 +1 @@
+from .asset_manager import AssetManager
@@ -0,0 +1,130 @@
+import pygame as pg
+from scripts import get_file_path
+from collections import OrderedDict
+from io import BytesIO
+from os import walk
+from os.path import isfile, join, relpath
+from threading import Lock, Thread
+
+class AssetManager:
+    """Loads each image of the game (by its path inside the "images" folder, like "achievements/achiev1.svg") only once.
+
+        The loaded images are kept converted ('convert_alpha'), and their scaled variants are kept in a LRU keyed by (image, size).
+        The SVGs are rasterized straight at the asked size (sharper than scaling a big raster). 'preload' reads and decodes all the
+        images in a background thread, the conversion (that needs the display) is done in the main thread when first used.
+    """
+    _files: dict[str, bytes] = {} # Contents of the files, the SVGs are rasterized again for each size
+    _decoded: dict[str, pg.Surface] = {} # Decoded by the preload, not converted yet
+    _images: dict[str, pg.Surface] = {}
+    _scaled: OrderedDict[tuple[str, tuple[int, int]], pg.Surface] = OrderedDict()
+    _max_scaled = 128
+    _exists: dict[str, bool] = {}
+    _lock = Lock()
+    _preload_thread: Thread | None = None
+
+    @classmethod
+    def get_image(self, name: str) -> pg.Surface:
+        """Returns the image in its original size (mustn't be changed, it's shared)."""
+        image = self._images.get(name)
+
+        if image is None:
+            with self._lock:
+                image = self._decoded.pop(name, None)
+            if image is None:
+                image = self._decode(name, self._read(name))
+            image = self._images[name] = self._convert(image)
+
+        return image
+
+    @classmethod
+    def get_scaled(self, name: str, size: tuple[float, float]) -> pg.Surface:
+        """Returns the image scaled to 'size' (mustn't be changed, it's shared)."""
+        size = (max(1, round(size[0])), max(1, round(size[1])))
+        key = (name, size)
+        scaled = self._scaled.get(key)
+
+        if scaled is None:
+            scaled = self._scaled[key] = self._render_scaled(name, size)
+            if len(self._scaled) > self._max_scaled:
+                self._scaled.popitem(last=False)
+        else:
+            self._scaled.move_to_end(key)
+
+        return scaled
+
+    @classmethod
+    def exists(self, name: str) -> bool:
+        """Returns if the image exists, checking the disk only the first time."""
+        exists = self._exists.get(name)
+        if exists is None:
+            exists = self._exists[name] = name in self._files or isfile(self._get_path(name))
+        return exists
+
+    @classmethod
+    def preload(self) -> Thread:
+        """Starts reading and decoding all the images in a background thread (the images asked before it finishes are loaded as usual)."""
+        if self._preload_thread is None:
+            self._preload_thread = Thread(target=self._preload_all, name="AssetManagerPreload", daemon=True)
+            self._preload_thread.start()
+        return self._preload_thread
+
+    @classmethod
+    def wait_preload(self, timeout: float | None = None) -> None:
+        if self._preload_thread != None:
+            self._preload_thread.join(timeout)
+
+    @classmethod
+    def clear(self) -> None:
+        """Forgets the converted and scaled images (the files' contents are kept)."""
+        self._images.clear()
+        self._scaled.clear()
+
+    @classmethod
+    def _preload_all(self) -> None:
+        folder = get_file_path("../images")
+
+        for directory, _, files in walk(folder):
+            for file in files:
+                name = relpath(join(directory, file), folder).replace("\\", "/")
+                try:
+                    image = self._decode(name, self._read(name))
+                except (OSError, pg.error):
+                    continue # Not an image, or it'll fail again (with the error) when used
+
+                with self._lock:
+                    if name not in self._images:
+                        self._decoded[name] = image
+                self._exists[name] = True
+
+    @classmethod
+    def _render_scaled(self, name: str, size: tuple[int, int]) -> pg.Surface:
+        if name.endswith(".svg") and hasattr(pg.image, "load_sized_svg"): # pygame-ce 2.4+
+            scaled = self._convert(pg.image.load_sized_svg(BytesIO(self._read(name)), size))
+            if scaled.get_size() != size: # The SVG keeps its aspect ratio, the size is fixed by just a few pixels
+                scaled = pg.transform.smoothscale(scaled, size)
+            return scaled
+
+        return pg.transform.scale(self.get_image(name), size)
+
+    @classmethod
+    def _read(self, name: str) -> bytes:
+        data = self._files.get(name)
+
+        if data is None:
+            with open(self._get_path(name), "rb") as file:
+                data = file.read()
+            with self._lock:
+                self._files[name] = data
+
+        return data
+
+    @staticmethod
+    def _decode(name: str, data: bytes) -> pg.Surface:
+        return pg.image.load(BytesIO(data), name) # The name tells the file's type
+
+    @staticmethod
+    def _convert(image: pg.Surface) -> pg.Surface:
+        return image.convert_alpha() if pg.display.get_surface() != None else image # Converting needs the display
+
+    @staticmethod
+    def _get_path(name: str) -> str: return get_file_path(f"../images/{name}")
@@ -0,0 +1 @@
+from .music_scheduler import MusicScheduler
@@ -0,0 +1,124 @@
+import pygame as pg
+from ..eventhandler import CustomEventHandler, CustomEventList
+from scripts import get_file_path
+from io import BytesIO
+from os import listdir
+from os.path import isdir
+from random import shuffle
+from threading import Thread
+
+class MusicScheduler:
+    """Plays the background musics one after another, driven by events instead of checking the mixer every frame.
+
+        The next music is read in a background thread while the current one plays ('MUSICLOADED' when it's ready) and
+        queued in the mixer ('pg.mixer.music.queue'), so the change of music doesn't load a file in the game loop.
+        The mixer posts 'MUSICENDED' when a music ends (and the queued one starts), then the following one is read.
+        The musics are picked from a shuffle bag: all of them play once before any repeats, and never twice in a row.
+    """
+    _folder = "../audio/backgroundmusics"
+    _loops = 1 # Each music plays twice
+    _fade_ms = 500
+    _tracks: list[str] | None = None
+    _bag: list[str] = []
+    _last_track: str | None = None
+    _next_track: tuple[str, bytes] | None = None # Read by the thread, waiting to be played or queued
+    _loader: Thread | None = None
+    _failed_tracks = 0 # In a row, it stops trying after all of them failed
+    _volume = 1.0 # Kept until the mixer starts
+    _started = False
+
+    @classmethod
+    def start(self) -> None:
+        """Starts the mixer (the slowest module to initialize, so only when the musics start) and reads the first music."""
+        if self._started: return
+        self._started = True
+
+        if not self._get_tracks(): return
+
+        if not pg.mixer.get_init():
+            pg.mixer.init()
+        pg.mixer.music.set_volume(self._volume)
+        pg.mixer.music.set_endevent(CustomEventList.MUSICENDED)
+        self._load_next()
+
+    @classmethod
+    def update_by_event(self, event: pg.event.Event) -> None:
+        if event.type == CustomEventList.MUSICLOADED:
+            self._play_loaded()
+        elif event.type == CustomEventList.MUSICENDED:
+            self._load_next() # The queued music is playing now
+
+    @classmethod
+    def get_volume(self) -> float:
+        return pg.mixer.music.get_volume() if pg.mixer.get_init() else self._volume
+
+    @classmethod
+    def set_volume(self, volume: float) -> None:
+        self._volume = volume
+        if pg.mixer.get_init():
+            pg.mixer.music.set_volume(volume)
+
+    @classmethod
+    def _play_loaded(self) -> None:
+        """Plays the music read by the thread if nothing is playing (the first one, or after a failed one), or queues it."""
+        if self._next_track is None: return
+
+        name, data = self._next_track
+        self._next_track = None
+
+        try:
+            if pg.mixer.music.get_busy():
+                pg.mixer.music.queue(BytesIO(data), name, self._loops)
+            else:
+                pg.mixer.music.load(BytesIO(data), name)
+                pg.mixer.music.play(self._loops, 0, self._fade_ms)
+                self._load_next()
+            self._failed_tracks = 0
+        except pg.error: # Not a valid music, tries the next one
+            self._failed_tracks += 1
+            if self._failed_tracks < len(self._get_tracks()):
+                self._load_next()
+
+    @classmethod
+    def _load_next(self) -> None:
+        """Reads the next music of the bag in a background thread, posting 'MUSICLOADED' when done."""
+        if self._loader != None:
+            self._loader.join() # Already done (it posted 'MUSICLOADED'), it just may not have returned yet
+
+        self._loader = Thread(target=self._read_track, args=(self._pick_track(),), name="MusicSchedulerLoader", daemon=True)
+        self._loader.start()
+
+    @classmethod
+    def _read_track(self, name: str) -> None:
+        """Reads the music in the loader thread, or the next ones of the bag if it can't (until all of them failed in a row)."""
+        while True:
+            try:
+                with open(get_file_path(f"{self._folder}/{name}"), "rb") as file:
+                    self._next_track = (name, file.read())
+                break
+            except OSError:
+                self._failed_tracks += 1
+                if self._failed_tracks >= len(self._get_tracks()): return
+                name = self._pick_track()
+
+        CustomEventHandler.post_event(CustomEventList.MUSICLOADED)
+
+    @classmethod
+    def _pick_track(self) -> str:
+        """Takes the next music of the shuffle bag, refilling it (without starting with the last played music) when empty."""
+        if not self._bag:
+            self._bag = self._get_tracks().copy()
+            shuffle(self._bag)
+
+            if len(self._bag) > 1 and self._bag[-1] == self._last_track: # The bag is taken from its end
+                self._bag[0], self._bag[-1] = self._bag[-1], self._bag[0]
+
+        self._last_track = self._bag.pop()
+        return self._last_track
+
+    @classmethod
+    def _get_tracks(self) -> list[str]:
+        if self._tracks is None:
+            folder = get_file_path(self._folder)
+            self._tracks = sorted(listdir(folder)) if isdir(folder) else []
+        return self._tracks
@@ -1,4 +1,5 @@
+from .background_tiles import BackgroundTiles
 from .lines import Lines
 from .checkered import Checkered
-from .standard_backgrounds import get_backgrounds_list
+from .standard_backgrounds import get_backgrounds_list, get_backgrounds_factories
 from .background_getter import BackgroundGetter
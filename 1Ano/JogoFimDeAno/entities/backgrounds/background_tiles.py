@@ -0,0 +1,55 @@
+import pygame as pg
+from collections import OrderedDict
+from typing import Callable
+
+class BackgroundTiles:
+    """Cache of the repeating tiles of the backgrounds, shared by all the windows.
+
+        The tiles are keyed by (type, params, resolution), so going back to a window (or another one with the same background)
+        reuses the tile instead of rendering it again. The backgrounds draw the tile repeated over the screen ('draw_tiled').
+        A rendered period is repeated up to 'min_tile_size' in each dimension, fewer (bigger) blits are faster than many small ones.
+    """
+    _tiles: OrderedDict[tuple, pg.Surface] = OrderedDict()
+    _max_tiles = 64
+    _min_tile_size = 256
+
+    @classmethod
+    def get_tile(self, key: tuple, render: Callable[[], pg.Surface]) -> pg.Surface:
+        """Returns the tile of 'key', rendering it with 'render' when it isn't in the cache."""
+        tile = self._tiles.get(key)
+
+        if tile is None:
+            tile = self._tiles[key] = self._repeat(render())
+            if len(self._tiles) > self._max_tiles:
+                self._tiles.popitem(last=False)
+        else:
+            self._tiles.move_to_end(key)
+
+        return tile
+
+    @classmethod
+    def clear(self) -> None:
+        self._tiles.clear()
+
+    @classmethod
+    def _repeat(self, period: pg.Surface) -> pg.Surface:
+        """Returns a tile with 'period' repeated until it's at least 'min_tile_size' in each dimension."""
+        repeats = [ -(-self._min_tile_size // size) for size in period.size ] # Ceil division
+        if repeats == [1, 1]: return period
+
+        tile = pg.Surface((period.width * repeats[0], period.height * repeats[1]))
+        self.draw_tiled(tile, period, (0, 0))
+        return tile
+
+    @staticmethod
+    def draw_tiled(screen: pg.Surface, tile: pg.Surface, offset: tuple[float, float]) -> None:
+        """Fills the 'screen' with the 'tile' repeated, one of them with its topleft in 'offset'."""
+        width, height = tile.size
+        start_x = (round(offset[0]) % width or width) - width # The first tile starting on the left of (or on) the screen's edge
+        start_y = (round(offset[1]) % height or height) - height
+
+        screen.fblits([
+            (tile, (x, y))
+            for x in range(start_x, screen.width, width)
+            for y in range(start_y, screen.height, height)
+        ])
@@ -1,4 +1,5 @@
 import pygame as pg
+from .background_tiles import BackgroundTiles
 from math import cos, sin, radians
 
 class Checkered:
@@ -34,8 +35,8 @@ class Checkered:
         self._dts.y %= self._velocity.y / -2 * self._rect_size[0]
     
     def draw(self, screen: pg.Surface) -> None:
-        """Draws the Checkered Background on the 'screen'."""
-        screen.blit(self._surface, self._position)
+        """Draws the Checkered Background on the 'screen', repeating its tile from the actual position."""
+        BackgroundTiles.draw_tiled(screen, self._tile, self._position)
     
     def resize(self, new_size: tuple[int, int]) -> None:
         """Resize the Checkered Background for a new resolution 'new_size'."""
@@ -47,27 +48,17 @@ class Checkered:
         self._position.y += self._velocity.y * self._dts.y
     
     def _draw_rects(self) -> None:
-        """Create the surface and draws the checkered background on it. This surface will be move in relation to the screen to looks like that the background is moving."""
-        self._surface = pg.Surface(tuple(self._size[i] + 4 * self._rect_size[i] for i in range(2)))
-        self._surface.fill(self._bgcolor)
-        points_x = [
-            self._rect_size[0] * i for i in range(self._amount + 4)
-        ]
-        points_y = [
-            self._rect_size[1] * i for i in range(self._amount + 4)
-        ]
-        self._draw_checkered(points_x, points_y)
-    
-    def _draw_checkered(self, points_x: list[tuple[int, int]], points_y: list[tuple[int, int]]) -> None:
-        """Draws all the rects of the Checkered background on the surface."""
-        for i in range(0, len(points_x), 2):
-            for j in range(0, len(points_y), 2):
-                self._draw_rect(points_x, points_y, i, j)
+        """Gets the tile of the checkered (from the cache when another Checkered already rendered it). The tile is moved in relation to the screen to looks like that the background is moving."""
+        self._tile = BackgroundTiles.get_tile(("checkered", self._amount, tuple(self._fgcolor), tuple(self._bgcolor), tuple(self._size)), self._render_tile)
+
+    def _render_tile(self) -> pg.Surface:
+        """Draws one period of the checkered, 2 x 2 rects (rounded to whole pixels, so the tiles match)."""
+        tile_size = tuple(max(2, round(2 * rect_size)) for rect_size in self._rect_size)
+        half_size = (tile_size[0] // 2, tile_size[1] // 2)
 
-        for i in range(1, len(points_x), 2):
-            for j in range(1, len(points_y), 2):
-                self._draw_rect(points_x, points_y, i, j)
+        tile = pg.Surface(tile_size)
+        tile.fill(self._bgcolor)
+        pg.draw.rect(tile, self._fgcolor, pg.Rect((0, 0), half_size))
+        pg.draw.rect(tile, self._fgcolor, pg.Rect(half_size, (tile_size[0] - half_size[0], tile_size[1] - half_size[1])))
 
-    def _draw_rect(self, points_x: list[tuple[int, int]], points_y: list[tuple[int, int]], index_x: int, index_y: int) -> None:
-        """Draws a specific rect with the points."""
-        pg.draw.rect(self._surface, self._fgcolor, pg.Rect((points_x[index_x], points_y[index_y]), self._rect_size))
+        return tile
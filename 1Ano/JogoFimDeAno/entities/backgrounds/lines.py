@@ -1,4 +1,5 @@
 import pygame as pg
+from .background_tiles import BackgroundTiles
 
 class Lines:
     """A Diagonal Lines Background."""
@@ -20,7 +21,7 @@ class Lines:
         self._surface_x -= 2 * self._distance_between_lines
     
     def draw(self, screen: pg.Surface) -> None:
-        screen.blit(self._surface, (self._surface_x, 0))
+        BackgroundTiles.draw_tiled(screen, self._tile, (self._surface_x, 0))
 
     def resize(self, new_size: tuple[int, int]) -> None:
         self._size = new_size
@@ -30,28 +31,21 @@ class Lines:
         self._create_background()
     
     def _create_background(self) -> None:
-        self._surface = pg.Surface((self._size[0] + 2 * self._distance_between_lines, self._size[1])) # Creates a surface a bit longer than the screen draw one more line to the movement.
-        self._surface.fill(self._bgcolor)
-        # Creates points on the left and on the top of the surface equally spaced.
-        points_x = [
-            (
-                self._size[0] * i / self._amount,
-                0
-            )
-            for i in range(2 * self._amount + 2)
-        ]
-        points_y = [
-            (
-                0,
-                self._size[1] * i / self._amount
-            )
-            for i in range(2 * self._amount + 2)
-        ]
-        # Draws trapeziums with these points.
-        for i in range(0, 2 * self._amount + 2, 2):
-            pg.draw.polygon(self._surface, self._fgcolor, (
-                points_x[i], points_x[i+1], points_y[i+1], points_y[i]
+        """Gets the tile of the lines (from the cache when other Lines already rendered it), repeated horizontally by 'draw'."""
+        self._tile = BackgroundTiles.get_tile(("lines", self._amount, tuple(self._fgcolor), tuple(self._bgcolor), self._inverse_vertical, tuple(self._size)), self._render_tile)
+
+    def _render_tile(self) -> pg.Surface:
+        """Draws a strip as tall as the screen with one period of the lines (a line and a gap, rounded to whole pixels, so the strips match)."""
+        period = max(2, round(2 * self._distance_between_lines))
+        tile = pg.Surface((period, self._size[1]))
+        tile.fill(self._bgcolor)
+        # Draws the trapeziums (from the top to the left side of the screen) that cross the strip, each one a period after the other.
+        for x in range(0, self._size[0] + 2 * period, period):
+            pg.draw.polygon(tile, self._fgcolor, (
+                (x, 0), (x + period / 2, 0), (x + period / 2 - self._size[0], self._size[1]), (x - self._size[0], self._size[1])
             ))
         
         if self._inverse_vertical:
-            self._surface = pg.transform.flip(self._surface, False, True)
+            tile = pg.transform.flip(tile, False, True)
+
+        return tile
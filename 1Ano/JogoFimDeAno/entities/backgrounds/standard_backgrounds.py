@@ -1,9 +1,14 @@
 from scripts import COLORS
 from . import Checkered, Lines
 from random import randint, uniform, getrandbits
+from typing import Callable
 
-def get_backgrounds_list(screen_size: tuple[int, int]) -> list[Checkered | Lines]: 
+def get_backgrounds_factories() -> list[Callable[[tuple[int, int]], Checkered | Lines]]:
+    """Returns the functions creating each background, so only the chosen one is created."""
     return [
-        Lines(randint(10, 20), screen_size, uniform(0.5, 2), COLORS["GRAY"], COLORS["BLACK"], bool(getrandbits(1)), bool(getrandbits(1))), # bool(getrandbits(1)) = random generate between "True" and "False" relatively fast.
-        Checkered(screen_size, randint(10, 20), COLORS["GRAY"], COLORS["BLACK"], uniform(0.5, 2), uniform(0, 360))
+        lambda screen_size: Lines(randint(10, 20), screen_size, uniform(0.5, 2), COLORS["GRAY"], COLORS["BLACK"], bool(getrandbits(1)), bool(getrandbits(1))), # bool(getrandbits(1)) = random generate between "True" and "False" relatively fast.
+        lambda screen_size: Checkered(screen_size, randint(10, 20), COLORS["GRAY"], COLORS["BLACK"], uniform(0.5, 2), uniform(0, 360))
     ]
+
+def get_backgrounds_list(screen_size: tuple[int, int]) -> list[Checkered | Lines]: 
+    return [ factory(screen_size) for factory in get_backgrounds_factories() ]
@@ -1,4 +1,5 @@
 import pygame as pg
+from ..render import DirtyTracker
 from scripts import BASE_RESOLUTION
 from typing import Callable
 
@@ -9,6 +10,7 @@ class Button:
         self._position = position
         self._attr_pos = attr_pos
         self._hitbox = pg.Rect(self._position, self._size)
+        self._dirty_tracker = DirtyTracker()
         self.set_position_attr(self._attr_pos, self._position)
         self._action = action
         self._base_size = self._size
@@ -51,5 +53,8 @@ class Button:
         """
         self._position = new_pos
         setattr(self._hitbox, attr_pos, self._position)
+        self._dirty_tracker.mark()
     
     def get_size(self) -> tuple[int, int]: return self._size
+
+    def get_dirty_rects(self) -> list[pg.Rect]: return self._dirty_tracker.collect(self._hitbox)
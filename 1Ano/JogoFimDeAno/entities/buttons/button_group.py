@@ -32,6 +32,9 @@ class ButtonGroup:
         self._center = scale_position(self._base_center, BASE_RESOLUTION, new_resolution)
         self._set_positions()
     
+    def get_dirty_rects(self) -> list[pg.Rect]:
+        return [ rect for btn in self._buttons for rect in btn.get_dirty_rects() ]
+
     def add_button(self, new_button: Button) -> None:
         self._buttons.append(new_button)
         self._set_positions()
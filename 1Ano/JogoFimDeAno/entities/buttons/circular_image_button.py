@@ -1,6 +1,8 @@
 import pygame as pg
-from scripts import get_file_path, scale_dimension, scale_position, BASE_RESOLUTION
+from scripts import scale_dimension, scale_position, BASE_RESOLUTION
 from ..mousehandler import MouseHandler
+from ..assets import AssetManager
+from ..render import DirtyTracker
 from math import sqrt
 from typing import Callable
 
@@ -8,7 +10,7 @@ class CircularImageButton:
     def __init__(self, pos: tuple[int, int], pos_attr: str, img_path: str, img_size: tuple[int, int], padding: int, border_size: int, border_color: tuple[int, int, int], hover_time: float, hover_color: tuple[int, int, int], action: Callable[[], None]) -> None:
         self._pos = pos
         self._pos_attr = pos_attr
-        self._original_image = pg.image.load(get_file_path(f"../images/{img_path}")).convert_alpha()
+        self._img_path = img_path
         self._img_size = img_size
         self._padding = padding
         self._border_size = border_size
@@ -18,10 +20,13 @@ class CircularImageButton:
         self._hover_time = hover_time
         self._current_hover_process = 0
         self._is_hovered = False
+        self._dirty_tracker = DirtyTracker()
 
         self._save_values = (self._pos, self._img_size, self._padding, self._border_size)
 
     def update(self, dt: float) -> None:
+        last_hover_process = self._current_hover_process
+
         if self._is_hovered:
             MouseHandler.change_cursor(pg.SYSTEM_CURSOR_HAND)
             self._current_hover_process += dt / self._hover_time
@@ -34,6 +39,9 @@ class CircularImageButton:
             if self._current_hover_process < 0:
                 self._current_hover_process = 0
 
+        if self._current_hover_process != last_hover_process: # Only dirty while the hover animation runs
+            self._dirty_tracker.mark()
+
     def draw(self, screen: pg.Surface) -> None:
         hovers = self._generate_hover_surface()
         screen.blit(hovers[0], hovers[1])
@@ -58,6 +66,9 @@ class CircularImageButton:
         self._padding = scale_dimension(self._save_values[2], new_resolution)
         self._border_size = scale_dimension(self._save_values[3], new_resolution)
         self._surface, self._surface_rect, self._radius = self._generate_surface()
+        self._dirty_tracker.mark()
+
+    def get_dirty_rects(self) -> list[pg.Rect]: return self._dirty_tracker.collect(self._surface_rect)
 
     def _check_hover(self, pos: tuple[int, int]) -> None:
         self._is_hovered = False
@@ -71,7 +82,7 @@ class CircularImageButton:
             self._action()
 
     def _generate_surface(self) -> tuple[pg.Surface, pg.Rect, float]:
-        img = pg.transform.scale(self._original_image, self._img_size)
+        img = AssetManager.get_scaled(self._img_path, self._img_size)
         total_radius = sqrt(img.width ** 2 + img.height ** 2) / 2 + self._padding + self._border_size
 
         surf = pg.Surface((total_radius * 2, total_radius * 2), pg.SRCALPHA)
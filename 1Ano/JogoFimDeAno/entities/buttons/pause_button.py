@@ -14,6 +14,7 @@ class PauseButton(Button):
     
     def update(self) -> None:
         self.is_paused = not self.is_paused
+        self._dirty_tracker.mark()
 
         self._action()
     
@@ -1,13 +1,14 @@
 import pygame as pg
 import pygame.freetype as pgft
 from . import Button
+from ..text import TextRenderer
 from scripts import scale_dimension, scale_position
 from typing import Callable
 
 class TextButton(Button):
     def __init__(self, position: tuple[int, int], attr_pos: str, action: Callable, text: str, font: pgft.Font, fgcolor: tuple[int, int, int] | None, bgcolor: tuple[int, int, int] | None = None, style: int = pgft.STYLE_DEFAULT, rotation: int = 0, size_font: float = 0, padding: tuple[int, int] = (0, 0), padding_by_size: tuple[int, int] = (0, 0)):
         self._font_size = size_font
-        self._generate_text = lambda size: font.render(text, fgcolor, None, style, rotation, size)
+        self._generate_text = lambda size: TextRenderer.render(font, text, fgcolor, size, style, rotation)
         text_surf, text_rect = self._generate_text(self._font_size)
         if padding_by_size != (0, 0):
             self._padding = (max(0, (padding_by_size[0] - text_rect.width)), max(0, (padding_by_size[1] - text_rect.height)))
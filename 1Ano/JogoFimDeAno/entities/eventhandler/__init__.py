@@ -1,3 +1,3 @@
 from .custom_event_list import CustomEventList
 from .event_handler import CustomEventHandler
-from .event_pauser import EventPauser
+from .timer_scheduler import TimerScheduler
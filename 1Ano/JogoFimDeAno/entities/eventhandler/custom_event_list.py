@@ -4,9 +4,9 @@ from enum import IntEnum, auto
 class CustomEventList(IntEnum):
     NEWLEVELWARNING = USEREVENT + 1
     NEWGENERATIONWARNING = auto()
-    DISABLEWARNING = auto()
     PLAYERCOLLISION = auto()
-    RANDOMGAMEEND = auto()
-    RESETGAME = auto()
     ACHIEVEMENTUNLOCKED = auto()
+    MUSICLOADED = auto()
+    MUSICENDED = auto()
+    CHECKPOINTREACHED = auto()
     # auto for new custom events
@@ -0,0 +1,68 @@
+from heapq import heappush, heappop, heapify
+from typing import Callable
+
+class TimerScheduler:
+    """Timers counted in game time: they only advance with the 'dt' given to 'update' while not paused, calling their handlers directly.
+
+        Like 'pg.time.set_timer' (where the event identifies the timer), each handler has at most one timer, setting it again
+        replaces the old one. The timers are kept in a min-heap by their due time, so 'update' only looks at the ones that fire
+        (O(log n) each). The replaced and cancelled timers are left in the heap and skipped when they come out.
+    """
+    def __init__(self) -> None:
+        self._time = 0.0
+        self._heap: list[tuple[float, int, Callable[[], None]]] = [] # (due time, serial, handler), the serial breaks ties in order
+        self._timers: dict[Callable[[], None], list] = {} # handler -> [serial, interval, repeats left (0 is forever)]
+        self._serial = 0
+        self._is_paused = False
+
+    def set_timer(self, handler: Callable[[], None], seconds: float, repeats: int = 1) -> None:
+        """Calls 'handler' after 'seconds' of game time, 'repeats' times (0 repeats forever)."""
+        if repeats != 1 and seconds <= 0: raise ValueError("TimerScheduler: A repeating timer needs a positive time!")
+
+        self._serial += 1
+        self._timers[handler] = [self._serial, seconds, repeats]
+        heappush(self._heap, (self._time + seconds, self._serial, handler))
+
+        if len(self._heap) > 2 * len(self._timers) + 16: # Too many replaced or cancelled timers still in the heap
+            self._compact()
+
+    def cancel(self, handler: Callable[[], None]) -> None:
+        self._timers.pop(handler, None)
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._timers.clear()
+
+    def update(self, dt: float) -> None:
+        """Advances the game time (if not paused) and calls the handlers of the timers that fired, in the order of their times."""
+        if self._is_paused: return
+        self._time += dt
+
+        while self._heap and self._heap[0][0] <= self._time:
+            due, serial, handler = heappop(self._heap)
+            timer = self._timers.get(handler)
+            if timer is None or timer[0] != serial: continue # Cancelled or replaced
+
+            if timer[2] == 1:
+                del self._timers[handler]
+            else:
+                timer[2] = max(0, timer[2] - 1)
+                self._serial += 1
+                timer[0] = self._serial
+                heappush(self._heap, (due + timer[1], self._serial, handler))
+
+            handler()
+
+    def toggle_pause(self) -> None:
+        self._is_paused = not self._is_paused
+
+    def set_paused(self, paused: bool) -> None:
+        self._is_paused = paused
+
+    def is_paused(self) -> bool: return self._is_paused
+
+    def has_timer(self, handler: Callable[[], None]) -> bool: return handler in self._timers
+
+    def _compact(self) -> None:
+        self._heap = [ entry for entry in self._heap if self._timers.get(entry[2], (None,))[0] == entry[1] ]
+        heapify(self._heap)
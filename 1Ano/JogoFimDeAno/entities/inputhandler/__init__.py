@@ -0,0 +1,2 @@
+from .input_handler import *
+from .scripted_input import *
@@ -0,0 +1,49 @@
+import pygame as pg
+from typing import Any
+
+class InputHandler:
+    """Keyboard and mouse state read by the entities, instead of reading 'pg.key' and 'pg.mouse' directly.
+
+        By default it's pygame's state, but a 'ScriptedInput' can replace it, so the game can run without a window (see 'Simulation').
+        The mouse is given in the coordinates the windows draw on: the display's, or the canvas' while a resize is settling
+        (see 'ResizeScheduler').
+    """
+    __scripted_input = None
+    __canvas_size: tuple[int, int] | None = None
+
+    @classmethod
+    def get_pressed_keys(self) -> Any:
+        """Returns the pressed keys, indexed by the key constants (like 'pg.key.get_pressed()')."""
+        if self.__scripted_input != None:
+            return self.__scripted_input.get_pressed_keys()
+        return pg.key.get_pressed()
+
+    @classmethod
+    def get_mouse_pressed(self) -> tuple[bool, bool, bool]:
+        if self.__scripted_input != None:
+            return self.__scripted_input.get_mouse_pressed()
+        return pg.mouse.get_pressed()
+
+    @classmethod
+    def get_mouse_pos(self) -> tuple[int, int]:
+        if self.__scripted_input != None:
+            return self.__scripted_input.get_mouse_pos()
+        return self.to_canvas_pos(pg.mouse.get_pos())
+
+    @classmethod
+    def to_canvas_pos(self, pos: tuple[int, int]) -> tuple[int, int]:
+        """Maps a position on the display to the canvas the windows draw on (the same position without a canvas)."""
+        if self.__canvas_size is None: return pos
+
+        display_size = pg.display.get_surface().get_size()
+        return (pos[0] * self.__canvas_size[0] // display_size[0], pos[1] * self.__canvas_size[1] // display_size[1])
+
+    @classmethod
+    def set_canvas_size(self, canvas_size: tuple[int, int] | None) -> None:
+        """Sets the size of the canvas the windows draw on, scaled to the display ('None' when they draw on the display)."""
+        self.__canvas_size = canvas_size
+
+    @classmethod
+    def set_scripted_input(self, scripted_input: Any) -> None:
+        """Replaces pygame's state with 'scripted_input' ('None' returns to pygame's state)."""
+        self.__scripted_input = scripted_input
@@ -0,0 +1,52 @@
+from random import Random
+
+class PressedKeys:
+    """The pressed keys of a 'ScriptedInput', indexed like the 'pg.key.get_pressed()' result."""
+    def __init__(self, keys: frozenset[int]) -> None:
+        self._keys = keys
+
+    def __getitem__(self, key: int) -> bool: return key in self._keys
+
+class ScriptedInput:
+    """Input that follows a timeline instead of the real keyboard and mouse, used by the headless simulations.
+
+        The timeline is a list of (time, keys) steps, sorted by time (in seconds): from each step's time on, only its keys are pressed.
+        The mouse is never pressed (the Player's mouse control is the same as the 'a' and 'd' keys), it only stays at 'mouse_pos'.
+    """
+    def __init__(self, timeline: list[tuple[float, tuple[int, ...]]] = [], mouse_pos: tuple[int, int] = (0, 0)) -> None:
+        self._timeline = timeline
+        self._mouse_pos = mouse_pos
+        self._step = -1
+        self._time = 0.0
+        self._pressed_keys = PressedKeys(frozenset())
+        self.advance(0)
+
+    def advance(self, dt: float) -> list[int]:
+        """Advances the timeline by 'dt' seconds and returns the keys that were pressed in it (the KEYDOWNs)."""
+        self._time += dt
+        old_keys = self._pressed_keys._keys
+
+        while self._step + 1 < len(self._timeline) and self._timeline[self._step + 1][0] <= self._time:
+            self._step += 1
+            self._pressed_keys = PressedKeys(frozenset(self._timeline[self._step][1]))
+
+        return [ key for key in self._pressed_keys._keys if key not in old_keys ]
+
+    def get_pressed_keys(self) -> PressedKeys: return self._pressed_keys
+
+    def get_mouse_pressed(self) -> tuple[bool, bool, bool]: return (False, False, False)
+
+    def get_mouse_pos(self) -> tuple[int, int]: return self._mouse_pos
+
+    @staticmethod
+    def random_timeline(seed: int, duration: float, keys: tuple[int, ...], min_hold: float = 0.1, max_hold: float = 1.0) -> list[tuple[float, tuple[int, ...]]]:
+        """Returns a reproducible timeline pressing random combinations of 'keys' (or none) for random intervals."""
+        rng = Random(seed)
+        timeline: list[tuple[float, tuple[int, ...]]] = []
+        time = 0.0
+
+        while time < duration:
+            timeline.append((time, tuple(key for key in keys if rng.random() < 0.3)))
+            time += rng.uniform(min_hold, max_hold)
+
+        return timeline
@@ -0,0 +1 @@
+from .level_pack import *
@@ -0,0 +1,34 @@
+"""Compiles a level pack (a json like 'data/levels.json': level -> obstacles' indexes) to the binary format of 'LevelPack'.
+
+    The game's own pack is compiled by itself when 'levels.json' changes, this is for other packs (and to check one).
+
+    Run from the game's folder with: python -m entities.levelpack levels.json [-o levels.pack]
+"""
+from .level_pack import LevelPack, compile_level_pack, get_level_templates
+from argparse import ArgumentParser
+from hashlib import blake2b
+from json import loads as json_loads
+from os import stat
+from os.path import splitext
+
+def main() -> None:
+    parser = ArgumentParser(description="Compila um pacote de níveis (json) para o formato binário do jogo")
+    parser.add_argument("source", help="json dos níveis (nível -> índices dos obstáculos)")
+    parser.add_argument("-o", "--output", help="arquivo compilado (padrão: o json com a extensão .pack)")
+    args = parser.parse_args()
+
+    output = args.output or f"{splitext(args.source)[0]}.pack"
+    with open(args.source, "rb") as file:
+        source = file.read()
+    source_stat = stat(args.source)
+
+    data = compile_level_pack(json_loads(source), get_level_templates(), source_stats=(source_stat.st_size, source_stat.st_mtime_ns), source_hash=blake2b(source, digest_size=16).digest())
+    with open(output, "wb") as file:
+        file.write(data)
+
+    pack = LevelPack.open(output)
+    print(f"{pack.get_amount_levels()} níveis compilados em {output} ({len(data)} bytes, hash {pack.get_source_hash()})")
+    pack.close()
+
+if __name__ == "__main__":
+    main()
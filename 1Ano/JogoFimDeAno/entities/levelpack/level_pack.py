@@ -0,0 +1,185 @@
+from ..obstacles import Obstacle, ObstacleGroup, StationaryObstacle, RotatingObstacle, InvisibleObstacle, HorizontalMovingObstacle, get_obstacle_list
+from scripts import get_file_path, OBSTACLES_HEIGHT, COLORS, BASE_RESOLUTION
+from enum import IntEnum, auto
+from hashlib import blake2b
+from json import loads as json_loads
+from mmap import mmap, ACCESS_READ
+from os import fstat, replace
+from struct import Struct
+from sys import stderr
+from typing import Any
+
+class LevelObstacleType(IntEnum):
+    STATIONARY = auto()
+    ROTATING = auto()
+    INVISIBLE = auto()
+    HORIZONTALMOVING = auto()
+    GROUP = auto()
+
+_OBSTACLE_TYPES: dict[type, LevelObstacleType] = {
+    StationaryObstacle : LevelObstacleType.STATIONARY,
+    RotatingObstacle : LevelObstacleType.ROTATING,
+    InvisibleObstacle : LevelObstacleType.INVISIBLE,
+    HorizontalMovingObstacle : LevelObstacleType.HORIZONTALMOVING,
+    ObstacleGroup : LevelObstacleType.GROUP
+}
+
+# The pack's binary format (little-endian): the header, the index (one entry per level, sorted by level) and the placements
+_MAGIC = b"LVPK"
+_VERSION = 1
+_HEADER = Struct("<4sHIqq16s16s") # Magic, version, amount of levels, source's size and mtime (ns), source's hash, templates' hash
+_INDEX_ENTRY = Struct("<III8s") # Level, offset of its placements, amount of obstacles, level's hash
+_PLACEMENT = Struct("<HBdd") # Template index, type, y offset (in player's distances ahead of the player), initial angle
+_TEMPLATES_DISTANCE = 100 # The player's distance of the templates used to compile
+
+def get_templates_hash(templates: list[Obstacle], player_normal_distance: float) -> bytes:
+    """The hash of what the layouts depend on: each template's type, spacing and depth (in player's distances)."""
+    return blake2b(repr([ (_OBSTACLE_TYPES[type(template)], template.get_spacing_mult(), template.get_depth() / player_normal_distance) for template in templates ]).encode(), digest_size=16).digest()
+
+def get_level_templates() -> list[Obstacle]:
+    """The level mode's templates to compile the packs, with a player's distance of '_TEMPLATES_DISTANCE' (the layouts are normalized by it)."""
+    return get_obstacle_list(tuple(i // 2 for i in BASE_RESOLUTION), _TEMPLATES_DISTANCE, 1, OBSTACLES_HEIGHT, 1, COLORS["WHITE"])
+
+def compile_level_pack(levels: dict[str, list[int]], templates: list[Obstacle], player_normal_distance: float = _TEMPLATES_DISTANCE, start_distance_mult: float = 8, source_stats: tuple[int, int] = (0, 0), source_hash: bytes = bytes(16)) -> bytes:
+    """Compiles the levels (level -> template indexes, like 'levels.json') in a pack with the obstacles' placements precomputed.
+
+        The placements are the ones 'BaseObstaclesManager._set_base_y' computes: the first obstacle 'start_distance_mult' player's
+        distances ahead of the player, each next one the biggest spacing of the two after the end of the last one (the groups have
+        a depth), and the rotating ones start at an angle given by their distance. They're normalized by the player's distance
+        ('player_normal_distance' is the templates' one), so they hold for every resolution.
+    """
+    spacings = [ template.get_spacing_mult() for template in templates ]
+    types = [ _OBSTACLE_TYPES[type(template)] for template in templates ]
+    depths = [ template.get_depth() / player_normal_distance for template in templates ]
+    sorted_levels = sorted((int(level), indexes) for level, indexes in levels.items())
+
+    index = bytearray()
+    placements = bytearray()
+    placements_start = _HEADER.size + _INDEX_ENTRY.size * len(sorted_levels)
+
+    for level, indexes in sorted_levels:
+        unknown_indexes = sorted({ i for i in indexes if not 0 <= i < len(templates) })
+        if unknown_indexes: raise ValueError(f"LevelPack: Level {level} has unknown obstacles {unknown_indexes} (there are {len(templates)})!")
+
+        level_hash = blake2b(repr(indexes).encode(), digest_size=8).digest()
+        index += _INDEX_ENTRY.pack(level, placements_start + len(placements), len(indexes), level_hash)
+
+        y_offset = start_distance_mult
+        for i, template_index in enumerate(indexes):
+            if i > 0:
+                y_offset += depths[indexes[i-1]] + max(spacings[indexes[i-1]], spacings[template_index])
+            angle = (y_offset % 2) * 90 if types[template_index] == LevelObstacleType.ROTATING else 0
+            placements += _PLACEMENT.pack(template_index, types[template_index], y_offset, angle)
+
+    header = _HEADER.pack(_MAGIC, _VERSION, len(sorted_levels), source_stats[0], source_stats[1], source_hash, get_templates_hash(templates, player_normal_distance))
+    return header + bytes(index) + bytes(placements)
+
+class LevelPack:
+    """A compiled level pack (see 'compile_level_pack'), read in place from its file mapped in memory (or from its bytes).
+
+        Only the header is read when it's opened. Getting a level bisects the index and unpacks just that level's placements,
+        so the cost doesn't depend on the size of the pack.
+    """
+    def __init__(self, buffer: bytes | mmap) -> None:
+        magic, version, self._amount_levels, *self._source_stats, self._source_hash, self._templates_hash = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC or version != _VERSION: raise ValueError("LevelPack: Not a level pack or from another version!")
+
+        self._buffer = buffer
+
+    @classmethod
+    def open(self, path: str) -> "LevelPack":
+        with open(path, "rb") as file:
+            return self(mmap(file.fileno(), 0, access=ACCESS_READ)) # The map stays valid after the file is closed
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap):
+            self._buffer.close()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "LevelPack": return self # Read only, the copies of its users share it
+
+    def get_level(self, level: int) -> list[tuple[int, LevelObstacleType, float, float]] | None:
+        """Returns the placements of the level's obstacles, (template index, type, y offset, angle), or None if it doesn't exist."""
+        entry = self._find_entry(level)
+        if entry is None: return None
+
+        _, offset, amount, _ = entry
+        return [ (index, LevelObstacleType(obstacle_type), y_offset, angle) for index, obstacle_type, y_offset, angle in _PLACEMENT.iter_unpack(self._buffer[offset:offset + amount * _PLACEMENT.size]) ]
+
+    def get_level_hash(self, level: int) -> str | None:
+        entry = self._find_entry(level)
+        return entry[3].hex() if entry != None else None
+
+    def get_levels(self) -> list[int]:
+        return [ _INDEX_ENTRY.unpack_from(self._buffer, _HEADER.size + i * _INDEX_ENTRY.size)[0] for i in range(self._amount_levels) ]
+
+    def get_amount_levels(self) -> int: return self._amount_levels
+
+    def get_source_stats(self) -> tuple[int, int]: return tuple(self._source_stats)
+
+    def get_source_hash(self) -> str: return self._source_hash.hex()
+
+    def get_templates_hash(self) -> bytes: return self._templates_hash
+
+    def _find_entry(self, level: int) -> tuple[int, int, int, bytes] | None:
+        """Bisects the index (sorted by level) for the level's entry."""
+        low, high = 0, self._amount_levels
+
+        while low < high:
+            middle = (low + high) // 2
+            entry = _INDEX_ENTRY.unpack_from(self._buffer, _HEADER.size + middle * _INDEX_ENTRY.size)
+            if entry[0] == level: return entry
+            if entry[0] < level:
+                low = middle + 1
+            else:
+                high = middle
+
+        return None
+
+class LevelPackLoader:
+    """Gives the game's level pack, compiled from 'levels.json' when the pack is missing or out of date.
+
+        The pack is saved next to the json ('levels.pack') and only compiled again when the json changes or the obstacles'
+        templates do, so the json is only parsed then. The json's size and modification time are checked first, and its
+        hash when they match (an edit can keep both, within the modification time's resolution).
+    """
+    _source_path = get_file_path("../data/levels.json")
+    _pack_path = get_file_path("../data/levels.pack")
+    _pack: LevelPack | None = None
+
+    @classmethod
+    def get_pack(self, templates: list[Obstacle] | None = None, player_normal_distance: float = _TEMPLATES_DISTANCE) -> LevelPack:
+        """Returns the pack, checking it was compiled with 'templates' (the obstacles managers' ones, with their player's distance) if given."""
+        with open(self._source_path, "rb") as file:
+            source_file = fstat(file.fileno())
+            source = file.read()
+        source_stats = (source_file.st_size, source_file.st_mtime_ns)
+        source_hash = blake2b(source, digest_size=16).digest()
+
+        if self._pack is None:
+            try:
+                self._pack = LevelPack.open(self._pack_path)
+            except (OSError, ValueError): # Not compiled yet (or from another version)
+                pass
+
+        if self._pack is None or self._pack.get_source_stats() != source_stats or self._pack.get_source_hash() != source_hash.hex() or (templates != None and self._pack.get_templates_hash() != get_templates_hash(templates, player_normal_distance)):
+            if templates is None:
+                templates, player_normal_distance = get_level_templates(), _TEMPLATES_DISTANCE
+            self._compile(source, templates, player_normal_distance, source_stats, source_hash)
+
+        return self._pack
+
+    @classmethod
+    def _compile(self, source: bytes, templates: list[Obstacle], player_normal_distance: float, source_stats: tuple[int, int], source_hash: bytes) -> None:
+        data = compile_level_pack(json_loads(source), templates, player_normal_distance, source_stats=source_stats, source_hash=source_hash)
+
+        if self._pack != None:
+            self._pack.close()
+
+        try:
+            with open(f"{self._pack_path}.tmp", "wb") as file:
+                file.write(data)
+            replace(f"{self._pack_path}.tmp", self._pack_path)
+            self._pack = LevelPack.open(self._pack_path)
+        except OSError as error: # Read-only folder, the pack is kept in memory
+            print(f"LevelPackLoader: Couldn't save {self._pack_path}: {error}", file=stderr)
+            self._pack = LevelPack(data)
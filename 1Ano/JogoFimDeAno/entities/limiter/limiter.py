@@ -1,4 +1,6 @@
 import pygame as pg
+from ..inputhandler import InputHandler
+from ..render import DirtyTracker
 from scripts import scale_dimension, scale_position, BASE_RESOLUTION
 from math import sqrt
 from typing import Any, Callable
@@ -22,15 +24,17 @@ class Limiter:
         self._base_size = self._size
         self._base_position = self._position
         self._base_resolution = BASE_RESOLUTION
+        self._dirty_tracker = DirtyTracker()
     
     def update(self, dt: float) -> None:
         if not self._is_pressing: return
 
-        mx = pg.mouse.get_pos()[0]
+        mx = InputHandler.get_mouse_pos()[0]
 
         self._actual_percentage = self._get_percentage_x(mx) # Calculates new position of the actual
         self._actual_position = self._get_actual_pos(self._actual_percentage)
         self._actual_value = self._calculate_actual_value(self._actual_percentage)
+        self._dirty_tracker.mark()
         self._do_action()
     
     def draw(self, screen: pg.Surface) -> None:
@@ -79,3 +83,7 @@ class Limiter:
         self._hitbox_rect.height = self._size[1]
         setattr(self._hitbox_rect, self._attr_pos, self._position)
         self._actual_position = self._get_actual_pos(self._actual_percentage)
+        self._dirty_tracker.mark()
+
+    def get_dirty_rects(self) -> list[pg.Rect]:
+        return self._dirty_tracker.collect(self._hitbox_rect.inflate(self._size[1] + 2, 2)) # The circles at the ends go beyond the hitbox
@@ -15,6 +15,8 @@ class GradientLine:
     
     def draw(self, screen: pg.Surface) -> None:
         screen.blit(self._surface, self._surface_rect)
+
+    def get_rect(self) -> pg.Rect: return self._surface_rect.copy()
     
     def resize(self, new_resolution: tuple[int, int]) -> None:
         self._points = (
@@ -1,4 +1,5 @@
 import pygame as pg
+from ..render import DirtyTracker
 from scripts import scale_dimension, scale_position, BASE_RESOLUTION, get_diagonal_line
 
 class Line:
@@ -8,6 +9,7 @@ class Line:
         self._widths = (width_p1, width_p2)
         self._line_points = get_diagonal_line(self._points[0], self._widths[0], self._points[1], self._widths[1])
         self._color = color
+        self._dirty_tracker = DirtyTracker()
         
         self._save_values = (self._points, self._widths)
     
@@ -24,3 +26,8 @@ class Line:
             for i in self._save_values[1]
         )
         self._line_points = get_diagonal_line(self._points[0], self._widths[0], self._points[1], self._widths[1])
+        self._dirty_tracker.mark()
+
+    def get_dirty_rects(self) -> list[pg.Rect]:
+        xs, ys = zip(*self._line_points)
+        return self._dirty_tracker.collect(pg.Rect(min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1))
@@ -1,7 +1,6 @@
 import pygame as pg
 from . import Obstacle
 from ..player import Player
-from ..stains import generate_stain
 from scripts import scale_dimension
 from math import sqrt
 
@@ -38,9 +37,7 @@ class InvisibleObstacle(Obstacle):
             distance: float = sqrt((player.get_positions()[i][0] - closest_x) ** 2 + (player.get_positions()[i][1] - closest_y) ** 2)
 
             if distance < player.get_radius(): 
-                self._has_ink_stain = True
-                self._paint_new_stain((closest_x, closest_y), player.get_radius(), player.get_colors()[i])
-                return (True, [i])
+                return self.register_collision(i, (closest_x, closest_y), player)
         
         return (False, [])
 
@@ -49,7 +46,8 @@ class InvisibleObstacle(Obstacle):
         
         self._width = round(scale_dimension(self._base_width, new_resolution))
         self._height = round(scale_dimension(self._base_height, new_resolution))
-        self._surf_rect = pg.Surface((self._width, self._height))
+        if self._surf_rect.size != (self._width, self._height):
+            self._surf_rect = pg.Surface((self._width, self._height))
         self._surf_rect.fill(self._color)
         self._rect = self._surf_rect.get_rect()
 
@@ -61,24 +59,13 @@ class InvisibleObstacle(Obstacle):
         new_x = new_player_info[0][0] + x_ratio * new_player_info[1]
         self.set_x(new_x)
 
-        for i in range(len(self._position_tracker)):
-            time = self._position_tracker_lifetime - self._position_tracker_times[i]
-            self._position_tracker[i] = (round(self._x), round(self._y - self._speed * time))
+        self._position_tracker.remap(lambda center, time: (round(self._x), round(self._y - self._speed * time)))
         
-        self._ink_stain_surface = pg.transform.scale(self._base_ink_stain_surface, self._rect.size)
+        self._ink_stain_layer.resize(self._rect.size)
 
-    def _update_tracker(self, dt: float) -> None:
-        for i in range(len(self._position_tracker_times)):
-            self._position_tracker_times[i] -= dt
-        
-        self._position_tracker.append(self._rect.center)
-        self._position_tracker_times.append(self._position_tracker_lifetime)
+    def _get_tracker_sample(self) -> tuple[int, int]:
+        return self._rect.center
 
-        remove_to = next((j for j, e in enumerate(self._position_tracker_times) if e > 0), len(self._position_tracker_times))
-        for _ in range(remove_to):
-            self._position_tracker.popleft()
-            self._position_tracker_times.popleft()
-    
     def _draw_tracker(self, screen: pg.Surface) -> None:
         """Draw the Obstacle's tracker on the screen.
 
@@ -118,7 +105,7 @@ class InvisibleObstacle(Obstacle):
     def _draw_ink_stains(self, screen: pg.Surface) -> None:
         if not self._has_ink_stain: return
 
-        screen.blit(self._ink_stain_surface, self._rect)
+        screen.blit(self._ink_stain_layer.get_surface(), self._rect)
 
     def _paint_new_stain(self, pos: tuple[float, float], size: float, color: tuple[int, int, int]) -> None:
         ratio_pos = (
@@ -128,9 +115,7 @@ class InvisibleObstacle(Obstacle):
 
         rad = size * self._base_width / self._width
 
-        generate_stain(self._base_ink_stain_surface, ratio_pos, rad, color, rad * 1.5)
-        
-        self._ink_stain_surface = pg.transform.scale(self._base_ink_stain_surface, self._rect.size)
+        self._ink_stain_layer.paint(ratio_pos, rad, color)
 
     def check_distance(self, player_center: tuple[float, float], player_distance: float) -> None:
         """Check and Defines the new 'Alpha' for the obstacle in relation to the player_center."""
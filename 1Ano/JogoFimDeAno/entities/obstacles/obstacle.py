@@ -1,7 +1,10 @@
 import pygame as pg
 from ..player import Player
+from ..trail import TrailHistory
+from ..sprites import RotationCache
+from ..stains import StainLayer
 from scripts import INITIAL_ALPHA_TRACKER
-from collections import deque
+from typing import Any
 
 # Could add some JSON recognition for the levels
 
@@ -15,16 +18,14 @@ class Obstacle:
         self._speed = speed
         self._color = color
         self._spacing_mult = spacing_mult
-        self._position_tracker = deque()
-        self._position_tracker_times = deque()
         self._position_tracker_lifetime = 0.2 # seconds
+        self._position_tracker = TrailHistory(self._position_tracker_lifetime)
         self._initial_alpha_tracker = INITIAL_ALPHA_TRACKER
         self._base_width = self._width
         self._base_height = self._height
-        self._ink_stain_surface = pg.Surface((self._base_width, self._base_height), pg.SRCALPHA)
-        self._base_ink_stain_surface = pg.Surface((self._base_width, self._base_height), pg.SRCALPHA)
-        self._base_ink_stain_surface.fill((0, 0, 0, 0))
+        self._ink_stain_layer = StainLayer((self._base_width, self._base_height))
         self._has_ink_stain = False
+        self._tracker_suspended = False
     
     def update(self, dt: float) -> None: pass
     
@@ -32,9 +33,46 @@ class Obstacle:
     
     def check_collision(self, player: Player) -> tuple[bool, list[int]]: pass
 
+    def register_collision(self, circle_index: int, nearest_point: tuple[float, float], player: Player) -> tuple[bool, list[int]]:
+        """Paints the stain of the collided circle in the 'nearest_point' (in the same coordinates used by '_paint_new_stain')."""
+        self._has_ink_stain = True
+        self._paint_new_stain(nearest_point, player.get_radius(), player.get_colors()[circle_index])
+        return (True, [circle_index])
+
     def set_new_resolution(self, new_resolution: tuple[int, int], old_player_info: tuple[tuple[int, int], int], new_player_info: tuple[tuple[int, int], int], new_speed: float) -> None: pass
 
-    def _update_tracker(self, dt: float) -> None: pass
+    def reset_from(self, template: "Obstacle") -> None:
+        """Resets the obstacle in place to the state of the 'template' (an obstacle of the same type), used by the obstacles pools.
+
+            The plain attributes are copied, while the Rects are updated and the Surfaces, the tracker, the caches and the stains are reused (cleared).
+        """
+        for name, value in template.__dict__.items():
+            if isinstance(value, pg.Surface): continue # Recreated (or kept) by 'set_new_resolution'
+            elif isinstance(value, pg.Rect): getattr(self, name).update(value)
+            elif isinstance(value, TrailHistory | RotationCache): getattr(self, name).clear()
+            elif isinstance(value, StainLayer): getattr(self, name).reset_from(value)
+            else: setattr(self, name, value)
+
+    def get_vertical_bounds(self) -> tuple[float, float]:
+        """Returns the top and bottom y the obstacle can draw on (its tracker included, as it stays above the obstacle)."""
+        half_height = self._get_half_vertical_extent()
+        return (self._y - half_height - self._speed * self._position_tracker_lifetime, self._y + half_height)
+
+    def set_tracker_suspended(self, suspended: bool) -> None:
+        """Suspends (or resumes) the tracker's history, used by the obstacles managers for off-screen obstacles."""
+        if suspended and not self._tracker_suspended:
+            self._position_tracker.clear()
+        self._tracker_suspended = suspended
+
+    def _get_half_vertical_extent(self) -> float: return self._height / 2
+
+    def _update_tracker(self, dt: float) -> None:
+        if self._tracker_suspended: return
+
+        self._position_tracker.advance(dt)
+        self._position_tracker.record(self._get_tracker_sample())
+
+    def _get_tracker_sample(self) -> Any: pass
 
     def _draw_tracker(self, screen: pg.Surface) -> None: pass
 
@@ -52,4 +90,6 @@ class Obstacle:
 
     def get_spacing_mult(self) -> float: return self._spacing_mult
 
+    def get_depth(self) -> float: return 0 # How far ahead of its 'y' it goes, see 'ObstacleGroup.get_depth'
+
     def set_color(self, color: tuple[int, int, int]) -> None: self._color = color
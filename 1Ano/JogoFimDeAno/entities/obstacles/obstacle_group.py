@@ -29,6 +29,18 @@ class ObstacleGroup:
         
         return (False, [])
 
+    def reset_from(self, template: "ObstacleGroup") -> None:
+        for obstacle, obstacle_template in zip(self._obstacles, template._obstacles):
+            obstacle.reset_from(obstacle_template)
+
+    def get_vertical_bounds(self) -> tuple[float, float]:
+        bounds = [ obstacle.get_vertical_bounds() for obstacle in self._obstacles ]
+        return (min(top for top, _ in bounds), max(bottom for _, bottom in bounds))
+
+    def set_tracker_suspended(self, suspended: bool) -> None:
+        for obstacle in self._obstacles:
+            obstacle.set_tracker_suspended(suspended)
+
     def set_new_resolution(self, new_resolution: tuple[int, int], old_player_info: tuple[tuple[int, int], int], new_player_info: tuple[tuple[int, int], int], new_speed: float) -> None:
         for obstacle in self._obstacles:
             obstacle.set_new_resolution(new_resolution, old_player_info, new_player_info, new_speed)
@@ -64,6 +76,12 @@ class ObstacleGroup:
 
     def get_spacing_mult(self) -> float: 
         return self._spacing_mult
+
+    def get_depth(self) -> float:
+        """How far ahead (up) the last obstacle is from the first one, the one placed by 'set_y' ('get_y' is the last one's)."""
+        if self._amount == 0: return 0
+
+        return self._obstacles[0].get_y() - self._obstacles[self._amount-1].get_y()
     
     def set_color(self, color: tuple[int, int, int]) -> None:
         for obst in self._obstacles:
@@ -1,7 +1,7 @@
 import pygame as pg
 from . import Obstacle
 from ..player import Player
-from ..stains import generate_stain
+from ..sprites import RotationCache
 from scripts import scale_dimension
 from math import sqrt, pi, radians, cos, sin, asin, degrees
 
@@ -13,6 +13,8 @@ class RotatingObstacle(Obstacle):
         self._d_angle = 2 * asin((self._height / 2) / self._circumscribed_circle_radius)
         self._angle = radians(initial_angle) - self._d_angle / 2
         self._points = self._calculate_rotating_points(self._angle)
+        self._ink_stain_rotations = RotationCache() # Only the painted part of the stain layer, rotated around its own center
+        self._ink_stain_offset = (0.0, 0.0) # Center of the painted part relative to the obstacle's center (not rotated)
     
     def update(self, dt: float) -> None:
         self._y += self._speed * dt
@@ -53,9 +55,7 @@ class RotatingObstacle(Obstacle):
             distance = sqrt((player_relative_center[0] - nearest_x) ** 2 + (player_relative_center[1] - nearest_y) ** 2)
 
             if distance < player.get_radius(): 
-                self._has_ink_stain = True
-                self._paint_new_stain((nearest_x, nearest_y), player.get_radius(), player.get_colors()[i])
-                return (True, [i])
+                return self.register_collision(i, (nearest_x, nearest_y), player)
         
         return (False, [])
 
@@ -65,6 +65,8 @@ class RotatingObstacle(Obstacle):
         self._width = scale_dimension(self._base_width, new_resolution)
         self._height = scale_dimension(self._base_height, new_resolution)
         self._circumscribed_circle_radius = sqrt(self._width ** 2 + self._height ** 2) / 2
+        self._ink_stain_layer.resize((self._width, self._height))
+        self._ink_stain_rotations.clear()
         # self._points = self._calculate_rotating_points(self._angle)
 
         y_ratio = (old_player_info[0][1] - self._y) / old_player_info[1]
@@ -75,21 +77,12 @@ class RotatingObstacle(Obstacle):
         new_x = new_player_info[0][0] + x_ratio * new_player_info[1]
         self.set_x(new_x)
 
-        for i in range(len(self._position_tracker)):
-            time = self._position_tracker_lifetime - self._position_tracker_times[i]
-            self._position_tracker[i] = self._calculate_rotating_points(self._angle - self._angular_speed * time)
+        self._position_tracker.remap(lambda points, time: self._calculate_rotating_points(self._angle - self._angular_speed * time))
 
-    def _update_tracker(self, dt: float) -> None:
-        for i in range(len(self._position_tracker_times)):
-            self._position_tracker_times[i] -= dt
-        
-        self._position_tracker.append(self._points.copy())
-        self._position_tracker_times.append(self._position_tracker_lifetime)
+    def _get_half_vertical_extent(self) -> float: return self._circumscribed_circle_radius
 
-        remove_to = next((j for j, e in enumerate(self._position_tracker_times) if e > 0), len(self._position_tracker_times))
-        for _ in range(remove_to):
-            self._position_tracker.popleft()
-            self._position_tracker_times.popleft()
+    def _get_tracker_sample(self) -> list[list[float]]:
+        return self._points.copy()
 
     def _draw_tracker(self, screen: pg.Surface) -> None:
         len_tracker: int = len(self._position_tracker)
@@ -116,25 +109,39 @@ class RotatingObstacle(Obstacle):
         screen.blit(surf, ext_topleft)
     
     def _draw_ink_stains(self, screen: pg.Surface) -> None:
+        """Blits the stain's rotation nearest to the obstacle's angle, placed by the exact angle (the stain only changes on a new stain or resize)."""
         if not self._has_ink_stain: return
 
-        self._update_ink_stain()
+        if not self._ink_stain_rotations.has_source():
+            self._update_ink_stain()
+
+        angle = self._angle + self._d_angle / 2
+        stain_surface = self._ink_stain_rotations.get(-degrees(angle))
+        offset_x, offset_y = self._ink_stain_offset
+        center = (
+            self._x + offset_x * cos(angle) - offset_y * sin(angle),
+            self._y + offset_x * sin(angle) + offset_y * cos(angle)
+        )
 
-        screen.blit(self._ink_stain_surface, self._ink_stain_surface.get_rect(center=(round(self._x), round(self._y))))
+        screen.blit(stain_surface, stain_surface.get_rect(center=(round(center[0]), round(center[1]))))
     
     def _paint_new_stain(self, pos: tuple[float, float], size: float, color: tuple[int, int, int]) -> None:
         ratio_pos = (
-            round((pos[0] - (-self._width / 2)) / self._width * self._base_width),
-            round((pos[1] - (-self._height / 2)) / self._height * self._base_height)
+            (pos[0] - (-self._width / 2)) / self._width * self._base_width,
+            (pos[1] - (-self._height / 2)) / self._height * self._base_height
         )
 
-        rad = round(size * self._base_width / self._width)
+        rad = size * self._base_width / self._width
 
-        generate_stain(self._base_ink_stain_surface, ratio_pos, rad, color, rad * 1.5)
+        self._ink_stain_layer.paint(ratio_pos, rad, color)
+        self._ink_stain_rotations.clear()
     
     def _update_ink_stain(self) -> None:
-        self._ink_stain_surface = pg.transform.scale(self._base_ink_stain_surface, (self._width, self._height))
-        self._ink_stain_surface = pg.transform.rotate(self._ink_stain_surface, 360 - degrees(self._angle + self._d_angle / 2))
+        """Crops the stain layer to the painted part, the source of the rotations."""
+        stain_surface = self._ink_stain_layer.get_surface()
+        bounds = stain_surface.get_bounding_rect()
+        self._ink_stain_offset = (bounds.x + bounds.width / 2 - stain_surface.width / 2, bounds.y + bounds.height / 2 - stain_surface.height / 2)
+        self._ink_stain_rotations.set_source(stain_surface.subsurface(bounds).copy())
 
     def _calculate_rotating_points(self, ang: float) -> tuple[tuple[float, float], tuple[float, float], tuple[float, float], tuple[float, float]]:
         return [
@@ -1,3 +1,4 @@
+from .obstacle_stream import DifficultyCurve, SegmentStream, get_uniform_difficulty, get_ramping_difficulty
 from .base_obstacles_manager import BaseObstaclesManager
 from .random_obstacles_manager import RandomObstaclesManager
 from .level_obstacles_manager import LevelObstaclesManager
@@ -2,7 +2,9 @@ import pygame as pg
 from ..eventhandler import CustomEventHandler, CustomEventList
 from ..obstacles import Obstacle, RotatingObstacle, InvisibleObstacle, get_obstacle_list
 from ..player import Player
+from .obstacle_pool import ObstaclePool
 from scripts import OBSTACLES_HEIGHT, COLORS, BASE_RESOLUTION
+from bisect import bisect_left, bisect_right
 from typing import Callable
 
 class BaseObstaclesManager:
@@ -18,8 +20,11 @@ class BaseObstaclesManager:
         self._player_normal_distance = player_normal_distance
         self._possibles_obstacles: list[Obstacle] = obstacle_list(self._player_center, self._player_normal_distance, player_angular_speed, self._height, self._speed, self._color)
         self._base_obstacles_attrs = (self._player_center, self._player_normal_distance, self._speed)
+        self._obstacle_pool = ObstaclePool(self._possibles_obstacles)
         self._actual_resolution = BASE_RESOLUTION
         self._player_count_collisions = 0
+        self._culling_margins = (0.0, 0.0) # The biggest extents of the obstacles above and below their y
+        self._screen_window = range(0) # Indexes of the obstacles on the screen, the only ones drawn and with trackers
     
     def update(self, dt: float) -> None:
         for obstacle in self._obstacles:
@@ -28,22 +33,34 @@ class BaseObstaclesManager:
         if self._last_obstacle == None or self._last_obstacle.get_y() - self._player_center[1] > self._player_normal_distance * 3: # Change this "3" later
             self._generate_obstacles()
 
+        self._update_screen_window()
+
     def draw(self, screen: pg.Surface) -> None:
-        for obstacle in self._obstacles:
+        for obstacle in self._obstacles[self._screen_window.start:self._screen_window.stop]:
             if isinstance(obstacle, InvisibleObstacle): # Checkar a transparência do obstáculo invisível
                 obstacle.check_distance(self._player_center, self._player_normal_distance)
 
             obstacle.draw(screen)
 
-    def check_collision(self, player: Player) -> None: # Implement Better
-        player_collided = False
-        for obstacle in self._obstacles:
+    def check_collision(self, player: Player) -> None:
+        reach = player.get_distance() + player.get_radius()
+        window = self._get_window(player.get_center()[1] - reach, player.get_center()[1] + reach)
+        collisions = self._get_collisions(player, self._obstacles[window.start:window.stop])
+
+        for circles_indexes in collisions:
+            CustomEventHandler.post_event(CustomEventList.PLAYERCOLLISION, { "indexes" : circles_indexes })
+        
+        if collisions: self._increase_player_collision_count()
+
+    def _get_collisions(self, player: Player, obstacles: list[Obstacle]) -> list[list[int]]:
+        """Returns the collided circles' indexes of each obstacle that collided with the Player (and paints their stains)."""
+        collisions: list[list[int]] = []
+        for obstacle in obstacles:
             detection, circles_indexes = obstacle.check_collision(player)
             if detection:
-                player_collided = True
-                CustomEventHandler.post_event(CustomEventList.PLAYERCOLLISION, { "indexes" : circles_indexes })
+                collisions.append(circles_indexes)
         
-        if player_collided: self._increase_player_collision_count()
+        return collisions
     
     def resize(self, new_resolution: tuple[int, int], player_center: tuple[int, int], player_normal_distance: int) -> None:
         self._speed = self._speed / self._player_normal_distance * player_normal_distance
@@ -55,6 +72,49 @@ class BaseObstaclesManager:
         self._player_normal_distance = player_normal_distance
         self._actual_resolution = new_resolution
 
+        self._update_culling_margins()
+        self._recheck_screen_window()
+
+    def _get_window(self, top: float, bottom: float) -> range:
+        """Returns the indexes of the obstacles that may overlap the vertical interval [top, bottom].
+
+            The obstacles are kept sorted by y, from the nearest to the Player to the farthest ('_set_base_y'), and all of them move with the same speed,
+            so the candidates are found by bisecting on y, using the biggest extents of the obstacles as margins.
+        """
+        start = bisect_left(self._obstacles, -(bottom + self._culling_margins[0]), key=lambda obstacle: -obstacle.get_y())
+        stop = bisect_right(self._obstacles, -(top - self._culling_margins[1]), lo=start, key=lambda obstacle: -obstacle.get_y())
+        return range(start, stop)
+
+    def _update_culling_margins(self) -> None:
+        above, below = 0.0, 0.0
+        for obstacle in self._obstacles:
+            top, bottom = obstacle.get_vertical_bounds()
+            above = max(above, obstacle.get_y() - top)
+            below = max(below, bottom - obstacle.get_y())
+
+        self._culling_margins = (above + 1, below + 1) # +1 for the rounding of the rects
+
+    def _update_screen_window(self) -> None:
+        """Updates the obstacles on the screen, suspending the trackers of the ones that left it and resuming the ones that entered."""
+        window = self._get_window(0, self._actual_resolution[1])
+
+        for i in self._screen_window:
+            if i not in window:
+                self._obstacles[i].set_tracker_suspended(True)
+        
+        for i in window:
+            if i not in self._screen_window:
+                self._obstacles[i].set_tracker_suspended(False)
+
+        self._screen_window = window
+
+    def _recheck_screen_window(self) -> None:
+        """Rechecks every obstacle, used when they are new or were moved."""
+        self._screen_window = self._get_window(0, self._actual_resolution[1])
+
+        for i, obstacle in enumerate(self._obstacles):
+            obstacle.set_tracker_suspended(i not in self._screen_window)
+
     def _generate_obstacles(self) -> None: ...
     
     def _increase_player_collision_count(self) -> None:
@@ -62,6 +122,7 @@ class BaseObstaclesManager:
     
     def reset(self) -> None:
         self._set_base_y()
+        self._recheck_screen_window()
 
     def _set_base_y(self) -> None:
         for i in range(self._amount_obstacles):
@@ -85,3 +146,5 @@ class BaseObstaclesManager:
             obst.set_color(color)
 
     def get_player_collision_count(self) -> int: return self._player_count_collisions
+
+    def get_amount_possibles_obstacles(self) -> int: return len(self._possibles_obstacles)
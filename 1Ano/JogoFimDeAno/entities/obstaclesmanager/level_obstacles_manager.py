@@ -1,18 +1,19 @@
-from scripts import LEVELS
 from . import BaseObstaclesManager
 from ..achievements import AchievementsHandler
 from ..eventhandler import CustomEventHandler, CustomEventList
+from ..levelpack import LevelPack, LevelPackLoader, LevelObstacleType
 from ..perfection_levels import PerfectionDrawer, PerfectionLevelsHandler
-from copy import deepcopy
 
 class LevelObstaclesManager(BaseObstaclesManager):
-    """An Obstacle Manager that generates pre-defined obstacles (levels)."""
+    """An Obstacle Manager that generates pre-defined obstacles (levels), placed by the precomputed layouts of the level pack."""
     def __init__(self, player_center: tuple[int, int], player_normal_distance: int, player_angular_speed: float, actual_level: int, perfection_checker: PerfectionDrawer) -> None:
         super().__init__(player_center, player_normal_distance, player_angular_speed)
         self._actual_level = max(1, actual_level)
         self._started_level = False
         self._post_event = self._actual_level == 1 # Maybe improve this later
         self._perfection_checker = perfection_checker
+        self._level_pack: LevelPack | None = None # Opened when the first level starts
+        self._layout: list[tuple[int, LevelObstacleType, float, float]] = []
 
     def _generate_obstacles(self) -> None:
         """Load Current Level Obstacles."""
@@ -23,6 +24,7 @@ class LevelObstaclesManager(BaseObstaclesManager):
             PerfectionLevelsHandler.unlock_perfection(self._actual_level-1)
 
         self._obstacles.clear()
+        self._obstacle_pool.release_all()
         self._started_level = True
         # Basically to convert the "standard" obstacles to the new resolution
         self._speed = self._base_obstacles_attrs[2]
@@ -31,23 +33,34 @@ class LevelObstaclesManager(BaseObstaclesManager):
         self._player_center = self._base_obstacles_attrs[0]
         self._player_normal_distance = self._base_obstacles_attrs[1]
 
-        indexes_lvl = LEVELS.get(f"{self._actual_level}")
+        if self._level_pack is None:
+            self._level_pack = LevelPackLoader.get_pack(self._possibles_obstacles, self._base_obstacles_attrs[1])
 
-        if indexes_lvl is None:
+        self._layout = self._level_pack.get_level(self._actual_level)
+
+        if self._layout is None:
             # Raise custom event
             self._actual_level = 1
-            indexes_lvl = LEVELS.get(f"{self._actual_level}")
+            self._layout = self._level_pack.get_level(self._actual_level)
             AchievementsHandler.unlock_achievement(2)
 
         CustomEventHandler.post_event(CustomEventList.NEWLEVELWARNING, {"level" : self._actual_level})
         self._actual_level += 1
 
-        for i in indexes_lvl:
-            self._obstacles.append(deepcopy(self._possibles_obstacles[i]))
+        for template_index, _, _, _ in self._layout:
+            self._obstacles.append(self._obstacle_pool.acquire(template_index))
         
         self._amount_obstacles = len(self._obstacles)
         self._set_base_y()
         self._last_obstacle = self._obstacles[self._amount_obstacles-1]
         self.resize(self._actual_resolution, actual_center, actual_distance)
 
+    def _set_base_y(self) -> None:
+        """Places the obstacles by the level's layout, the same places 'BaseObstaclesManager._set_base_y' computes (see 'compile_level_pack')."""
+        for obstacle, (_, obstacle_type, y_offset, angle) in zip(self._obstacles, self._layout):
+            obstacle.set_y(self._player_center[1] - y_offset * self._player_normal_distance)
+
+            if obstacle_type == LevelObstacleType.ROTATING:
+                obstacle.set_angle(angle)
+
     def get_actual_level(self) -> int: return self._actual_level - 1
@@ -0,0 +1,44 @@
+from ..obstacles import Obstacle
+from copy import deepcopy
+
+class ObstaclePool:
+    """Recycles the obstacles generated from the obstacles managers' templates, with one free list per template.
+
+        The obstacles are only copied ('deepcopy') the first time a template needs more instances than the pool has,
+        after that each generation just resets the released obstacles in place ('Obstacle.reset_from').
+    """
+    def __init__(self, templates: list[Obstacle]) -> None:
+        self._templates = templates
+        self._free_obstacles: list[list[Obstacle]] = [[] for _ in self._templates]
+        self._used_obstacles: list[tuple[int, Obstacle]] = []
+
+    def acquire(self, template_index: int) -> Obstacle:
+        """Returns an obstacle equal to the template of 'template_index'."""
+        free_obstacles = self._free_obstacles[template_index]
+
+        if free_obstacles:
+            obstacle = free_obstacles.pop()
+            obstacle.reset_from(self._templates[template_index])
+        else:
+            obstacle = deepcopy(self._templates[template_index])
+
+        self._used_obstacles.append((template_index, obstacle))
+        return obstacle
+
+    def release(self, obstacle: Obstacle) -> None:
+        """Gives back one acquired obstacle, used when it's no longer needed (an obstacle that left the screen)."""
+        for i, (template_index, used_obstacle) in enumerate(self._used_obstacles):
+            if used_obstacle is obstacle:
+                del self._used_obstacles[i]
+                self._free_obstacles[template_index].append(obstacle)
+                return
+
+    def release_all(self) -> None:
+        """Gives back all the acquired obstacles, used when a new generation (or level) replaces them."""
+        for template_index, obstacle in self._used_obstacles:
+            self._free_obstacles[template_index].append(obstacle)
+
+        self._used_obstacles.clear()
+
+    def get_amount_obstacles(self) -> int:
+        return len(self._used_obstacles) + sum(len(free_obstacles) for free_obstacles in self._free_obstacles)
@@ -0,0 +1,36 @@
+from random import Random
+from typing import Callable
+
+DifficultyCurve = Callable[[int, int], list[float] | None] # (Score, amount of templates) -> weight of each template, None is the same for all
+
+def get_uniform_difficulty(score: int, amount_templates: int) -> list[float] | None:
+    """The default difficulty: every template has the same chance, at any score."""
+    return None
+
+def get_ramping_difficulty(score: int, amount_templates: int, full_score: int = 500) -> list[float] | None:
+    """The later templates of the list (the moving, invisible and grouped ones) get more likely as the score gets to 'full_score'."""
+    ramp = min(score / full_score, 1)
+    return [ 1 + 2 * ramp * i / max(amount_templates - 1, 1) for i in range(amount_templates) ]
+
+class SegmentStream:
+    """Yields the template indexes of the random mode's segments, forever.
+
+        Each segment has 'randint(10, 20)' obstacles (a generation of the old batches), picked by the difficulty at the score of
+        the moment it's needed. All the randomness comes from 'rng', so a seed always gives the same stream to the same player.
+        It's an iterator object instead of a generator so it can be copied with its manager (the replays' snapshots).
+    """
+    def __init__(self, amount_templates: int, rng: Random, difficulty_curve: DifficultyCurve, get_score: Callable[[], int]) -> None:
+        self._amount_templates = amount_templates
+        self._rng = rng
+        self._difficulty_curve = difficulty_curve
+        self._get_score = get_score
+
+    def __iter__(self) -> "SegmentStream": return self
+
+    def __next__(self) -> list[int]:
+        amount = self._rng.randint(10, 20)
+        weights = self._difficulty_curve(self._get_score(), self._amount_templates)
+
+        if weights is None:
+            return [ self._rng.randrange(self._amount_templates) for _ in range(amount) ]
+        return self._rng.choices(range(self._amount_templates), weights, k=amount)
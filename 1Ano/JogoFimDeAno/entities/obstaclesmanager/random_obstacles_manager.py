@@ -1,60 +1,166 @@
 from . import BaseObstaclesManager
-from ..obstacles import Obstacle, get_obstacle_list
+from .obstacle_stream import DifficultyCurve, SegmentStream, get_uniform_difficulty
+from ..obstacles import Obstacle, RotatingObstacle, get_obstacle_list
 from ..eventhandler import CustomEventHandler, CustomEventList
-from copy import deepcopy
-from random import choice, randint
+from random import Random
 from typing import Callable
 
 class RandomObstaclesManager(BaseObstaclesManager):
-    """An Obstacle Manager that generates the obstacles with a random generation."""
-    def __init__(self, player_center: tuple[int, int], player_normal_distance: int, player_angular_speed: float, lives: int, obstacle_list: Callable[..., list[Obstacle]] = get_obstacle_list) -> None:
+    """An Obstacle Manager that streams random obstacles.
+
+        The obstacles come from a seeded stream of segments (see 'SegmentStream') and are placed just in time: the next one
+        appears when its place (right after the last one, like '_set_base_y') gets inside the lookahead, the start distance ahead
+        of the player, and the ones below the screen go back to the pool. So there's no batch nor gap between generations, and the
+        amount of obstacles stays the same in a run of any length.
+
+        Passing the last obstacle of a segment is a checkpoint: a life comes back and, after a collision, the game restarts from
+        the beginning of the current segment (the old generations' behavior).
+    """
+    def __init__(self, player_center: tuple[int, int], player_normal_distance: int, player_angular_speed: float, lives: int, obstacle_list: Callable[..., list[Obstacle]] = get_obstacle_list, seed: int | None = None, difficulty_curve: DifficultyCurve = get_uniform_difficulty) -> None:
         super().__init__(player_center, player_normal_distance, player_angular_speed, obstacle_list)
         self._lives = lives
         self._actual_score = 0
         self._total_score = 0
         self._best_score = 0
         self._max_lives = self._lives
-        
+        self._segments = SegmentStream(len(self._possibles_obstacles), Random(seed), difficulty_curve, self.get_score)
+        self._segment: list[int] = [] # Template indexes of the current segment, the one restarted after a collision
+        self._next_segment: list[int] | None = None # Taken from the stream once the current one is all placed
+        self._emitting: list[int] = [] # The segment being placed (the current or the next one)
+        self._emit_position = 0
+        self._segment_last: Obstacle | None = None # Checkpoint when it passes the player
+        self._next_segment_first: Obstacle | None = None
+        self._segment_traveled = 0.0 # Player's distances traveled since the current segment started
+
+    def update(self, dt: float) -> None:
+        for obstacle in self._obstacles:
+            obstacle.update(dt)
+
+        if not self._segment:
+            self._generate_obstacles()
+
+        self._segment_traveled += self._speed * dt / self._player_normal_distance
+
+        if self._segment_last != None and self._segment_last.get_y() - self._player_center[1] > self._player_normal_distance * 3: # Change this "3" later
+            self._complete_segment()
+
+        self._recycle_obstacles()
+        self._emit_obstacles()
+        self._update_screen_window()
+
+    def reset(self) -> None:
+        self._calculate_actual_score() # The best score is taken before the segment's distance is lost, however often the score is read
+        self._restart_segment()
+
     def _generate_obstacles(self) -> None:
-        """Generate Random Obstacles."""
-        self._calculate_actual_score()
-        self._total_score += self._actual_score
-        self._actual_score = 0
+        """Starts the stream again from a new segment."""
+        self._segment = next(self._segments)
+        self._next_segment = None
+        self._restart_segment()
+
+        CustomEventHandler.post_event(CustomEventList.NEWGENERATIONWARNING)
+
+    def _restart_segment(self) -> None:
+        """Places the current segment again from its beginning, dropping all the obstacles."""
         self._obstacles.clear()
-        # Basically to convert the "standard" obstacles to the new resolution
-        self._speed = self._base_obstacles_attrs[2]
-        actual_center = self._player_center
-        actual_distance = self._player_normal_distance
-        self._player_center = self._base_obstacles_attrs[0]
-        self._player_normal_distance = self._base_obstacles_attrs[1]
+        self._obstacle_pool.release_all()
+        self._segment_traveled = 0
+        self._emitting, self._emit_position = self._segment, 0
+        self._segment_last = self._next_segment_first = None
+
+        self._emit_obstacles()
+        self._recheck_screen_window()
+
+    def _complete_segment(self) -> None:
+        """The checkpoint: the next segment (already coming) becomes the current one and a life comes back."""
+        next_traveled = 0.0 # How much of the next segment was already traveled (the segments overlap on the screen)
+        if self._next_segment_first != None:
+            next_traveled = self._start_distance_mult - (self._player_center[1] - self._next_segment_first.get_y()) / self._player_normal_distance
+
+        self._calculate_actual_score()
+        self._total_score += round(self._segment_traveled - next_traveled)
+        self._segment_traveled = next_traveled
         self._lives = min(3, self._lives + 1) # Maybe change this after
 
-        self._amount_obstacles = randint(10, 20)
-        self._obstacles.append(deepcopy(choice(self._possibles_obstacles)))
+        if self._next_segment is None: # Not reached yet, starts after the current one
+            self._next_segment = next(self._segments)
+            self._emitting, self._emit_position = self._next_segment, 0
 
-        for _ in range(1, self._amount_obstacles): # Maybe integrate with "_set_base_y()"
-            new_obstacle = deepcopy(choice(self._possibles_obstacles))
-            self._obstacles.append(new_obstacle)
-        
-        CustomEventHandler.post_event(CustomEventList.NEWGENERATIONWARNING)
-        
-        self._set_base_y()
-        
-        self._last_obstacle = self._obstacles[self._amount_obstacles-1]
+        self._segment, self._next_segment = self._next_segment, None
+        self._segment_last = self._next_segment_first = None
+
+        CustomEventHandler.post_event(CustomEventList.CHECKPOINTREACHED)
+
+    def _emit_obstacles(self) -> None:
+        """Places the next obstacles of the stream while their places are inside the lookahead."""
+        while True:
+            if self._emit_position >= len(self._emitting):
+                if self._emitting is not self._segment or not self._segment: return # Waits for the checkpoint, at most two segments are out
+
+                if self._next_segment is None:
+                    self._next_segment = next(self._segments)
+                self._emitting, self._emit_position = self._next_segment, 0
+
+            template_index = self._emitting[self._emit_position]
+
+            if self._obstacles:
+                last_obstacle = self._obstacles[-1]
+                spacing = max(last_obstacle.get_spacing_mult(), self._possibles_obstacles[template_index].get_spacing_mult())
+                ahead = (self._player_center[1] - last_obstacle.get_y()) / self._player_normal_distance + spacing
+                if ahead > self._start_distance_mult: return
+            else:
+                ahead = self._start_distance_mult
+
+            obstacle = self._place_obstacle(template_index, ahead)
+
+            if self._emitting is self._segment and self._emit_position == len(self._segment) - 1:
+                self._segment_last = obstacle
+            elif self._emitting is self._next_segment and self._emit_position == 0:
+                self._next_segment_first = obstacle
+
+            self._emit_position += 1
+
+    def _place_obstacle(self, template_index: int, ahead: float) -> Obstacle:
+        """Places a new obstacle 'ahead' player's distances ahead of the player, the same way '_generate_obstacles' did for a batch."""
+        base_center, base_distance = self._base_obstacles_attrs[0], self._base_obstacles_attrs[1]
+
+        obstacle = self._obstacle_pool.acquire(template_index) # Like its template, in the base resolution
+        obstacle.set_y(base_center[1] - ahead * base_distance)
+        if isinstance(obstacle, RotatingObstacle):
+            obstacle.set_angle((ahead % 2) * 90)
+        obstacle.set_new_resolution(self._actual_resolution, (base_center, base_distance), (self._player_center, self._player_normal_distance), self._speed)
+        obstacle.set_tracker_suspended(True) # Above the screen, resumed when it enters ('_update_screen_window')
+
+        top, bottom = obstacle.get_vertical_bounds()
+        self._culling_margins = (max(self._culling_margins[0], obstacle.get_y() - top + 1), max(self._culling_margins[1], bottom - obstacle.get_y() + 1))
+
+        self._obstacles.append(obstacle)
+        self._amount_obstacles = len(self._obstacles)
+        return obstacle
+
+    def _recycle_obstacles(self) -> None:
+        """Gives the obstacles below the screen back to the pool (the nearest ones, at the start of the list)."""
+        amount_recycled = 0
+
+        while self._obstacles and self._obstacles[0] is not self._segment_last and self._obstacles[0] is not self._next_segment_first:
+            if self._obstacles[0].get_vertical_bounds()[0] <= self._actual_resolution[1]: break
+
+            self._obstacle_pool.release(self._obstacles.pop(0))
+            amount_recycled += 1
 
-        self.resize(self._actual_resolution, actual_center, actual_distance)
+        if amount_recycled > 0:
+            self._amount_obstacles = len(self._obstacles)
+            self._screen_window = range(max(0, self._screen_window.start - amount_recycled), max(0, self._screen_window.stop - amount_recycled))
 
     def _calculate_actual_score(self) -> None:
-        if len(self._obstacles) <= 0: self._actual_score = 0
-        else: 
-            self._actual_score = round(self._start_distance_mult - (self._player_center[1] - self._obstacles[0].get_y()) / self._player_normal_distance)
-            self._best_score = max(self._best_score, self._total_score + self._actual_score)
+        self._actual_score = round(self._segment_traveled)
+        self._best_score = max(self._best_score, self._total_score + self._actual_score)
 
     def _increase_player_collision_count(self) -> None:
         self._player_count_collisions += 1
         self._lives -= 1
 
-    def check_player_lost(self) -> bool: 
+    def check_player_lost(self) -> bool:
         """Returns if the remaining lives are less than or equal to 0."""
         return self._lives <= 0
 
@@ -66,11 +172,11 @@ class RandomObstaclesManager(BaseObstaclesManager):
         self._best_score = 0
         self._player_count_collisions = 0
 
-    def get_score(self) -> int: 
+    def get_score(self) -> int:
         self._calculate_actual_score()
         return self._total_score + self._actual_score
 
-    def get_best_score(self) -> int: 
+    def get_best_score(self) -> int:
         self._calculate_actual_score()
         return self._best_score
 
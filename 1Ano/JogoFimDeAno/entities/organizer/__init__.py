@@ -1,2 +1,8 @@
 from .organizer import *
-from .levels_organizer import *
+
+def __getattr__(name: str):
+    if name == "LevelsOrganizer": # Only the levels' window uses it, so it's imported on the first use
+        from .levels_organizer import LevelsOrganizer
+        return LevelsOrganizer
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
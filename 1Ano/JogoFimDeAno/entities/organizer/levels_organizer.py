@@ -1,89 +1,139 @@
 import pygame as pg
 import pygame.freetype as pgft
-from scripts import scale_dimension, scale_position, BASE_RESOLUTION, LEVELS, convert_decimal_to_roman
+from scripts import scale_dimension, scale_position, BASE_RESOLUTION
 from ..buttons import LevelButton
+from ..inputhandler import InputHandler
+from ..levelpack import LevelPackLoader
+from ..render import DirtyTracker
 from math import ceil
 from typing import Callable
 
 class LevelsOrganizer:
-    """A big surface that organizes the level buttons."""
-    def __init__(self, width: int, midtop: tuple[int, int], level_button_width: int, max_amount_line: int, level_button_event: Callable[[int], Callable[..., None]], font: pgft.Font, amount: int = len(LEVELS)) -> None:
+    """A grid that organizes the level buttons, scrolled by the mouse wheel.
+
+        The grid is virtualized: only the buttons of the rows inside the screen exist (created when their row enters the view
+        and dropped when it leaves), and a click is mapped to its level by the grid's arithmetic instead of being sent to
+        every button. So drawing, scrolling and clicking cost the same with 12 or 10k levels.
+    """
+    def __init__(self, width: int, midtop: tuple[int, int], level_button_width: int, max_amount_line: int, level_button_event: Callable[[int], Callable[..., None]], font: pgft.Font, amount: int | None = None) -> None:
         if level_button_width * max_amount_line > width: raise ValueError("Levels Organizer : The Width of the Level Buttons cannot be Greater than the Width of the Level Organizer!")
-        
-        self._amount = amount
+
+        self._amount = amount if amount != None else LevelPackLoader.get_pack().get_amount_levels()
         self._width = width
         self._midtop = midtop
         self._button_width = level_button_width
         self._button_max = max_amount_line
-        self._gap = (self._width - self._button_width * self._button_max) / (self._button_max + 1)
-        self._buttons: list[LevelButton] = []
         self._level_button_function = level_button_event
         self._font = font
-        self._surface = self._create_surface()
         self._mouse_wheel_speed = 5
+        self._dirty_tracker = DirtyTracker()
+        self._actual_resolution = BASE_RESOLUTION
+        self._create_layout()
 
         self._base_values = [self._width, self._midtop, self._button_width, self._mouse_wheel_speed]
-        self._actual_resolution = BASE_RESOLUTION
 
     def draw(self, screen: pg.Surface) -> None:
-        screen.blit(self._surface, self._surface.get_rect(midtop=self._midtop))
-    
+        rect = self._get_rect()
+        first_row, last_row = self._get_visible_rows(rect.top, screen.height)
+        self._materialize_rows(first_row, last_row)
+
+        screen.fblits([
+            (self._buttons[level].get_surface(), (rect.left + self._columns_x[(level - 1) % self._button_max], rect.top + self._rows_y[row]))
+            for row in range(first_row, last_row + 1) for level in self._get_row_levels(row)
+        ])
+
     def update_by_event(self, event: pg.Event) -> None:
-        for btn in self._buttons:
-            btn.update_by_event(event)
+        if event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
+            level = self._get_level_at(event.pos)
+            if level != None:
+                self._level_button_function(level)()
 
         if event.type == pg.VIDEORESIZE:
             self.resize(event.size)
-        
-        if event.type == pg.MOUSEWHEEL and self._surface.get_rect(midtop=self._midtop).collidepoint(pg.mouse.get_pos()):
+
+        if event.type == pg.MOUSEWHEEL and self._get_rect().collidepoint(InputHandler.get_mouse_pos()):
             self._moving_y(event.y)
 
     def resize(self, new_resolution: tuple[int, int]) -> None:
         self._width = scale_dimension(self._base_values[0], new_resolution)
         self._midtop = scale_position(self._base_values[1], BASE_RESOLUTION, new_resolution)
         self._button_width = round(self._base_values[2] / self._base_values[0] * self._width)
-        self._gap = (self._width - self._button_width * self._button_max) / (self._button_max + 1)
         self._mouse_wheel_speed = round(self._base_values[3] / self._base_values[0] * self._width)
         self._actual_resolution = new_resolution
-        self._surface = self._create_surface()
-
-    def _create_surface(self) -> pg.Surface:
-        surf = pg.Surface((self._width, self._button_width * ceil(self._amount / 3) + self._gap * (1 + ceil(self._amount / 3))))
-        surf.set_colorkey((0, 0, 0))
-
-        surf_topleft = surf.get_rect(midtop=self._midtop).topleft
-        start_pos = [self._gap, self._gap]
-
-        for i in range(self._amount):
-            btn_event = self._level_button_function(i+1)
-            btn = LevelButton(
-                self._button_width,
-                i+1,
-                btn_event,
-                (255, 255, 255),
-                (0, 0, 0),
-                self._button_width // 15,
-                self._font,
-                self._button_width // 2,
-                [start_pos[i] + surf_topleft[i] for i in range(2)]
-            )
-            self._buttons.append(btn)
-
-            surf.blit(btn.get_surface(), start_pos)
-
-            start_pos[0] += self._button_width + self._gap # Next button will be more to the left
-
-            if start_pos[0] >= self._button_max * self._button_width + (self._button_max + 1) * self._gap: # If exceeds the max amount per line will be more down
-                start_pos[0] = self._gap
-                start_pos[1] += self._button_width + self._gap
-        
-        return surf
+        self._create_layout()
+        self._dirty_tracker.mark()
+
+    def get_dirty_rects(self) -> list[pg.Rect]: return self._dirty_tracker.collect(self._get_rect().clip(pg.Rect((0, 0), self._actual_resolution)))
+
+    def _create_layout(self) -> None:
+        """Computes the grid's columns and rows (relative to its top left), the buttons are created again when drawn."""
+        self._gap = (self._width - self._button_width * self._button_max) / (self._button_max + 1)
+        self._step = self._button_width + self._gap
+        self._amount_rows = ceil(self._amount / self._button_max)
+        self._height = int(self._button_width * self._amount_rows + self._gap * (1 + self._amount_rows))
+        self._columns_x = [ int(self._gap + i * self._step) for i in range(self._button_max) ]
+        self._rows_y: dict[int, int] = {} # Only the rows drawn, see '_materialize_rows'
+        self._buttons: dict[int, LevelButton] = {} # Level -> button of the rows inside the screen
+        self._first_row, self._last_row = 0, -1
+
+    def _get_rect(self) -> pg.Rect:
+        return pg.Rect((0, 0), (self._width, self._height)).move_to(midtop=self._midtop)
+
+    def _get_visible_rows(self, top: int, screen_height: int) -> tuple[int, int]:
+        """Returns the first and the last rows inside the screen, with the grid's top at 'top' (the last is smaller if none is)."""
+        first_row = max(0, int((-top - self._gap) // self._step))
+        last_row = min(self._amount_rows - 1, int((screen_height - top - self._gap) // self._step))
+        return (first_row, last_row)
+
+    def _materialize_rows(self, first_row: int, last_row: int) -> None:
+        """Creates the buttons of the rows entering the screen and drops the ones of the rows that left it."""
+        if (first_row, last_row) == (self._first_row, self._last_row): return
+
+        for row in range(self._first_row, self._last_row + 1):
+            if first_row <= row <= last_row: continue
+            self._rows_y.pop(row, None)
+            for level in self._get_row_levels(row):
+                self._buttons.pop(level, None)
+
+        for row in range(first_row, last_row + 1):
+            if row in self._rows_y: continue
+            self._rows_y[row] = int(self._gap + row * self._step)
+            for level in self._get_row_levels(row):
+                self._buttons[level] = LevelButton(
+                    self._button_width,
+                    level,
+                    (255, 255, 255),
+                    (0, 0, 0),
+                    self._button_width // 15,
+                    self._font,
+                    self._button_width // 2
+                )
+                self._buttons[level].get_surface().set_colorkey((0, 0, 0)) # The buttons' background is transparent
+
+        self._first_row, self._last_row = first_row, last_row
+
+    def _get_row_levels(self, row: int) -> range:
+        return range(row * self._button_max + 1, min((row + 1) * self._button_max, self._amount) + 1)
+
+    def _get_level_at(self, pos: tuple[int, int]) -> int | None:
+        """Returns the level whose button is at 'pos' (on the screen), or None if it's a gap or outside the grid."""
+        rect = self._get_rect()
+        x, y = pos[0] - rect.left, pos[1] - rect.top
+        column, row = int((x - self._gap + 1) // self._step), int((y - self._gap + 1) // self._step) # '+ 1' as the buttons' positions are truncated
+
+        if not (0 <= column < self._button_max and 0 <= row < self._amount_rows): return None
+
+        button_x, button_y = self._columns_x[column], int(self._gap + row * self._step)
+        if not (button_x <= x < button_x + self._button_width and button_y <= y < button_y + self._button_width): return None # In a gap
+
+        level = row * self._button_max + column + 1
+        return level if level <= self._amount else None
 
     def _moving_y(self, mouse_wheel_value: int) -> None:
-        """Moves the surface in the 'y' direction in relation to the mouse wheel button (UP or DOWN)."""
-        if self._surface.height <= self._actual_resolution[1]: return
+        """Moves the grid in the 'y' direction in relation to the mouse wheel button (UP or DOWN)."""
+        if self._height <= self._actual_resolution[1]: return
         if mouse_wheel_value > 0 and self._midtop[1] >= 0: return
-        if mouse_wheel_value < 0 and self._surface.get_rect(midtop=self._midtop).bottom < self._actual_resolution[1]: return
+        if mouse_wheel_value < 0 and self._get_rect().bottom < self._actual_resolution[1]: return
 
         shiftness = abs(self._mouse_wheel_speed * mouse_wheel_value)
 
@@ -91,6 +141,4 @@ class LevelsOrganizer:
             shiftness *= -1
 
         self._midtop = (self._midtop[0], self._midtop[1] + shiftness)
-
-        for btn in self._buttons:
-            btn.increase_y(shiftness)
+        self._dirty_tracker.mark()
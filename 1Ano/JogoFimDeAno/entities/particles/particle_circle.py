@@ -1,4 +1,5 @@
 import pygame as pg
+from ..sprites import SpriteCache
 from scripts import scale_dimension
 from math import cos, sin, radians
 
@@ -31,10 +32,7 @@ class CircleParticle:
     def _draw_brightness(self, screen: pg.Surface) -> None:
         brightness_rad = round(self._radius * 1.5)
 
-        surf = pg.Surface((brightness_rad * 2, brightness_rad * 2))
-        surf.set_colorkey((0, 0, 0))
-        surf.set_alpha(100)
-        pg.draw.circle(surf, self._color, (brightness_rad, brightness_rad), brightness_rad)
+        surf = SpriteCache.get_circle(brightness_rad, self._color, 100)
 
         screen.blit(surf, surf.get_rect(center=[round(i) for i in self._pos]))
     
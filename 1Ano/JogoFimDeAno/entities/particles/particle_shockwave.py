@@ -1,4 +1,5 @@
 import pygame as pg
+from ..sprites import SpriteCache
 from scripts import scale_dimension
 
 class ShockwaveParticle:
@@ -28,10 +29,7 @@ class ShockwaveParticle:
     def _draw_shadow(self, screen: pg.Surface) -> None:
         shadow_rad = round(self._radius * 0.9) # Makes the "Inner Shadow" farther than the normal radius 
 
-        surf = pg.Surface((shadow_rad * 2, shadow_rad * 2))
-        surf.set_colorkey((0, 0, 0))
-        surf.set_alpha(100)
-        pg.draw.circle(surf, self._color, (shadow_rad, shadow_rad), shadow_rad, round(self._width * 2))
+        surf = SpriteCache.get_circle(shadow_rad, self._color, 100, round(self._width * 2))
 
         screen.blit(surf, surf.get_rect(center=[round(i) for i in self._pos]))
     
@@ -1,24 +1,26 @@
 import pygame as pg
 import pygame.freetype as pgft
-from scripts import scale_dimension, scale_position, BASE_RESOLUTION, FONT, LEVELS_PERFECTION
+from ..inputhandler import InputHandler
+from ..text import TextRenderer
+from scripts import scale_dimension, scale_position, BASE_RESOLUTION, get_font, get_levels_perfection
 from math import sin, cos, pi
 from random import uniform
 from typing import Callable
 
 class PerfectionDrawer:
-    def __init__(self, center: tuple[int, int], radius: int, perfect_color: tuple[int, int, int], imperfect_color: tuple[int, int, int], text_color: tuple[int, int, int], current_level: int, angular_speed: float = uniform(-2 * pi, 2 * pi), difference_expansion: float = 0, repetition_time: float = 0, font: pgft.Font = FONT) -> None:
+    def __init__(self, center: tuple[int, int], radius: int, perfect_color: tuple[int, int, int], imperfect_color: tuple[int, int, int], text_color: tuple[int, int, int], current_level: int, angular_speed: float = uniform(-2 * pi, 2 * pi), difference_expansion: float = 0, repetition_time: float = 0, font: pgft.Font | None = None) -> None:
         self._center = center
         self._radius = radius
         self._current_radius = self._radius
         self._colors = (perfect_color, imperfect_color, text_color)
         self._is_perfect = True
         self._triangle_color = self._colors[0]
-        self._movements = LEVELS_PERFECTION.get(str(current_level))
+        self._movements = get_levels_perfection().get(str(current_level))
         self._expansion_form = self._get_difference_expansion(difference_expansion, repetition_time)
         self._angle = 0.0
         self._time = 0
         self._angular_speed = angular_speed
-        self._font = font
+        self._font = font if font != None else get_font()
         self._saves_values = (self._center, difference_expansion, repetition_time, self._radius)
         self._text = self._generate_text()
     
@@ -40,13 +42,13 @@ class PerfectionDrawer:
         self._text = self._generate_text()
 
     def _generate_text(self) -> tuple[pg.Surface, pg.Rect]:
-        text_surf, text_rect = self._font.render(str(self._movements), self._colors[2], style=pgft.STYLE_STRONG, size=self._radius//2)
+        text_surf, text_rect = TextRenderer.render(self._font, str(self._movements), self._colors[2], self._radius//2, pgft.STYLE_STRONG)
         text_rect.center = self._center
         return text_surf, text_rect
 
     def check_movements(self) -> None:
-        keys = pg.key.get_pressed()
-        mouse = pg.mouse.get_pressed()
+        keys = InputHandler.get_pressed_keys()
+        mouse = InputHandler.get_mouse_pressed()
 
         if mouse[0] or keys[pg.K_a] or keys[pg.K_d] or keys[pg.K_SPACE] or keys[pg.K_LSHIFT]:
             self.update_movements()
@@ -66,7 +68,7 @@ class PerfectionDrawer:
         self._angular_speed = uniform(-2 * pi, 2 * pi)
     
     def reset(self, new_level: int) -> None:
-        self._movements = LEVELS_PERFECTION.get(str(new_level))
+        self._movements = get_levels_perfection().get(str(new_level))
         self._triangle_color = self._colors[0]
         self._is_perfect = True
         self._text = self._generate_text()
@@ -1,19 +1,27 @@
-from scripts import get_file_path, LEVELS_PERFECTION_UNLOCKED
+from scripts import get_file_path, get_levels_perfection_unlocked
 from ..achievements import AchievementsHandler
-from json import dump as json_dump
+from ..save import SaveStore
 
 class PerfectionLevelsHandler:
     """Class with methods to handle the perfection level's logic."""
-    @staticmethod
-    def unlock_perfection(level: int) -> None:
-        """Unlock and edit the json file keeping the player perfection levels progress."""
-        if LEVELS_PERFECTION_UNLOCKED.get(str(level)) == None: # Level doesn't exist
+    _save_progress = True
+
+    @classmethod
+    def unlock_perfection(self, level: int) -> None:
+        """Unlock and save (in the background, see 'SaveStore') the json file keeping the player perfection levels progress."""
+        levels_perfection_unlocked = get_levels_perfection_unlocked()
+        if levels_perfection_unlocked.get(str(level)) == None: # Level doesn't exist
             raise IndexError(f"PerfectionLevelsHandler: Unknown Level: {level}")
-        elif LEVELS_PERFECTION_UNLOCKED[str(level)]: return # level already unlocked
+        elif levels_perfection_unlocked[str(level)]: return # level already unlocked
 
-        LEVELS_PERFECTION_UNLOCKED[str(level)] = True
-        with open(get_file_path("../data/player_perfection_levels.json"), "w", encoding="utf-8") as file: # Modern way to write a file.
-            json_dump(LEVELS_PERFECTION_UNLOCKED, file, ensure_ascii=False, indent=4)
+        levels_perfection_unlocked[str(level)] = True
+        if self._save_progress:
+            SaveStore.save(get_file_path("../data/player_perfection_levels.json"), levels_perfection_unlocked)
         
-        if all(LEVELS_PERFECTION_UNLOCKED.values()):
+        if all(levels_perfection_unlocked.values()):
             AchievementsHandler.unlock_achievement(7)
+
+    @classmethod
+    def set_save_progress(self, save: bool) -> None:
+        """Enables or disables writing the perfect levels to the json file (disabled by the headless simulations)."""
+        self._save_progress = save
@@ -1,8 +1,10 @@
 import pygame as pg
 from ..eventhandler import CustomEventList
+from ..inputhandler import InputHandler
 from ..particles import ParticleManager
-from scripts import scale_dimension, scale_position, BASE_RESOLUTION, get_diagonal_line
-from collections import deque
+from ..sprites import SpriteCache
+from ..trail import TrailHistory, TrailRenderer
+from scripts import scale_dimension, scale_position, BASE_RESOLUTION
 from enum import IntEnum
 from math import sqrt, radians, sin, cos
 
@@ -33,13 +35,13 @@ class Player:
         self._show_border = True
         self._border_size = border_size
         self._border_color = (30, 30, 30)
-        self._positions_tracker: list[deque[tuple[float, float]]] = [deque() for _ in range(self._amount)]
-        self._positions_tracker_times: list[deque[float]] = [deque() for _ in range(self._amount)]
-        self._positions_tracker_formulas: list[deque[list[float]]] = [deque() for _ in range(self._amount)] # Tuple with: angle, distance proportion and time
         self._positions_tracker_lifetime: float = 0.5 # seconds
+        self._positions_tracker: list[TrailHistory] = [TrailHistory(self._positions_tracker_lifetime) for _ in range(self._amount)] # Positions relative to the center, in normal distances
         self._tracker_speed_multipler = 6 # radii of the circles
         self._tracker_speed = self._tracker_speed_multipler * self._radius / self._positions_tracker_lifetime
         self._initial_tracker_alpha = 127
+        self._trail_renderer = TrailRenderer(self._initial_tracker_alpha)
+        self._intersection_surface = pg.Surface((0, 0))
         self._base_distance = self._normal_distance
         self._base_radius_distance_proportion = self._radius / self._base_distance
         self._base_border_size = self._border_size
@@ -50,7 +52,8 @@ class Player:
         self._particles: list[ParticleManager] = []
     
     def update(self, dt: float) -> None:
-        key = pg.key.get_pressed()
+        key = InputHandler.get_pressed_keys()
+        mouse_pressed = InputHandler.get_mouse_pressed()[0]
 
         linear_speed = self._linear_speed * dt
         
@@ -73,9 +76,9 @@ class Player:
             elif self._distance < 0:
                 self._distance = 0
 
-            if key[Keys.ROTATELEFT] or (pg.mouse.get_pressed()[0] and pg.mouse.get_pos()[0] < self._center[0]): 
+            if key[Keys.ROTATELEFT] or (mouse_pressed and InputHandler.get_mouse_pos()[0] < self._center[0]): 
                 self._angle -= self._angular_speed * dt
-            if key[Keys.ROTATERIGHT] or (pg.mouse.get_pressed()[0] and pg.mouse.get_pos()[0] > self._center[0]): 
+            if key[Keys.ROTATERIGHT] or (mouse_pressed and InputHandler.get_mouse_pos()[0] > self._center[0]): 
                 self._angle += self._angular_speed * dt
         else: # If the player doesn't control itself, so it's a background, just rotate...
             self._angle += self._angular_speed * dt
@@ -96,8 +99,9 @@ class Player:
                     j.draw(screen)
                 continue
 
-            pos = [ round(j) for j in self._positions[i] ]
-            pg.draw.circle(screen, self._colors[i], pos, self._radius)
+            radius = round(self._radius)
+            circle = SpriteCache.get_circle(radius, self._colors[i])
+            screen.blit(circle, (round(self._positions[i][0]) - radius, round(self._positions[i][1]) - radius))
 
         self._draw_intersection(screen)
     
@@ -123,69 +127,40 @@ class Player:
 
     def _update_tracker(self, dt: float) -> None:
         for i in range(self._amount):
-            len_pos = len(self._positions_tracker[i])
-            for j in range(len_pos):
-                self._positions_tracker[i][j][1] += self._tracker_speed * dt if self._gravity else 0
-                self._positions_tracker_times[i][j] -= dt
-                self._positions_tracker_formulas[i][j][2] += dt
-            
-            self._positions_tracker[i].append(self._positions[i].copy())
-            self._positions_tracker_times[i].append(self._positions_tracker_lifetime)
-            self._positions_tracker_formulas[i].append([radians(self._angle + self._d_angle * i), self._distance / self._normal_distance, 0])
-            
-            remove_to = next((j for j, e in enumerate(self._positions_tracker_times[i]) if e > 0), len_pos)
-            for _ in range(remove_to):
-                self._positions_tracker[i].popleft()
-                self._positions_tracker_times[i].popleft()
-                self._positions_tracker_formulas[i].popleft()
+            proportion = self._distance / self._normal_distance
+            angle = radians(self._angle + self._d_angle * i)
+
+            self._positions_tracker[i].advance(dt)
+            self._positions_tracker[i].record((proportion * cos(angle), proportion * sin(angle)))
         
     def _draw_tracker(self, screen: pg.Surface) -> None:
         """Draws the Tracker on the screen.
 
             Draws the Tracker on the screen with a line of the circle's previous positions becoming increasingly transparent. 
-            It also uses diagonal lines to connect the positions.
-
-            Args:
-                points (list[tuple]): Previous positions of the circle's center.
-                initial_radius (int): Initial radius of the line.
-                initial_color (tuple): Line color.
-                initial_alpha (int): Initial alpha of the line.
+            It also uses diagonal lines to connect the positions. The drawing itself is done by the 'TrailRenderer', that reuses its surface between frames.
         """
         if len(self._positions_tracker[0]) < 2: return
 
-        for i in range(len(self._positions_tracker)):
-            topleft_extreme = [0, 0]
-            bottomright_extreme = [0, 0]
-            for j, coords in zip(range(2), zip(*self._positions_tracker[i])):
-                topleft_extreme[j] = round(min(coords) - self._radius)
-                bottomright_extreme[j] = round(max(coords) + self._radius)
-
-            offset = [ k - j for j, k in zip(topleft_extreme, bottomright_extreme) ]
-            surf_tracker = pg.Surface(offset, flags=pg.SRCALPHA)
-
-            points = [ (round(j[0] - topleft_extreme[0]), round(j[1] - topleft_extreme[1])) for j in self._positions_tracker[i] ]
-            len_points = len(points)
-            points_radii = [ round(self._radius / len_points * j) for j in range(len_points) ]
-            
-            for j in range(len_points):
-                color_alpha = round(self._initial_tracker_alpha / len_points * j)
-                color = (*self._colors[i], color_alpha)
+        gravity_speed = self._tracker_speed if self._gravity else 0
 
-                pg.draw.circle(surf_tracker, color, points[j], points_radii[j])
-                if j != 0:
-                    pg.draw.polygon(surf_tracker, color, get_diagonal_line(points[j-1], points_radii[j-1], points[j], points_radii[j]))
-            
-            screen.blit(surf_tracker, topleft_extreme)
+        for i in range(len(self._positions_tracker)):
+            points = [
+                (pos[0] * self._normal_distance + self._center[0], pos[1] * self._normal_distance + self._center[1] + gravity_speed * age)
+                for pos, age in self._positions_tracker[i].items()
+            ]
+            self._trail_renderer.draw(screen, points, self._radius, self._colors[i])
             
     def _draw_intersection(self, screen: pg.Surface) -> None:
         if self._amount < 2 or not self._check_circles_collided(): return
         
         radius = round(self._radius)
         distance = round(self._distance)
-        
-        surf_player = pg.Surface([(distance + radius) * 2] * 2)
-        surf_player.fill((0, 0, 0))
-        surf_player.set_colorkey((0, 0, 0))
+        size = (distance + radius) * 2
+
+        if self._intersection_surface.size != (size, size): # Only recreated when the distance or the radius changes
+            self._intersection_surface = pg.Surface((size, size))
+            self._intersection_surface.set_colorkey((0, 0, 0))
+        self._intersection_surface.fill((0, 0, 0))
 
         topleft_offset = [ round(i - distance) for i in self._center ]
         offset_positions = [ [ round(i[j] - topleft_offset[j]) for j in range(2) ] for i in self._positions ]
@@ -193,12 +168,9 @@ class Player:
         for i in range(self._amount):
             if i in self._indexes_particles: continue
 
-            surf = pg.Surface([radius * 2] * 2)
-            surf.fill((0, 0, 0))
-            pg.draw.circle(surf, self._colors[i], (radius, radius), radius)
-            surf_player.blit(surf, offset_positions[i], special_flags=pg.BLEND_ADD)
+            self._intersection_surface.blit(SpriteCache.get_circle(radius, self._colors[i]), offset_positions[i], special_flags=pg.BLEND_ADD)
         
-        screen.blit(surf_player, (topleft_offset[0] - radius, topleft_offset[1] - radius))
+        screen.blit(self._intersection_surface, (topleft_offset[0] - radius, topleft_offset[1] - radius))
 
     def _check_circles_collided(self) -> bool:
         return sqrt((self._positions[0][0] - self._positions[1][0]) ** 2 + (self._positions[0][1] - self._positions[1][1]) ** 2) < self._radius * 2
@@ -210,6 +182,8 @@ class Player:
             for p in self._particles
         ]
 
+        SpriteCache.resize(new_resolution)
+
         self._center = scale_position(self._center, self._actual_resolution, new_resolution)
         self._distance /= self._normal_distance
         self._linear_speed /= self._normal_distance
@@ -221,7 +195,6 @@ class Player:
         self._tracker_speed = self._tracker_speed_multipler * self._radius / self._positions_tracker_lifetime
         self._border_size = scale_dimension(self._base_border_size, new_resolution)
         self._rotate_to_center()
-        self._reposition_tracker()
         self._actual_resolution = new_resolution
 
         for i in range(len(particles_new_pos)):
@@ -230,14 +203,16 @@ class Player:
         for p, pos in zip(self._particles, particles_new_pos):
             p.resize(pos, new_resolution)
     
-    def _reposition_tracker(self) -> None:
-        for i in range(self._amount):
-            for j in range(len(self._positions_tracker[i])):
-                ang = self._positions_tracker_formulas[i][j][0]
-                dist = self._positions_tracker_formulas[i][j][1] * self._normal_distance
-                dt = self._positions_tracker_formulas[i][j][2]
-                self._positions_tracker[i][j][0] = round(dist * cos(ang) + self._center[0])
-                self._positions_tracker[i][j][1] = round(dist * sin(ang) + self._center[1] + self._tracker_speed * dt)
+    def get_dirty_rects(self) -> list[pg.Rect]:
+        """Returns the area the Player can draw on (used by the 'DirtyRectRenderer'), always dirty as the Player never stops."""
+        reach = self._max_distance + self._radius + self._border_size
+        rect = pg.Rect(0, 0, reach * 2 + 2, reach * 2 + 2)
+        rect.center = self._center
+
+        if self._gravity: # The tracker falls below the Player
+            rect.height += self._tracker_speed * self._positions_tracker_lifetime
+
+        return [rect]
 
     def add_lost_particles(self, indexes: list[int]) -> None:
         self._indexes_particles.update(indexes)
@@ -0,0 +1,3 @@
+from .frame_profiler import *
+from .profiler_overlay import *
+from .startup_profiler import *
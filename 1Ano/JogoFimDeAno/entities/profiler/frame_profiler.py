@@ -0,0 +1,135 @@
+from collections import deque
+from json import dump as json_dump
+from time import perf_counter_ns
+
+class ProfilerPhase:
+    """Context manager that times a named phase of the frame ('with FrameProfiler.phase("player"): ...')."""
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._start = 0
+
+    def __enter__(self) -> None:
+        if FrameProfiler.is_enabled():
+            self._start = perf_counter_ns()
+
+    def __exit__(self, *exception_info) -> None:
+        if self._start:
+            FrameProfiler.add_phase_time(self._name, self._start, perf_counter_ns())
+            self._start = 0
+
+class FrameProfiler:
+    """Times the phases of each frame (events, player, obstacles, collision...), keeping the last frames to the 'ProfilerOverlay'.
+
+        A phase can run more than once in a frame (an update and a draw), its times are summed. While disabled the phases cost just
+        a check, and while tracing every phase is also kept as an event of the Chrome trace format (chrome://tracing, Perfetto).
+    """
+    _enabled = False
+    _window = 240 # Frames kept for the percentiles
+    _phases: dict[str, ProfilerPhase] = {}
+    _frame_times: dict[str, int] = {} # Nanoseconds of each phase in the current frame
+    _history: dict[str, deque[float]] = {} # Milliseconds of each phase in the last frames
+    _frame_start = 0
+    _tracing = False
+    _trace_start = 0
+    _trace_events: list[dict[str, str | int | float]] = []
+    _max_trace_events = 500000
+
+    @classmethod
+    def phase(self, name: str) -> ProfilerPhase:
+        phase = self._phases.get(name)
+        if phase is None:
+            phase = self._phases[name] = ProfilerPhase(name)
+        return phase
+
+    @classmethod
+    def start_frame(self) -> None:
+        if not self._enabled: return
+
+        self._frame_start = perf_counter_ns()
+        self._frame_times.clear()
+
+    @classmethod
+    def end_frame(self) -> None:
+        """Keeps the times of the frame, the phases that didn't run in it count as 0 ms."""
+        if not self._enabled or not self._frame_start: return
+
+        end = perf_counter_ns()
+        self._frame_times["frame"] = end - self._frame_start
+        self._add_trace_event("frame", self._frame_start, end)
+
+        for name in self._frame_times: # New phases are kept in the order they ran
+            if name not in self._history:
+                self._history[name] = deque(maxlen=self._window)
+
+        for name, history in self._history.items():
+            history.append(self._frame_times.get(name, 0) / 1e6)
+
+        self._frame_start = 0
+
+    @classmethod
+    def add_phase_time(self, name: str, start: int, end: int) -> None:
+        self._frame_times[name] = self._frame_times.get(name, 0) + end - start
+        self._add_trace_event(name, start, end)
+
+    @classmethod
+    def get_stats(self) -> dict[str, tuple[float, float]]:
+        """Returns the rolling (p50, p99) of each phase, in milliseconds, in the order the phases first ran ("frame" is the whole frame)."""
+        stats: dict[str, tuple[float, float]] = {}
+
+        for name, history in self._history.items():
+            if not history: continue
+
+            times = sorted(history)
+            stats[name] = (times[len(times) // 2], times[min(len(times) - 1, round(0.99 * (len(times) - 1)))])
+
+        return stats
+
+    @classmethod
+    def set_enabled(self, enabled: bool) -> None:
+        """Enables or disables the profiler (disabling also stops the tracing), the history restarts when it's enabled again."""
+        if enabled and not self._enabled:
+            self._history.clear()
+
+        self._enabled = enabled
+        self._frame_start = 0
+        self._tracing = self._tracing and enabled
+
+    @classmethod
+    def is_enabled(self) -> bool: return self._enabled
+
+    @classmethod
+    def start_trace(self) -> None:
+        """Starts keeping the phases as trace events (enabling the profiler)."""
+        if not self._enabled: self.set_enabled(True)
+
+        self._tracing = True
+        self._trace_start = perf_counter_ns()
+        self._trace_events = []
+
+    @classmethod
+    def stop_trace(self, path: str) -> int:
+        """Stops the tracing and saves the events in 'path' as a Chrome trace JSON file, returning the amount of events."""
+        self._tracing = False
+
+        with open(path, "w", encoding="utf-8") as file:
+            json_dump({ "traceEvents" : self._trace_events, "displayTimeUnit" : "ms" }, file)
+
+        amount_events = len(self._trace_events)
+        self._trace_events = []
+        return amount_events
+
+    @classmethod
+    def is_tracing(self) -> bool: return self._tracing
+
+    @classmethod
+    def _add_trace_event(self, name: str, start: int, end: int) -> None:
+        if not self._tracing or start < self._trace_start or len(self._trace_events) >= self._max_trace_events: return # Only what started after the trace
+
+        self._trace_events.append({ # A "complete" event, the times are in microseconds
+            "name" : name,
+            "ph" : "X",
+            "ts" : (start - self._trace_start) / 1000,
+            "dur" : (end - start) / 1000,
+            "pid" : 1,
+            "tid" : 1 # The phases are nested in their frame
+        })
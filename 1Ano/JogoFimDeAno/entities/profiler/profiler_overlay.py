@@ -0,0 +1,116 @@
+import pygame as pg
+import pygame.freetype as pgft
+from .frame_profiler import FrameProfiler
+from ..text import TextRenderer
+from scripts import scale_position, scale_dimension, get_file_path, BASE_RESOLUTION, COLORS
+from os.path import basename
+from time import strftime
+
+class ProfilerKeys:
+    TOGGLEOVERLAY = pg.K_F3
+    TOGGLETRACE = pg.K_F4
+
+class ProfilerOverlay:
+    """Panel with the rolling p50 and p99 of each frame phase of the 'FrameProfiler'.
+
+        F3 shows (and enables the profiler) or hides it, F4 starts recording a Chrome trace and saves it in the game's folder when pressed again.
+        The phases whose p99 is over the frame budget ('set_frame_budget') are shown in red, and below them the most expensive rebuilds
+        of the last resizes ('set_rebuild_costs'). The text is only rendered a few times per second.
+    """
+    def __init__(self, font: pgft.Font, pos: tuple[int, int], pos_attr: str = "topleft", size: float = 14, refresh_time: float = 0.25) -> None:
+        self._font = font
+        self._pos = pos
+        self._pos_attr = pos_attr
+        self._size = size
+        self._refresh_time = refresh_time
+        self._time_to_refresh = 0.0
+        self._visible = False
+        self._frame_budget: float | None = None
+        self._message = ""
+        self._rebuild_costs: dict[str, tuple[float, float]] = {}
+        self._surface = pg.Surface((0, 0))
+        self._rect = self._surface.get_rect()
+        self._base_pos = self._pos
+        self._base_size = self._size
+
+    def update_by_event(self, event: pg.event.Event) -> None:
+        if event.type != pg.KEYDOWN: return
+
+        if event.key == ProfilerKeys.TOGGLEOVERLAY:
+            self._visible = not self._visible
+            FrameProfiler.set_enabled(self._visible or FrameProfiler.is_tracing())
+            self._time_to_refresh = 0
+        elif event.key == ProfilerKeys.TOGGLETRACE:
+            if FrameProfiler.is_tracing():
+                path = get_file_path(f"../frame_trace_{strftime('%Y%m%d_%H%M%S')}.json")
+                amount_events = FrameProfiler.stop_trace(path)
+                FrameProfiler.set_enabled(self._visible)
+                self._message = f"Trace salvo: {basename(path)} ({amount_events} eventos)"
+            else:
+                FrameProfiler.start_trace()
+                self._message = "Gravando trace... (F4 para salvar)"
+            self._time_to_refresh = 0
+
+    def update(self, dt: float) -> None:
+        if not self._visible: return
+
+        self._time_to_refresh -= dt
+        if self._time_to_refresh <= 0:
+            self._time_to_refresh = self._refresh_time
+            self._render()
+
+    def draw(self, screen: pg.Surface) -> None:
+        if self._visible:
+            screen.blit(self._surface, self._rect)
+
+    def resize(self, new_resolution: tuple[int, int]) -> None:
+        self._size = scale_dimension(self._base_size, new_resolution)
+        self._pos = scale_position(self._base_pos, BASE_RESOLUTION, new_resolution)
+        self._render()
+
+    def set_frame_budget(self, max_fps: float) -> None:
+        """Sets the frame budget (in ms) by the max FPS, 0 is unlimited (no budget)."""
+        self._frame_budget = 1000 / max_fps if max_fps > 0 else None
+
+    def set_rebuild_costs(self, costs: dict[str, tuple[float, float]]) -> None:
+        """Sets the (mean, max) milliseconds of the rebuilds of each widget type on resizes, the most expensive first."""
+        self._rebuild_costs = costs
+
+    def _render(self) -> None:
+        """Renders the panel: a table (phase, p50, p99) with its numbers right-aligned, then the budget and the trace message."""
+        rows: list[tuple[tuple[str, ...], tuple[int, int, int]]] = [(("Fase", "p50 ms", "p99 ms"), COLORS["WHITE"])]
+        stats = FrameProfiler.get_stats()
+
+        for name in ["frame", *[ name for name in stats.keys() if name != "frame" ]]:
+            if name not in stats: continue
+            p50, p99 = stats[name]
+            over_budget = self._frame_budget != None and p99 > self._frame_budget
+            rows.append(((name, f"{p50:.2f}", f"{p99:.2f}"), COLORS["RED"] if over_budget else COLORS["WHITE"]))
+
+        notes = [ text for text in (f"Orçamento: {self._frame_budget:.2f} ms" if self._frame_budget != None else "", self._message) if text ]
+        notes += [ f"Resize {name}: {mean:.2f} ms (máx. {max_time:.2f})" for name, (mean, max_time) in list(self._rebuild_costs.items())[:3] ]
+
+        rendered_rows = [ [ TextRenderer.render(self._font, cell, color, self._size) for cell in cells ] for cells, color in rows ]
+        rendered_notes = [ TextRenderer.render(self._font, text, (150, 150, 150), self._size) for text in notes ]
+        padding = max(1, round(self._size / 2))
+        line_height = round(self._size * 1.3)
+        columns_widths = [ max(row[i][1].width for row in rendered_rows) + padding for i in range(3) ]
+        width = max([sum(columns_widths), *[ rect.width for _, rect in rendered_notes ]]) + 2 * padding
+
+        self._surface = pg.Surface((width, line_height * (len(rendered_rows) + len(rendered_notes)) + 2 * padding), pg.SRCALPHA)
+        self._surface.fill((0, 0, 0, 180))
+
+        def blit_on_line(rendered: tuple[pg.Surface, pg.Rect], x: int, line: int) -> None:
+            """Blits a rendered text with its baseline on the line (the rect's y is the text's height above the baseline)."""
+            self._surface.blit(rendered[0], (x, padding + line * line_height + round(self._size) - rendered[1].y))
+
+        for i, row in enumerate(rendered_rows):
+            blit_on_line(row[0], padding, i)
+            blit_on_line(row[1], padding + columns_widths[0] + columns_widths[1] - row[1][1].width, i)
+            blit_on_line(row[2], padding + sum(columns_widths) - row[2][1].width, i)
+
+        for i, rendered in enumerate(rendered_notes):
+            blit_on_line(rendered, padding, len(rendered_rows) + i)
+
+        self._rect = self._surface.get_rect()
+        setattr(self._rect, self._pos_attr, self._pos)
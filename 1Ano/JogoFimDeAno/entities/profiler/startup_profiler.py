@@ -0,0 +1,121 @@
+import sys
+from time import perf_counter_ns
+from types import ModuleType
+from typing import Any
+
+class _TimedLoader:
+    """Wraps a module's loader, timing its 'exec_module' (everything else is the original loader's)."""
+    def __init__(self, loader: Any, profiler: "StartupProfiler") -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._profiler._enter_import()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit_import(module.__name__)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+class _ImportTimer:
+    """Finder placed first in 'sys.meta_path', it finds the modules with the other finders and wraps their loaders."""
+    def __init__(self, profiler: "StartupProfiler") -> None:
+        self._profiler = profiler
+
+    def find_spec(self, fullname: str, path: Any, target: ModuleType | None = None) -> Any:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"): continue
+
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None: continue
+
+            if spec.loader != None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self._profiler)
+            return spec
+
+        return None
+
+class StartupProfiler:
+    """Times the imports (self time of each module, without its own imports) and the phases marked with 'mark' until 'finish'.
+
+        Used by 'python game.py --startup-profile', which starts it before importing pygame, 'scripts' and 'entities'. The imports
+        are timed by a finder in 'sys.meta_path' wrapping the loaders, like 'python -X importtime', but grouped by package ('pygame',
+        'entities.obstacles', 'scripts'...) and together with the phases marked by the game.
+    """
+    def __init__(self) -> None:
+        self._start = perf_counter_ns()
+        self._last_mark = self._start
+        self._phases: list[tuple[str, int]] = []
+        self._imports: list[tuple[str, int]] = [] # (module, self time)
+        self._stack: list[list[int]] = [] # [start, time of the nested imports] of each import being executed
+        self._finder: _ImportTimer | None = None
+        self._total = 0
+
+    @classmethod
+    def start(self) -> "StartupProfiler":
+        """Creates a profiler and starts timing the imports."""
+        profiler = self()
+        profiler._finder = _ImportTimer(profiler)
+        sys.meta_path.insert(0, profiler._finder)
+        return profiler
+
+    def mark(self, phase: str) -> None:
+        """Ends a phase, that took the time since the last mark (or the start)."""
+        now = perf_counter_ns()
+        self._phases.append((phase, now - self._last_mark))
+        self._last_mark = now
+
+    def finish(self, phase: str) -> None:
+        """Ends the last phase and stops timing the imports."""
+        self.mark(phase)
+        self._total = self._last_mark - self._start
+
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+
+    def is_finished(self) -> bool: return self._finder is None
+
+    def get_modules_times(self) -> dict[str, tuple[int, int]]:
+        """Returns the (nanoseconds, amount of modules) imported by each package, the slowest first.
+
+            The packages of the game ('entities', 'scripts') are split by their subpackage, the others are grouped by the top one.
+        """
+        packages: dict[str, tuple[int, int]] = {}
+
+        for module, self_time in self._imports:
+            parts = module.split(".")
+            package = ".".join(parts[:2]) if parts[0] in ("entities", "scripts") else parts[0]
+            time, amount = packages.get(package, (0, 0))
+            packages[package] = (time + self_time, amount + 1)
+
+        return dict(sorted(packages.items(), key=lambda item: item[1][0], reverse=True))
+
+    def report(self, max_packages: int = 15, title: str = "Tempo até o primeiro frame") -> str:
+        lines = [f"{title}: {self._total / 1e6:.1f} ms", "", "Fases:"]
+        lines += [ f"  {phase:<28}{time / 1e6:>9.1f} ms" for phase, time in self._phases ]
+
+        packages = list(self.get_modules_times().items())
+        imports_time = sum(time for _, (time, _) in packages)
+        lines += ["", f"Imports (tempo próprio de cada módulo, total {imports_time / 1e6:.1f} ms):"]
+        lines += [ f"  {package:<28}{time / 1e6:>9.1f} ms  ({amount} módulos)" for package, (time, amount) in packages[:max_packages] ]
+
+        if len(packages) > max_packages:
+            others = packages[max_packages:]
+            lines.append(f"  {f'outros ({len(others)} pacotes)':<28}{sum(time for _, (time, _) in others) / 1e6:>9.1f} ms")
+
+        return "\n".join(lines)
+
+    def _enter_import(self) -> None:
+        self._stack.append([perf_counter_ns(), 0])
+
+    def _exit_import(self, module: str) -> None:
+        start, nested_time = self._stack.pop()
+        total = perf_counter_ns() - start
+
+        if self._stack:
+            self._stack[-1][1] += total
+        if self._finder != None:
+            self._imports.append((module, total - nested_time))
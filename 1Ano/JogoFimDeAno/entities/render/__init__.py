@@ -0,0 +1,3 @@
+from .dirty_tracker import DirtyTracker
+from .dirty_rect_renderer import DirtyRectRenderer
+from .resize_scheduler import ResizeScheduler
@@ -0,0 +1,52 @@
+import pygame as pg
+from typing import Any, Callable
+
+class DirtyRectRenderer:
+    """Redraws and updates on the display only the areas of the screen changed by the widgets (dirty rects).
+
+        Each widget reports its changed areas with 'get_dirty_rects()', then the whole frame is drawn clipped to the union of
+        these areas and only they are sent to the display ('pg.display.update'). An animated layer (a moving background)
+        changes the whole screen, so while there is one the frame is fully redrawn and flipped, as without this renderer.
+    """
+    def __init__(self, max_rects: int = 16) -> None:
+        self._max_rects = max_rects # More areas than this are sent as just one
+        self._full_redraw = True
+
+    def render(self, screen: pg.Surface, draw_frame: Callable[[pg.Surface], None], widgets: list[Any], animated_layer: bool = False) -> None:
+        """Draws the frame ('draw_frame' draws all the window on the screen, clipped when only some areas changed)."""
+        rects = [ rect for widget in widgets for rect in widget.get_dirty_rects() ] # Always collected, so the widgets' marks are cleared
+
+        if self._full_redraw or animated_layer:
+            self._full_redraw = False
+            draw_frame(screen)
+            pg.display.flip()
+            return
+
+        rects = self._merge_rects([ rect.clip(screen.get_rect()) for rect in rects if rect.colliderect(screen.get_rect()) ])
+        if not rects: return
+
+        screen.set_clip(rects[0].unionall(rects[1:])) # Just one clipped draw, most of the cost of a frame doesn't depend on its area
+        draw_frame(screen)
+        screen.set_clip(None)
+
+        pg.display.update(rects)
+
+    def request_full_redraw(self) -> None:
+        """The next frame will be fully redrawn, used when a window starts, on resizes or when something without a dirty rect changes."""
+        self._full_redraw = True
+
+    def _merge_rects(self, rects: list[pg.Rect]) -> list[pg.Rect]:
+        """Merges the overlapping rects, so no area is sent twice to the display."""
+        merged: list[pg.Rect] = []
+
+        for rect in rects:
+            index = rect.collidelist(merged)
+            while index != -1: # The union can overlap others already merged
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+
+        if len(merged) > self._max_rects:
+            return [merged[0].unionall(merged[1:])]
+
+        return merged
@@ -0,0 +1,21 @@
+import pygame as pg
+
+class DirtyTracker:
+    """Keeps if a widget changed since its last report to the 'DirtyRectRenderer', and the area it was drawn on."""
+    def __init__(self) -> None:
+        self._is_dirty = True
+        self._last_rect: pg.Rect | None = None
+
+    def mark(self) -> None:
+        """Marks the widget as changed (new text, position, hover animation...)."""
+        self._is_dirty = True
+
+    def collect(self, current_rect: pg.Rect) -> list[pg.Rect]:
+        """Returns the old and the new areas of the widget if it changed, clearing the mark."""
+        if not self._is_dirty: return []
+
+        rects = [current_rect.copy()] if self._last_rect is None else [self._last_rect, current_rect.copy()]
+        self._last_rect = rects[-1]
+        self._is_dirty = False
+
+        return rects
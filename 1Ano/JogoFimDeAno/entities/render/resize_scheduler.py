@@ -0,0 +1,112 @@
+import pygame as pg
+from ..inputhandler import InputHandler
+from ..profiler import FrameProfiler
+from collections import deque
+from time import perf_counter, perf_counter_ns
+from typing import Any
+
+class ResizeScheduler:
+    """Coalesces the bursts of resize events (dragging the window's border) into one resize, sent when the size settles.
+
+        The raw 'pg.VIDEORESIZE' events are taken out of the events ('filter_events') and, after 'settle_time' seconds without
+        new ones, a single 'pg.VIDEORESIZE' (with 'settled=True') is added with the last size, so the widgets rebuild once.
+        In the meantime the windows draw on a canvas with the last good size ('get_target'), scaled to the display ('present'),
+        and the mouse (its events' 'pos' and 'InputHandler.get_mouse_pos') is mapped back to the canvas.
+        The rebuild time of each widget type is kept ('resize_objects', 'measure') and added to the 'FrameProfiler' as "resize".
+    """
+    def __init__(self, initial_size: tuple[int, int], settle_time: float = 0.2, max_samples: int = 32) -> None:
+        self._settle_time = settle_time
+        self._good_size = tuple(initial_size)
+        self._pending_size: tuple[int, int] | None = None
+        self._last_request = 0.0
+        self._canvas: pg.Surface | None = None
+        self._rebuild_costs: dict[str, deque[float]] = {} # Milliseconds of the last rebuilds of each widget type
+        self._max_samples = max_samples
+
+    def filter_events(self, events: list[pg.event.Event]) -> list[pg.event.Event]:
+        """Returns the events without the raw resizes, plus the settled resize when the size stopped changing."""
+        filtered: list[pg.event.Event] = []
+
+        for event in events:
+            if event.type == pg.VIDEORESIZE and not getattr(event, "settled", False):
+                self._request(event.size)
+            else:
+                filtered.append(event)
+
+        if self._canvas != None: # The widgets still have the last good size until the settled resize
+            filtered = [ self._to_canvas_event(event) for event in filtered ]
+
+        if self._pending_size != None and perf_counter() - self._last_request >= self._settle_time:
+            size = self._pending_size
+            self._good_size = size
+            self._pending_size = None
+            self._canvas = None
+            InputHandler.set_canvas_size(None)
+            filtered.append(pg.event.Event(pg.VIDEORESIZE, size=size, w=size[0], h=size[1], settled=True))
+
+        return filtered
+
+    def get_target(self) -> pg.Surface:
+        """Returns where the windows draw: the display, or the canvas with the last good size while a resize is settling."""
+        return self._canvas if self._canvas != None else pg.display.get_surface()
+
+    def present(self) -> None:
+        """Scales the canvas to the display (while a resize is settling), called before flipping the display."""
+        if self._canvas is None: return
+
+        display = pg.display.get_surface()
+        pg.transform.scale(self._canvas, display.get_size(), display)
+
+    def is_settling(self) -> bool: return self._canvas != None
+
+    def resize_objects(self, objects: list[Any], resolution: tuple[int, int]) -> None:
+        """Resizes the 'objects', keeping the time of each one by its type."""
+        for obj in objects:
+            start = perf_counter_ns()
+            obj.resize(resolution)
+            self.record_rebuild(type(obj).__name__, start, perf_counter_ns())
+
+    def measure(self, name: str) -> "RebuildTimer":
+        """Context manager keeping the time of a rebuild that isn't a 'resize(resolution)' ('with scheduler.measure("Obstacles"): ...')."""
+        return RebuildTimer(self, name)
+
+    def record_rebuild(self, name: str, start: int, end: int) -> None:
+        costs = self._rebuild_costs.get(name)
+        if costs is None:
+            costs = self._rebuild_costs[name] = deque(maxlen=self._max_samples)
+
+        costs.append((end - start) / 1e6)
+        if FrameProfiler.is_enabled():
+            FrameProfiler.add_phase_time("resize", start, end)
+
+    def get_rebuild_costs(self) -> dict[str, tuple[float, float]]:
+        """Returns the (mean, max) milliseconds of the last rebuilds of each widget type, the most expensive first."""
+        costs = { name : (sum(times) / len(times), max(times)) for name, times in self._rebuild_costs.items() }
+        return dict(sorted(costs.items(), key=lambda item: item[1][0], reverse=True))
+
+    def _request(self, size: tuple[int, int]) -> None:
+        self._last_request = perf_counter()
+
+        if self._canvas is None:
+            if tuple(size) == self._good_size: return # Nothing to rebuild
+
+            self._canvas = pg.Surface(self._good_size)
+            InputHandler.set_canvas_size(self._good_size)
+
+        self._pending_size = tuple(size)
+
+    def _to_canvas_event(self, event: pg.event.Event) -> pg.event.Event:
+        if event.type not in (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP, pg.MOUSEMOTION): return event
+        return pg.event.Event(event.type, event.dict, pos=InputHandler.to_canvas_pos(event.pos))
+
+class RebuildTimer:
+    def __init__(self, scheduler: ResizeScheduler, name: str) -> None:
+        self._scheduler = scheduler
+        self._name = name
+        self._start = 0
+
+    def __enter__(self) -> None:
+        self._start = perf_counter_ns()
+
+    def __exit__(self, *exception_info) -> None:
+        self._scheduler.record_rebuild(self._name, self._start, perf_counter_ns())
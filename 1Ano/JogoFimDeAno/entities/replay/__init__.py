@@ -0,0 +1,5 @@
+from .replay import *
+from .replay_input import *
+from .replay_recorder import *
+from .replay_player import *
+from .replay_library import *
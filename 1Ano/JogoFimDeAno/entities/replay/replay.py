@@ -0,0 +1,184 @@
+from ..inputhandler import InputHandler
+from ..player.player import Keys
+from array import array
+from bisect import bisect_right
+from enum import IntFlag
+from json import dumps, loads
+from scripts import BASE_RESOLUTION
+from struct import Struct
+from typing import Any
+from zlib import compress, decompress
+
+class ReplayInputBit(IntFlag):
+    """The bits of a frame's input in a replay: the Player's keys and the mouse (pressed, and on which side of the Player)."""
+    MOREDISTANCE = 1
+    LESSDISTANCE = 2
+    ROTATELEFT = 4
+    ROTATERIGHT = 8
+    TOGGLEBORDER = 16
+    MOUSE = 32
+    MOUSELEFT = 64 # Pressed to the left of the Player's center (rotates it to the left)
+    MOUSERIGHT = 128
+
+_KEY_BITS: tuple[tuple[Keys, int], ...] = tuple((key, int(ReplayInputBit[key.name])) for key in Keys)
+_MODES: tuple[str, ...] = ("random", "level")
+
+# The replay's binary format (little-endian): the header, the body compressed by zlib and the result, in JSON (empty if none). The
+# body has the input changes, as (frames since the last change, state) pairs, then the resizes, as (frames since the last one,
+# width, height); all the numbers but the states are varints, each list starts with its length
+_MAGIC = b"DRPL"
+_VERSION = 2
+_HEADER = Struct("<4sHBBHqdIHHI") # Magic, version, mode, amount of circles, level, seed, dt, amount of frames, resolution, body size
+
+def get_input_state(player_center_x: float) -> int:
+    """Returns the input the Player reads now (from the 'InputHandler') packed in the bits of 'ReplayInputBit'."""
+    keys = InputHandler.get_pressed_keys()
+    state = 0
+
+    for key, bit in _KEY_BITS:
+        if keys[key]:
+            state |= bit
+
+    if InputHandler.get_mouse_pressed()[0]:
+        state |= ReplayInputBit.MOUSE
+        mouse_x = InputHandler.get_mouse_pos()[0]
+        if mouse_x < player_center_x:
+            state |= ReplayInputBit.MOUSELEFT
+        elif mouse_x > player_center_x:
+            state |= ReplayInputBit.MOUSERIGHT
+
+    return int(state)
+
+def _write_varint(body: bytearray, number: int) -> None:
+    while number >= 0x80: # 7 bits a byte, the high bit says another byte follows
+        body.append(number & 0x7F | 0x80)
+        number >>= 7
+    body.append(number)
+
+def _read_varint(body: bytes, position: int) -> tuple[int, int]:
+    """Returns the number and the position after it."""
+    number = shift = 0
+    while body[position] & 0x80:
+        number |= (body[position] & 0x7F) << shift
+        shift += 7
+        position += 1
+    return number | body[position] << shift, position + 1
+
+class Replay:
+    """A recorded run of the random or the levels mode: its settings (the seed included) and the input of every frame, kept as the
+        frames it changed, plus the window's resizes and, optionally, the run's result.
+
+        The frame n is the input of the n-th step (or fixed tick, in the windowed game) and the frame 0 the one before the first.
+        With the same settings and a fixed dt the gameplay is deterministic, so this is all it takes to play the run again in a
+        'Simulation' (see 'ReplayPlayer'). A resize of the frame n is done before its step. In the file the changes are delta
+        encoded and compressed, so an hour of play is a few KB.
+    """
+    def __init__(self, mode: str, level: int, amount_circles: int, seed: int, dt: float, amount_frames: int, changes: list[tuple[int, int]], resolution: tuple[int, int] = BASE_RESOLUTION, resizes: list[tuple[int, tuple[int, int]]] = [], result: dict[str, Any] | None = None) -> None:
+        if mode not in _MODES:
+            raise ValueError(f"Replay: Unknown mode: {mode}")
+        if not changes or changes[0][0] != 0:
+            raise ValueError("Replay: The input changes must start at the frame 0!")
+
+        self._mode = mode
+        self._level = level
+        self._amount_circles = amount_circles
+        self._seed = seed
+        self._dt = dt
+        self._amount_frames = amount_frames
+        self._change_frames = array("I", [ frame for frame, _ in changes ]) # Sorted, bisected by 'get_state'
+        self._states = bytes(state for _, state in changes)
+        self._resolution = tuple(resolution)
+        self._resizes = [ (frame, tuple(size)) for frame, size in resizes ] # Sorted by frame
+        self._result = result
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "Replay": return self # Doesn't change after recorded, the snapshots share it
+
+    def get_state(self, frame: int) -> int:
+        """Returns the input of the frame, in the bits of 'ReplayInputBit' (after the last frame, it's the last one's)."""
+        return self._states[bisect_right(self._change_frames, frame) - 1]
+
+    def to_bytes(self) -> bytes:
+        body = bytearray()
+
+        last_frame = 0
+        _write_varint(body, len(self._states))
+        for frame, state in zip(self._change_frames, self._states):
+            _write_varint(body, frame - last_frame)
+            body.append(state)
+            last_frame = frame
+
+        last_frame = 0
+        _write_varint(body, len(self._resizes))
+        for frame, (width, height) in self._resizes:
+            _write_varint(body, frame - last_frame)
+            _write_varint(body, width)
+            _write_varint(body, height)
+            last_frame = frame
+
+        body = compress(bytes(body), 9)
+        result = dumps(self._result, separators=(",", ":")).encode() if self._result != None else b""
+        header = _HEADER.pack(_MAGIC, _VERSION, _MODES.index(self._mode), self._amount_circles, self._level, self._seed, self._dt, self._amount_frames, *self._resolution, len(body))
+        return header + body + result
+
+    @classmethod
+    def from_bytes(self, data: bytes) -> "Replay":
+        if len(data) < _HEADER.size or data[:4] != _MAGIC or _HEADER.unpack_from(data, 0)[1] != _VERSION:
+            raise ValueError("Replay: Not a replay or from another version!")
+        _, _, mode, amount_circles, level, seed, dt, amount_frames, width, height, body_size = _HEADER.unpack_from(data, 0)
+
+        body = decompress(data[_HEADER.size:_HEADER.size + body_size])
+        result = data[_HEADER.size + body_size:]
+        changes: list[tuple[int, int]] = []
+        resizes: list[tuple[int, tuple[int, int]]] = []
+
+        frame = 0
+        amount, position = _read_varint(body, 0)
+        for _ in range(amount):
+            delta, position = _read_varint(body, position)
+            frame += delta
+            changes.append((frame, body[position]))
+            position += 1
+
+        frame = 0
+        amount, position = _read_varint(body, position)
+        for _ in range(amount):
+            delta, position = _read_varint(body, position)
+            resize_width, position = _read_varint(body, position)
+            resize_height, position = _read_varint(body, position)
+            frame += delta
+            resizes.append((frame, (resize_width, resize_height)))
+
+        return self(_MODES[mode], level, amount_circles, seed, dt, amount_frames, changes, (width, height), resizes, loads(result) if result else None)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(self, path: str) -> "Replay":
+        with open(path, "rb") as file:
+            return self.from_bytes(file.read())
+
+    def get_mode(self) -> str: return self._mode
+
+    def get_level(self) -> int: return self._level
+
+    def get_amount_circles(self) -> int: return self._amount_circles
+
+    def get_seed(self) -> int: return self._seed
+
+    def get_dt(self) -> float: return self._dt
+
+    def get_amount_frames(self) -> int: return self._amount_frames
+
+    def get_duration(self) -> float: return self._amount_frames * self._dt
+
+    def get_amount_changes(self) -> int: return len(self._states)
+
+    def get_resolution(self) -> tuple[int, int]: return self._resolution
+
+    def get_resizes(self) -> list[tuple[int, tuple[int, int]]]: return self._resizes.copy()
+
+    def get_result(self) -> dict[str, Any] | None:
+        """Returns the result of the recorded run (see 'Gameplay.get_result'), if it was saved with it."""
+        return self._result
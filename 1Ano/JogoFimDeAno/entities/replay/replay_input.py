@@ -0,0 +1,38 @@
+from .replay import Replay, ReplayInputBit, _KEY_BITS
+from ..inputhandler import PressedKeys
+
+class ReplayInput:
+    """Input that follows a 'Replay' frame by frame, like a 'ScriptedInput' (it's given to the 'Simulation' the same way).
+
+        Each 'advance' is a frame, whatever the dt (the replay's own dt is the simulation's). The mouse is placed just to the side
+        of 'player_center_x' it was recorded on (or on it), which is all the Player checks.
+    """
+    def __init__(self, replay: Replay, player_center_x: int, frame: int = 0) -> None:
+        self._replay = replay
+        self._player_center_x = player_center_x
+        self._frame = frame
+        self._state = replay.get_state(frame)
+        self._pressed_keys_cache: dict[int, PressedKeys] = {}
+
+    def advance(self, dt: float) -> list[int]:
+        """Advances to the next frame and returns the keys that were pressed in it (the KEYDOWNs)."""
+        self._frame += 1
+        old_state, self._state = self._state, self._replay.get_state(self._frame)
+        return [ key for key, bit in _KEY_BITS if self._state & bit and not old_state & bit ]
+
+    def get_pressed_keys(self) -> PressedKeys:
+        pressed_keys = self._pressed_keys_cache.get(self._state)
+        if pressed_keys is None: # At most one per combination of keys
+            pressed_keys = self._pressed_keys_cache[self._state] = PressedKeys(frozenset(key for key, bit in _KEY_BITS if self._state & bit))
+        return pressed_keys
+
+    def get_mouse_pressed(self) -> tuple[bool, bool, bool]: return (bool(self._state & ReplayInputBit.MOUSE), False, False)
+
+    def get_mouse_pos(self) -> tuple[int, int]:
+        if self._state & ReplayInputBit.MOUSELEFT:
+            return (self._player_center_x - 1, 0)
+        if self._state & ReplayInputBit.MOUSERIGHT:
+            return (self._player_center_x + 1, 0)
+        return (self._player_center_x, 0)
+
+    def get_frame(self) -> int: return self._frame
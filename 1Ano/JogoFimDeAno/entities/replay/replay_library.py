@@ -0,0 +1,39 @@
+from .replay import Replay
+from scripts import get_file_path
+from datetime import datetime
+from os import listdir, makedirs, remove
+from os.path import isdir, join
+
+class ReplayLibrary:
+    """The replays of the windowed game modes, saved in the 'data/replays' folder. Only the last '_max_replays' are kept.
+
+        The file names start with the time they were saved, so sorting them by name sorts them by time.
+    """
+    _folder = get_file_path("../data/replays")
+    _max_replays = 20
+
+    @classmethod
+    def save(self, replay: Replay) -> str:
+        """Saves 'replay' as the newest one (removing the oldest ones over the limit) and returns its path."""
+        makedirs(self._folder, exist_ok=True)
+        path = join(self._folder, f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{replay.get_mode()}.rpl")
+        replay.save(path)
+
+        for old_path in self.get_paths()[:-self._max_replays]:
+            remove(old_path)
+
+        return path
+
+    @classmethod
+    def get_paths(self) -> list[str]:
+        """Returns the paths of the saved replays, from the oldest to the newest."""
+        if not isdir(self._folder): return []
+        return [ join(self._folder, name) for name in sorted(listdir(self._folder)) if name.endswith(".rpl") ]
+
+    @classmethod
+    def get_last(self) -> Replay | None:
+        paths = self.get_paths()
+        return Replay.load(paths[-1]) if paths else None
+
+    @classmethod
+    def set_folder(self, folder: str) -> None: self._folder = folder
@@ -0,0 +1,77 @@
+from .replay import Replay
+from .replay_input import ReplayInput
+from ..simulation import Simulation, SimulationSnapshot
+from bisect import bisect_right, insort
+from typing import Any
+
+class ReplayPlayer:
+    """Plays a 'Replay' again in a 'Simulation', exactly like the recorded run, and seeks to any time of it.
+
+        Every 'snapshot_interval' seconds played it keeps a snapshot of the simulation, so seeking restores the nearest snapshot
+        before the time and simulates only from there (the ones taken while recording can be given, so no part is simulated from zero).
+        Seeking ahead of the snapshots fast-forwards from the last one, without rendering. The resizes recorded are done before
+        their frames' steps.
+    """
+    def __init__(self, replay: Replay, render: bool = False, snapshot_interval: float = 30.0, snapshots: dict[int, SimulationSnapshot] | None = None) -> None:
+        self._replay = replay
+        self._render = render
+        self._snapshot_interval = max(1, round(snapshot_interval / replay.get_dt())) # In frames
+        self._simulation = Simulation(replay.get_mode(), replay.get_level(), replay.get_amount_circles(), replay.get_seed(), replay.get_dt(), resolution=replay.get_resolution(), render=render)
+        self._simulation.set_scripted_input(self._create_input(0))
+        self._snapshots: dict[int, SimulationSnapshot] = snapshots.copy() if snapshots != None else {}
+        self._snapshots_frames = sorted(self._snapshots) # Bisected by 'seek'
+        self._resizes: dict[int, list[tuple[int, int]]] = {}
+        for frame, size in replay.get_resizes():
+            self._resizes.setdefault(frame, []).append(size)
+
+        if 0 not in self._snapshots:
+            self._add_snapshot()
+
+    def step(self) -> None:
+        """Plays one frame (nothing after the last one)."""
+        if self._simulation.get_frame() >= self._replay.get_amount_frames(): return
+
+        for size in self._resizes.get(self._simulation.get_frame() + 1, ()):
+            self._simulation.resize(size)
+        self._simulation.step()
+        if self._simulation.get_frame() % self._snapshot_interval == 0 and self._simulation.get_frame() not in self._snapshots:
+            self._add_snapshot()
+
+    def run(self) -> dict[str, Any]:
+        """Plays until the end of the replay, returning the simulation's summary."""
+        self.seek(self._replay.get_duration())
+        return self._simulation.get_summary()
+
+    def seek(self, time: float) -> None:
+        """Goes to the frame of 'time' (in seconds of the replay), backward or forward."""
+        frame = min(max(round(time / self._replay.get_dt()), 0), self._replay.get_amount_frames())
+        nearest_frame = self._snapshots_frames[bisect_right(self._snapshots_frames, frame) - 1]
+
+        if frame < self._simulation.get_frame() or nearest_frame > self._simulation.get_frame(): # Else simulating from the current frame is shorter
+            self._simulation = self._snapshots[nearest_frame].restore()
+            self._simulation.set_scripted_input(self._create_input(nearest_frame))
+
+        self._simulation.set_render(False) # Only the frame sought is seen
+        while self._simulation.get_frame() < frame - 1:
+            self.step()
+        self._simulation.set_render(self._render)
+
+        if self._simulation.get_frame() < frame:
+            self.step()
+
+    def get_simulation(self) -> Simulation:
+        """Returns the simulation being played (another one after a 'seek')."""
+        return self._simulation
+
+    def get_replay(self) -> Replay: return self._replay
+
+    def get_time(self) -> float: return self._simulation.get_time()
+
+    def close(self) -> None: self._simulation.close()
+
+    def _create_input(self, frame: int) -> ReplayInput:
+        return ReplayInput(self._replay, self._simulation.get_player().get_center()[0], frame)
+
+    def _add_snapshot(self) -> None:
+        self._snapshots[self._simulation.get_frame()] = self._simulation.get_snapshot()
+        insort(self._snapshots_frames, self._simulation.get_frame())
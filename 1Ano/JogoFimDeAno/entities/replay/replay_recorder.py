@@ -0,0 +1,38 @@
+from .replay import Replay, get_input_state
+from scripts import BASE_RESOLUTION
+from typing import Any
+
+class ReplayRecorder:
+    """Records the input of a run of the random or the levels mode in a 'Replay', tick by tick.
+
+        The windowed game modes and the 'Simulation' (given as its 'recorder') both use it: 'record_tick' is called at the start
+        of every fixed tick of 'dt' seconds, with the input the Player is going to read in it, and 'record_resize' when the game
+        is resized (it's done before the next tick, like in the game).
+    """
+    def __init__(self, mode: str = "random", level: int = 1, amount_circles: int = 2, seed: int = 0, dt: float = 1 / 60, resolution: tuple[int, int] = BASE_RESOLUTION) -> None:
+        self._settings = (mode, level, amount_circles, seed, dt)
+        self._resolution = tuple(resolution)
+        self._amount_ticks = 0
+        self._changes: list[tuple[int, int]] = []
+        self._resizes: list[tuple[int, tuple[int, int]]] = []
+
+    def record_tick(self, player_center_x: float) -> None:
+        """Records the input of a new tick (read from the 'InputHandler')."""
+        self._amount_ticks += 1
+
+        state = get_input_state(player_center_x)
+        if not self._changes: # The frame 0 is before the first tick, nothing changes in it
+            self._changes.append((0, state))
+        elif state != self._changes[-1][1]:
+            self._changes.append((self._amount_ticks, state))
+
+    def record_resize(self, resolution: tuple[int, int]) -> None:
+        """Records that the game was resized to 'resolution' before the next tick."""
+        self._resizes.append((self._amount_ticks + 1, tuple(resolution)))
+
+    def get_replay(self, result: dict[str, Any] | None = None) -> Replay:
+        """Returns the replay of the ticks recorded until now, with the run's 'result' (see 'Gameplay.get_result'), if given."""
+        changes = self._changes if self._changes else [(0, 0)]
+        return Replay(*self._settings, self._amount_ticks, changes, self._resolution, self._resizes, result)
+
+    def get_amount_ticks(self) -> int: return self._amount_ticks
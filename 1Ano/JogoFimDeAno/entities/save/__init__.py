@@ -0,0 +1 @@
+from .save_store import SaveStore
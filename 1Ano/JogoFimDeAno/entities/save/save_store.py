@@ -0,0 +1,87 @@
+from atexit import register as atexit_register
+from json import dump as json_dump
+from os import fsync, replace, remove
+from os.path import exists
+from sys import stderr
+from threading import Condition, Thread
+from typing import Any
+
+class SaveStore:
+    """Writes the json files of the player's progress in a background thread, so the disk never stalls a frame.
+
+        'save' only keeps a copy of the data, the thread writes it after 'batch_time' seconds (the saves of the same file
+        in the meantime are merged in one write, only the last data is written). Each write goes to a temporary file that
+        replaces the old one ('os.replace'), so a crash never leaves a half-written file. 'flush' (also called at exit)
+        waits for the pending writes.
+    """
+    _pending: dict[str, dict[str, Any]] = {} # Path -> last data saved and not written yet
+    _writing = 0 # Files being written by the thread
+    _condition = Condition()
+    _thread: Thread | None = None
+    _batch_time = 0.5
+    _skip_batch_time = False # Set by 'flush', to write without waiting for more saves
+
+    @classmethod
+    def save(self, path: str, data: dict[str, Any]) -> None:
+        """Schedules writing 'data' (a flat dict, it's copied) as json to 'path'."""
+        with self._condition:
+            self._pending[path] = dict(data)
+            self._start_thread()
+            self._condition.notify_all()
+
+    @classmethod
+    def flush(self) -> None:
+        """Waits until all the saved data is written."""
+        with self._condition:
+            if not self._pending and self._writing == 0: return
+
+            self._skip_batch_time = True
+            self._condition.notify_all()
+            self._condition.wait_for(lambda: not self._pending and self._writing == 0)
+            self._skip_batch_time = False # Not taken by the thread if it was only writing, the next saves wait again
+
+    @classmethod
+    def has_pending(self) -> bool:
+        with self._condition:
+            return len(self._pending) > 0 or self._writing > 0
+
+    @classmethod
+    def _start_thread(self) -> None:
+        if self._thread != None: return
+
+        self._thread = Thread(target=self._run, name="SaveStoreWriter", daemon=True)
+        self._thread.start()
+        atexit_register(self.flush)
+
+    @classmethod
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: len(self._pending) > 0)
+                self._condition.wait_for(lambda: self._skip_batch_time, self._batch_time) # More saves may come in the meantime
+
+                batch = self._pending.copy()
+                self._pending.clear()
+                self._skip_batch_time = False
+                self._writing = len(batch)
+
+            for path, data in batch.items():
+                self._write(path, data)
+
+            with self._condition:
+                self._writing = 0
+                self._condition.notify_all()
+
+    @staticmethod
+    def _write(path: str, data: dict[str, Any]) -> None:
+        temp_path = f"{path}.tmp"
+
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json_dump(data, file, ensure_ascii=False, indent=4)
+                file.flush()
+                fsync(file.fileno())
+            replace(temp_path, path)
+        except OSError as error:
+            print(f"SaveStore: Couldn't save {path}: {error}", file=stderr)
+            if exists(temp_path): remove(temp_path)
@@ -0,0 +1,3 @@
+from .gameplay import *
+from .simulation import *
+from .level_validation import *
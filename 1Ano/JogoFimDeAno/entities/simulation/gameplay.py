@@ -0,0 +1,142 @@
+import pygame as pg
+from ..eventhandler import CustomEventList, TimerScheduler
+from ..obstaclesmanager import BaseObstaclesManager, RandomObstaclesManager
+from ..perfection_levels import PerfectionDrawer
+from ..player import Player
+from ..player.player import Keys
+from ..profiler import FrameProfiler
+from typing import Any, Callable
+
+class Gameplay:
+    """The gameplay of the random or the levels mode, advanced in fixed ticks: the Player, the obstacles manager, the collisions and
+        the delayed events (the reset after a collision, the end of the random mode), timed in game time by its 'TimerScheduler'.
+
+        The windowed game modes and the 'Simulation' both run it, so a run recorded in a window (by the 'recorder', a 'ReplayRecorder')
+        is played again the same in a simulation. The events posted by the gameplay ('GAME_EVENTS') are left in pygame's queue and
+        handled by the next 'tick'; 'on_event' gets each of them after (the windows' HUD) and 'on_end' is called when the random mode ends.
+    """
+    GAME_EVENTS: tuple[int, ...] = (CustomEventList.PLAYERCOLLISION, CustomEventList.NEWGENERATIONWARNING, CustomEventList.CHECKPOINTREACHED, CustomEventList.NEWLEVELWARNING)
+
+    def __init__(self, player: Player, obstacle_manager: BaseObstaclesManager, perfection_drawer: PerfectionDrawer | None = None, recorder: Any = None, reset_on_collision: bool = True, on_event: Callable[[pg.event.Event], None] | None = None, on_end: Callable[[], None] | None = None) -> None:
+        self._player = player
+        self._obstacle_manager = obstacle_manager
+        self._perfection_drawer = perfection_drawer # Only in the levels mode
+        self._recorder = recorder
+        self._reset_on_collision = reset_on_collision # Else the collisions are only counted (the Player passes through the obstacles)
+        self._on_event = on_event
+        self._on_end = on_end
+        self._timers = TimerScheduler()
+        self._ticks = 0 # Until the game ended, the ones recorded
+        self._player_collided = False
+        self._game_ended = False
+        self._levels_started: list[int] = []
+
+    def tick(self, dt: float) -> None:
+        """Advances the gameplay by one tick of 'dt' seconds."""
+        if not self._game_ended: # The run ends with the game
+            self._ticks += 1
+            if self._recorder != None:
+                self._recorder.record_tick(self._player.get_center()[0])
+
+        for event in pg.event.get(self.GAME_EVENTS):
+            self._handle_event(event)
+
+        with FrameProfiler.phase("timers"):
+            self._timers.update(dt)
+
+        if self._game_ended: return
+
+        if not self._player_collided:
+            with FrameProfiler.phase("player"):
+                self._player.update(dt)
+            with FrameProfiler.phase("obstacles"):
+                self._obstacle_manager.update(dt)
+            with FrameProfiler.phase("collision"):
+                self._obstacle_manager.check_collision(self._player)
+        else:
+            with FrameProfiler.phase("player"):
+                self._player.update_lost_particles(dt)
+
+    def update_by_event(self, event: pg.event.Event) -> None:
+        """Handles the player's events (all but the resizes, see 'resize')."""
+        self._player.update_by_event(event)
+
+        if self._perfection_drawer != None:
+            if (event.type == pg.KEYDOWN and event.key in [Keys.ROTATELEFT, Keys.ROTATERIGHT, Keys.MOREDISTANCE, Keys.LESSDISTANCE]) or (event.type == pg.MOUSEBUTTONDOWN and event.button == 1):
+                self._perfection_drawer.update_movements()
+
+    def resize(self, resolution: tuple[int, int]) -> None:
+        """Resizes the Player and the obstacles (before the next tick)."""
+        self._player.resize(resolution)
+        self._obstacle_manager.resize(resolution, self._player.get_center(), self._player.get_normal_distance())
+
+        if self._recorder != None and not self._game_ended:
+            self._recorder.record_resize(resolution)
+
+    def _handle_event(self, event: pg.event.Event) -> None:
+        self._player.update_by_event(event)
+
+        match event.type:
+            case CustomEventList.PLAYERCOLLISION:
+                if self._reset_on_collision:
+                    if self.check_player_lost():
+                        self._timers.set_timer(self._end_game, 0.5)
+                    else:
+                        self._timers.set_timer(self._reset_game, 0.5)
+
+                    self._player_collided = True
+                    self._player.add_lost_particles(event.indexes)
+
+            case CustomEventList.NEWLEVELWARNING:
+                self._levels_started.append(event.level)
+                self._perfection_drawer.reset(self._obstacle_manager.get_actual_level())
+
+        if self._on_event != None:
+            self._on_event(event)
+
+    def _reset_game(self) -> None:
+        self._player_collided = False
+        self._player.reset_movements()
+        self._obstacle_manager.reset()
+
+        if self._perfection_drawer != None:
+            self._perfection_drawer.reset(self._obstacle_manager.get_actual_level())
+            self._perfection_drawer.check_movements()
+
+    def _end_game(self) -> None:
+        self._game_ended = True
+
+        if self._on_end != None:
+            self._on_end()
+
+    def check_player_lost(self) -> bool:
+        """Returns if the Player lost all the lives of the random mode (the levels mode has no lives)."""
+        return isinstance(self._obstacle_manager, RandomObstaclesManager) and self._obstacle_manager.check_player_lost()
+
+    def get_result(self) -> dict[str, Any]:
+        """Returns the results of the run until now, what a replay of it must reproduce (see 'Replay.get_result')."""
+        result = {
+            "frames" : self._ticks,
+            "collisions" : self._obstacle_manager.get_player_collision_count()
+        }
+
+        if isinstance(self._obstacle_manager, RandomObstaclesManager):
+            result["score"] = self._obstacle_manager.get_score()
+            result["best_score"] = self._obstacle_manager.get_best_score()
+            result["game_ended"] = self._game_ended
+        else:
+            result["levels_started"] = self._levels_started.copy()
+
+        return result
+
+    def get_levels_completed(self) -> int: return max(0, len(self._levels_started) - 1)
+
+    def is_player_collided(self) -> bool: return self._player_collided
+
+    def is_game_ended(self) -> bool: return self._game_ended
+
+    def get_timers(self) -> TimerScheduler: return self._timers
+
+    def get_player(self) -> Player: return self._player
+
+    def get_obstacles_manager(self) -> BaseObstaclesManager: return self._obstacle_manager
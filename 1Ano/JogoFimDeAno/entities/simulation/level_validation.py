@@ -0,0 +1,43 @@
+from .simulation import Simulation
+from scripts import get_levels, get_levels_perfection
+from typing import Any
+
+def validate_level(level: int, dt: float = 1 / 60, max_time: float = 300) -> dict[str, Any]:
+    """Checks one level of 'levels.json' and plays it headless, returning the report ('valid' and the 'errors' found).
+
+        The level's obstacles need to exist and the level needs its perfection movements, then it's played with no input and without
+        resetting on the collisions, so it needs to end (the next level starts) in 'max_time' simulated seconds. The collisions of
+        the idle Player are reported too (frames touching an obstacle).
+    """
+    report: dict[str, Any] = { "level" : level, "valid" : True, "errors" : [] }
+    indexes = get_levels().get(str(level))
+
+    if not indexes:
+        report["errors"].append("the level has no obstacles")
+    if get_levels_perfection().get(str(level)) == None:
+        report["errors"].append("the level has no perfection movements")
+
+    simulation = Simulation("level", level, dt=dt, reset_on_collision=False)
+
+    try:
+        amount_obstacles = simulation.get_obstacles_manager().get_amount_possibles_obstacles()
+        invalid_indexes = sorted({ i for i in indexes or [] if not 0 <= i < amount_obstacles })
+        if invalid_indexes:
+            report["errors"].append(f"unknown obstacles {invalid_indexes} (there are {amount_obstacles})")
+
+        if not report["errors"]:
+            report.update(simulation.run(round(max_time / dt), levels_to_complete=1))
+            if simulation.get_levels_completed() < 1:
+                report["errors"].append(f"the level didn't end in {max_time} seconds")
+    finally:
+        simulation.close()
+
+    report["valid"] = not report["errors"]
+    return report
+
+def validate_levels(levels: list[int] | None = None, dt: float = 1 / 60, max_time: float = 300) -> list[dict[str, Any]]:
+    """Validates the 'levels' (all the levels of 'levels.json' by default), see 'validate_level'."""
+    if levels == None:
+        levels = sorted(int(level) for level in get_levels().keys())
+
+    return [ validate_level(level, dt, max_time) for level in levels ]
@@ -0,0 +1,181 @@
+import pygame as pg
+from .gameplay import Gameplay
+from ..achievements import AchievementsHandler
+from ..inputhandler import InputHandler, ScriptedInput
+from ..obstacles import get_obstacle_list, get_3p_obstacle_list
+from ..obstaclesmanager import BaseObstaclesManager, RandomObstaclesManager, LevelObstaclesManager
+from ..perfection_levels import PerfectionDrawer, PerfectionLevelsHandler
+from ..player import Player
+from scripts import BASE_RESOLUTION, COLORS, get_font
+from copy import deepcopy
+from random import seed as random_seed, getstate as random_getstate, setstate as random_setstate
+from time import perf_counter
+from typing import Any
+
+class Simulation:
+    """Runs the gameplay of the random or the levels mode without a window, with a fixed timestep and a scripted input.
+
+        Every frame is a tick of the same 'Gameplay' the 'Game' loops run, of exactly 'dt' seconds, so the same seed and input always give
+        the same run, as fast as the machine can. pygame needs to be initialized (the SDL "dummy" video driver works),
+        and the progress (achievements and perfect levels) isn't saved while the simulation exists (see 'close'). A 'recorder' (a 'ReplayRecorder')
+        records the input of every step and the resizes.
+    """
+    def __init__(self, mode: str = "random", level: int = 1, amount_circles: int = 2, seed: int = 0, dt: float = 1 / 60, input_timeline: list[tuple[float, tuple[int, ...]]] = [], resolution: tuple[int, int] = BASE_RESOLUTION, render: bool = False, reset_on_collision: bool = True, scripted_input: Any = None, recorder: Any = None) -> None:
+        if mode not in ("random", "level"):
+            raise ValueError(f"Simulation: Unknown mode: {mode}")
+
+        random_seed(seed)
+        if pg.display.get_surface() == None:
+            pg.display.set_mode(resolution)
+        pg.event.clear()
+
+        self._mode = mode
+        self._dt = dt
+        self._render = render
+        self._input = scripted_input if scripted_input != None else ScriptedInput(input_timeline) # Anything like 'ScriptedInput' (a replay's input)
+        self._recorder = recorder # Given to the gameplay, left out of the snapshots
+        self._screen = pg.Surface(resolution)
+        self._frame = 0
+        self._time = 0.0
+        self._wall_time = 0.0
+        perfection_drawer = None
+
+        InputHandler.set_scripted_input(self._input)
+        AchievementsHandler.set_save_progress(False)
+        PerfectionLevelsHandler.set_save_progress(False)
+
+        player = Player([i // 2 for i in BASE_RESOLUTION], amount_circles if mode == "random" else 2, 20)
+        player.set_circle_colors([COLORS["RED"], COLORS["BLUE"], COLORS["GREEN"]][:player.get_amount()])
+
+        if mode == "random":
+            obstacle_list = get_obstacle_list if player.get_amount() == 2 else get_3p_obstacle_list
+            obstacle_manager: BaseObstaclesManager = RandomObstaclesManager(player.get_center(), player.get_normal_distance(), player.get_angular_speed(), 3, obstacle_list, seed)
+        else:
+            perfection_drawer = PerfectionDrawer((50, 50), 30, COLORS["GREEN"], COLORS["RED"], COLORS["WHITE"], level)
+            obstacle_manager = LevelObstaclesManager(player.get_center(), player.get_normal_distance(), player.get_angular_speed(), level, perfection_drawer)
+
+        player.resize(resolution)
+        obstacle_manager.resize(resolution, player.get_center(), player.get_normal_distance())
+        self._gameplay = Gameplay(player, obstacle_manager, perfection_drawer, recorder, reset_on_collision)
+
+    def step(self) -> None:
+        """Simulates one frame of 'dt' seconds."""
+        start = perf_counter()
+
+        for key in self._input.advance(self._dt):
+            pg.event.post(pg.event.Event(pg.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+
+        for event in pg.event.get(exclude=Gameplay.GAME_EVENTS): # The gameplay's own events are handled by its tick
+            self._gameplay.update_by_event(event)
+
+        self._gameplay.tick(self._dt)
+
+        if self._render:
+            self._screen.fill(COLORS["BLACK"])
+            self._gameplay.get_player().draw(self._screen)
+            self._gameplay.get_obstacles_manager().draw(self._screen)
+
+        self._frame += 1
+        self._time += self._dt
+        self._wall_time += perf_counter() - start
+
+    def run(self, max_frames: int, levels_to_complete: int | None = None) -> dict[str, Any]:
+        """Simulates until 'max_frames' frames, the end of the random mode or the completion of 'levels_to_complete' levels, returning the summary."""
+        for _ in range(max_frames):
+            if self.check_finished(levels_to_complete): break
+            self.step()
+
+        return self.get_summary()
+
+    def check_finished(self, levels_to_complete: int | None = None) -> bool:
+        """Returns if the random mode ended or 'levels_to_complete' levels were completed."""
+        return self._gameplay.is_game_ended() or (levels_to_complete != None and self._gameplay.get_levels_completed() >= levels_to_complete)
+
+    def set_scripted_input(self, scripted_input: Any) -> None:
+        """Replaces the input from now on (like the one given to '__init__')."""
+        self._input = scripted_input
+        InputHandler.set_scripted_input(scripted_input)
+
+    def set_render(self, render: bool) -> None: self._render = render
+
+    def resize(self, resolution: tuple[int, int]) -> None:
+        """Resizes the game like a resize of the window does (before the next step)."""
+        self._screen = pg.Surface(resolution)
+        self._gameplay.resize(resolution)
+
+    def get_snapshot(self) -> "SimulationSnapshot":
+        """Returns a copy of the whole state of the simulation, to continue it later from this frame (see 'SimulationSnapshot.restore')."""
+        return SimulationSnapshot(self)
+
+    def close(self) -> None:
+        """Gives the input back to pygame and saves the progress again."""
+        InputHandler.set_scripted_input(None)
+        AchievementsHandler.set_save_progress(True)
+        PerfectionLevelsHandler.set_save_progress(True)
+
+    def get_summary(self) -> dict[str, Any]:
+        """Returns the results of the simulation until now, including how many times faster than real time it ran."""
+        summary = {
+            "mode" : self._mode,
+            "frames" : self._frame,
+            "simulated_time" : round(self._time, 6),
+            "wall_time" : round(self._wall_time, 6),
+            "speedup" : round(self._time / self._wall_time, 1) if self._wall_time > 0 else 0.0
+        }
+
+        summary.update((key, value) for key, value in self._gameplay.get_result().items() if key != "frames") # Its ticks are the frames until the end
+        return summary
+
+    def get_result(self) -> dict[str, Any]:
+        """Returns the gameplay's result (see 'Gameplay.get_result'), without the times of the summary."""
+        return self._gameplay.get_result()
+
+    def get_levels_completed(self) -> int: return self._gameplay.get_levels_completed()
+
+    def get_frame(self) -> int: return self._frame
+
+    def get_time(self) -> float: return self._time
+
+    def get_player(self) -> Player: return self._gameplay.get_player()
+
+    def get_obstacles_manager(self) -> BaseObstaclesManager: return self._gameplay.get_obstacles_manager()
+
+    def get_gameplay(self) -> Gameplay: return self._gameplay
+
+    def get_screen(self) -> pg.Surface: return self._screen
+
+class SimulationSnapshot:
+    """The state of a 'Simulation' in a frame: a deep copy of it plus what lives outside of it (the 'random' module and the queued events).
+
+        Only one simulation runs at a time (they share the 'InputHandler' and pygame's event queue), so restoring one replaces the current.
+        The recorder isn't part of the state, a restored simulation doesn't record.
+    """
+    def __init__(self, simulation: Simulation) -> None:
+        memo = self._get_shared_memo()
+        memo[id(simulation._recorder)] = None
+        self._simulation = deepcopy(simulation, memo)
+        self._random_state = random_getstate()
+        self._events = pg.event.get() # Posted by the last update, handled by the next step
+        for event in self._events:
+            pg.event.post(event)
+
+    def restore(self) -> Simulation:
+        """Returns a new simulation from the snapshot's frame (the snapshot stays unchanged, to be restored again)."""
+        simulation = deepcopy(self._simulation, self._get_shared_memo())
+        random_setstate(self._random_state)
+        pg.event.clear()
+        for event in self._events:
+            pg.event.post(event)
+
+        InputHandler.set_scripted_input(simulation._input)
+        AchievementsHandler.set_save_progress(False)
+        PerfectionLevelsHandler.set_save_progress(False)
+        return simulation
+
+    def get_frame(self) -> int: return self._simulation.get_frame()
+
+    @staticmethod
+    def _get_shared_memo() -> dict[int, Any]:
+        """The objects shared by all the copies, instead of copied (they can't be: the font is a file)."""
+        font = get_font()
+        return { id(font) : font }
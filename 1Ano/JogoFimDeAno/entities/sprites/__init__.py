@@ -0,0 +1,2 @@
+from .sprite_cache import SpriteCache
+from .rotation_cache import RotationCache
@@ -0,0 +1,38 @@
+import pygame as pg
+from collections import OrderedDict
+
+class RotationCache:
+    """Rotations of a source surface at quantized angles, rendered when first used, so an object that keeps rotating reuses them.
+
+        The angles are rounded to 'steps' per turn and the rotations are kept in a LRU of 'max_rotations' (by default a whole turn).
+        Setting a new source (or clearing) evicts all of them.
+    """
+    def __init__(self, steps: int = 180, max_rotations: int = 180) -> None:
+        self._steps = steps
+        self._max_rotations = max_rotations
+        self._source: pg.Surface | None = None
+        self._rotations: OrderedDict[int, pg.Surface] = OrderedDict()
+
+    def get(self, angle: float) -> pg.Surface:
+        """Returns the source rotated (counterclockwise, in degrees, like 'pg.transform.rotate') by the nearest quantized angle."""
+        step = round(angle % 360 * self._steps / 360) % self._steps
+        rotation = self._rotations.get(step)
+
+        if rotation is None:
+            rotation = self._rotations[step] = pg.transform.rotate(self._source, step * 360 / self._steps)
+            if len(self._rotations) > self._max_rotations:
+                self._rotations.popitem(last=False)
+        else:
+            self._rotations.move_to_end(step)
+
+        return rotation
+
+    def set_source(self, source: pg.Surface) -> None:
+        self._source = source
+        self._rotations.clear()
+
+    def has_source(self) -> bool: return self._source != None
+
+    def clear(self) -> None:
+        self._source = None
+        self._rotations.clear()
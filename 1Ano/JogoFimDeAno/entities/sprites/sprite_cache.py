@@ -0,0 +1,61 @@
+import pygame as pg
+from collections import OrderedDict
+
+class SpriteCache:
+    """Cache of pre-rendered primitives, so the draws that used to create an auxiliary surface every frame are reduced to blits.
+
+        The sprites are keyed by (shape, radius, color, alpha, width), rendered once per resolution and evicted when the resolution changes.
+    """
+    _sprites: OrderedDict[tuple[str, int, tuple[int, ...], int, int], pg.Surface] = OrderedDict()
+    _max_sprites = 512 # LRU bound, the particles change their radius every frame
+    _resolution: tuple[int, int] | None = None
+    _enabled = True
+
+    @classmethod
+    def get_circle(self, radius: int, color: tuple[int, int, int], alpha: int = 255, width: int = 0) -> pg.Surface:
+        """Returns a (2 * radius)² surface with a circle (or a ring if 'width' > 0) in its center and black as colorkey."""
+        key = ("circle", radius, tuple(color), alpha, width)
+
+        if not self._enabled: return self._render(key)
+
+        sprite = self._sprites.get(key)
+
+        if sprite is None:
+            sprite = self._render(key)
+            self._sprites[key] = sprite
+            if len(self._sprites) > self._max_sprites:
+                self._sprites.popitem(last=False)
+        else:
+            self._sprites.move_to_end(key)
+        
+        return sprite
+
+    @classmethod
+    def resize(self, new_resolution: tuple[int, int]) -> None:
+        """Evicts the sprites rendered for another resolution."""
+        if new_resolution == self._resolution: return
+
+        self._sprites.clear()
+        self._resolution = tuple(new_resolution)
+
+    @classmethod
+    def clear(self) -> None:
+        self._sprites.clear()
+
+    @classmethod
+    def set_enabled(self, enabled: bool) -> None:
+        """Enables or disables the cache (disabled, every sprite is rendered again, used by the benchmarks)."""
+        self._enabled = enabled
+        self._sprites.clear()
+
+    @staticmethod
+    def _render(key: tuple[str, int, tuple[int, ...], int, int]) -> pg.Surface:
+        _, radius, color, alpha, width = key
+
+        surf = pg.Surface((radius * 2, radius * 2))
+        surf.set_colorkey((0, 0, 0))
+        if alpha < 255:
+            surf.set_alpha(alpha)
+        pg.draw.circle(surf, color, (radius, radius), radius, width)
+
+        return surf
@@ -1 +1,3 @@
 from .stain_generator import *
+from .stain_stamps import StainStamps
+from .stain_layer import StainLayer
@@ -0,0 +1,60 @@
+import pygame as pg
+from .stain_stamps import StainStamps
+
+class StainLayer:
+    """The ink stains of an obstacle, painted straight in its current size with the stamps of 'StainStamps'.
+
+        Each stain is kept as (shape, x, y, radius, color) in the obstacle's base size, so a new stain only blits its stamp
+        (touching just its rect) and a resize paints the stains again in the new size, instead of rescaling the pixels.
+        The surface is only created with the first stain.
+    """
+    def __init__(self, base_size: tuple[int, int]) -> None:
+        self._base_size = base_size
+        self._size = (round(base_size[0]), round(base_size[1]))
+        self._stains: list[tuple[int, float, float, float, tuple[int, int, int]]] = []
+        self._surface: pg.Surface | None = None
+
+    def paint(self, pos: tuple[float, float], radius: float, color: tuple[int, int, int]) -> None:
+        """Paints a new stain, with its position and radius in the base size."""
+        stain = (StainStamps.pick_shape(), pos[0], pos[1], radius, color)
+        self._stains.append(stain)
+
+        if self._surface is None:
+            self._surface = pg.Surface(self._size, pg.SRCALPHA)
+            self._surface.fill((0, 0, 0, 0))
+
+        self._blit_stain(stain)
+
+    def resize(self, new_size: tuple[int, int]) -> None:
+        new_size = (round(new_size[0]), round(new_size[1]))
+        if new_size == self._size: return
+
+        self._size = new_size
+        if not self._stains: return
+
+        self._surface = pg.Surface(self._size, pg.SRCALPHA)
+        self._surface.fill((0, 0, 0, 0))
+        for stain in self._stains:
+            self._blit_stain(stain)
+
+    def reset_from(self, template: "StainLayer") -> None:
+        """Clears the stains and takes the sizes of 'template' (used by the obstacles pools), keeping the surface when possible."""
+        self._base_size = template._base_size
+        self._stains.clear()
+
+        if self._surface != None and self._surface.size == template._size:
+            self._surface.fill((0, 0, 0, 0))
+        else:
+            self._surface = None
+        self._size = template._size
+
+    def has_stains(self) -> bool: return len(self._stains) > 0
+
+    def get_surface(self) -> pg.Surface | None: return self._surface
+
+    def _blit_stain(self, stain: tuple[int, float, float, float, tuple[int, int, int]]) -> None:
+        shape, x, y, radius, color = stain
+        scale = (self._size[0] / self._base_size[0], self._size[1] / self._base_size[1])
+
+        stamp = StainStamps.get_stamp(shape, radius * scale[0], color)
+        self._surface.blit(stamp, stamp.get_rect(center=(round(x * scale[0]), round(y * scale[1]))))
@@ -0,0 +1,86 @@
+import pygame as pg
+from collections import OrderedDict
+from math import cos, sin, pi, ceil
+from random import Random, randrange
+
+class StainStamps:
+    """Pool of pre-generated stain shapes ('random' ink stains like the 'generate_stain' ones), rasterized once per (shape, radius, color).
+
+        The shapes are kept as vectors of radius 1 (a circle-like polygon and the circles around it), generated from a fixed seed,
+        so painting a stain is just blitting a cached stamp. The stamps are kept in a LRU, as the radius changes with the resolution.
+    """
+    _seed = 0
+    _amount_shapes = 32
+    _distance_mult = 1.5 # Max distance of the small circles around the stain, in radii (the 'max_distance' used by the obstacles)
+    _shapes: list[tuple[list[tuple[float, float]], list[tuple[float, float, float]]]] = []
+    _stamps: OrderedDict[tuple[int, int, tuple[int, ...]], pg.Surface] = OrderedDict()
+    _max_stamps = 128
+
+    @classmethod
+    def pick_shape(self) -> int:
+        """Returns a random shape of the pool (by the 'random' module, so it follows its seed)."""
+        return randrange(self._amount_shapes)
+
+    @classmethod
+    def get_stamp(self, shape: int, radius: float, color: tuple[int, int, int]) -> pg.Surface:
+        """Returns the stamp of 'shape' with 'radius' (in pixels) and 'color', with the stain's center in the center of the surface."""
+        key = (shape, max(1, round(radius)), tuple(color))
+        stamp = self._stamps.get(key)
+
+        if stamp is None:
+            stamp = self._stamps[key] = self._render(*key)
+            if len(self._stamps) > self._max_stamps:
+                self._stamps.popitem(last=False)
+        else:
+            self._stamps.move_to_end(key)
+
+        return stamp
+
+    @classmethod
+    def set_seed(self, seed: int) -> None:
+        """Generates the pool again from another seed."""
+        self._seed = seed
+        self._shapes = []
+        self._stamps.clear()
+
+    @classmethod
+    def _get_shapes(self) -> list[tuple[list[tuple[float, float]], list[tuple[float, float, float]]]]:
+        if not self._shapes:
+            rng = Random(self._seed)
+            self._shapes = [ self._generate_shape(rng) for _ in range(self._amount_shapes) ]
+        return self._shapes
+
+    @classmethod
+    def _generate_shape(self, rng: Random) -> tuple[list[tuple[float, float]], list[tuple[float, float, float]]]:
+        """Generates a stain of radius 1 centered in (0, 0), in the same way as 'generate_stain'."""
+        points = [ # random circle-like polygon
+            (cos(i * 2 * pi / 50) * (1 - rng.uniform(0, 0.1)), sin(i * 2 * pi / 50) * (1 - rng.uniform(0, 0.1)))
+            for i in range(50)
+        ]
+
+        circles = [ # random circles inside the polygon's border
+            (cos(i * 2 * pi / 20) * (1 - rng.uniform(0.2, 0.4)), sin(i * 2 * pi / 20) * (1 - rng.uniform(0.2, 0.4)), rng.uniform(0.2, 0.4))
+            for i in range(20)
+        ]
+
+        for _ in range(20): # Random small circles around the main stain
+            ang = rng.uniform(0, 2 * pi)
+            distance = rng.uniform(1, max(1, self._distance_mult - 0.1))
+            circles.append((cos(ang) * distance, sin(ang) * distance, rng.uniform(0.01, 0.1)))
+
+        return points, circles
+
+    @classmethod
+    def _render(self, shape: int, radius: int, color: tuple[int, ...]) -> pg.Surface:
+        points, circles = self._get_shapes()[shape]
+        half_size = ceil(radius * self._distance_mult) + 1
+        center = (half_size, half_size)
+
+        stamp = pg.Surface((half_size * 2, half_size * 2), pg.SRCALPHA)
+        stamp.fill((0, 0, 0, 0))
+
+        pg.draw.polygon(stamp, color, [ (round(x * radius + center[0]), round(y * radius + center[1])) for x, y in points ])
+        for x, y, circle_radius in circles:
+            pg.draw.circle(stamp, color, (round(x * radius + center[0]), round(y * radius + center[1])), round(circle_radius * radius))
+
+        return stamp
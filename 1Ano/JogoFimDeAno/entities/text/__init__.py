@@ -1,2 +1,4 @@
+from .glyph_atlas import GlyphAtlas
+from .text_renderer import TextRenderer
 from .text import Text
 from .score_text import ScoreText
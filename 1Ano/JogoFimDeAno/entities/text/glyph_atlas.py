@@ -0,0 +1,71 @@
+import pygame as pg
+import pygame.freetype as pgft
+
+class GlyphAtlas:
+    """The glyphs of one (font, size, color) rasterized once in a single sheet, so a string is composed by blitting them.
+
+        The glyphs are added to the sheet when first used. The composed string has the same pixels and rect as 'pgft.Font.render'
+        with the default style (the font has no kerning, so each glyph is placed by the advance of the previous ones).
+    """
+    def __init__(self, font: pgft.Font, size: float, color: tuple[int, ...]) -> None:
+        self._font = font
+        self._size = size
+        self._color = color
+        self._sheet = pg.Surface((0, 0), pg.SRCALPHA)
+        self._used_width = 0
+        self._glyphs: dict[str, tuple[pg.Rect, pg.Rect, float]] = {} # Area in the sheet, rect like the 'render' one (bearing x, height above the baseline) and advance
+
+    def render(self, text: str) -> tuple[pg.Surface, pg.Rect]:
+        """Returns the surface and the rect of 'text', like 'pgft.Font.render(text, color, size=size)'."""
+        glyphs = [ self._get_glyph(char) for char in text ]
+
+        pen = 0.0
+        left = right = None
+        placed: list[tuple[pg.Rect, pg.Rect, int]] = []
+        for area, rect, advance in glyphs:
+            if area.width and area.height:
+                x = round(pen)
+                placed.append((area, rect, x))
+                glyph_left, glyph_right = x + rect.x, x + rect.x + rect.width
+            else: # The font keeps the spaces (when on the edges) in the width
+                glyph_left, glyph_right = round(pen), round(pen + advance)
+            left = glyph_left if left is None else min(left, glyph_left)
+            right = glyph_right if right is None else max(right, glyph_right)
+            pen += advance
+
+        if not placed: # Only spaces (or nothing), rare enough to let the font do it
+            return self._font.render(text, self._color, size=self._size)
+
+        top = max(rect.y for _, rect, _ in placed)
+        bottom = max(rect.height - rect.y for _, rect, _ in placed)
+
+        surf = pg.Surface((right - left, top + bottom), pg.SRCALPHA)
+        surf.fill((0, 0, 0, 0))
+        for area, rect, x in placed:
+            surf.blit(self._sheet, (x + rect.x - left, top - rect.y), area)
+
+        return surf, pg.Rect(left, top, right - left, top + bottom)
+
+    def _get_glyph(self, char: str) -> tuple[pg.Rect, pg.Rect, float]:
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            glyph = self._glyphs[char] = self._add_glyph(char)
+        return glyph
+
+    def _add_glyph(self, char: str) -> tuple[pg.Rect, pg.Rect, float]:
+        """Rasterizes 'char' and places it on the right of the sheet, growing the sheet when it doesn't fit."""
+        glyph_surf, glyph_rect = self._font.render(char, self._color, style=pgft.STYLE_DEFAULT, size=self._size)
+        metrics = self._font.get_metrics(char, size=self._size)[0]
+        advance = metrics[4] if metrics != None else glyph_rect.width
+
+        if self._used_width + glyph_rect.width > self._sheet.width or glyph_rect.height > self._sheet.height:
+            sheet = pg.Surface((max(2 * self._sheet.width, self._used_width + glyph_rect.width, 64), max(self._sheet.height, glyph_rect.height)), pg.SRCALPHA)
+            sheet.fill((0, 0, 0, 0))
+            sheet.blit(self._sheet, (0, 0)) # Over transparent pixels the blit copies them as they are
+            self._sheet = sheet
+
+        area = pg.Rect(self._used_width, 0, glyph_rect.width, glyph_rect.height)
+        self._sheet.blit(glyph_surf, area)
+        self._used_width += glyph_rect.width
+
+        return area, glyph_rect, advance
@@ -1,5 +1,6 @@
 import pygame as pg
 import pygame.freetype as pgft
+from .text_renderer import TextRenderer
 from scripts import scale_dimension, scale_position, BASE_RESOLUTION
 
 class ScoreText:
@@ -38,6 +39,8 @@ class ScoreText:
         self._surface, self._surface_rect = self._generate_surface()
     
     def set_score(self, new_score: int) -> None:
+        if max(0, new_score) == self._score: return
+
         self._score = max(0, new_score)
         self._surface, self._surface_rect = self._generate_surface()
     
@@ -45,13 +48,13 @@ class ScoreText:
         len_0s = self._num_0s - len(str(self._score))
 
         if len_0s <= 0:
-            text_surf, text_rect = self._font.render(str(self._score), self._colors[0], size=self._font_size)
+            text_surf, text_rect = TextRenderer.render(self._font, str(self._score), self._colors[0], self._font_size)
             text_rect.topleft = (0, 0)
             surf = pg.Surface(text_rect.size)
             surf.blit(text_surf, text_rect)
         else:
-            text_0_surf, text_0_rect = self._font.render("0" * len_0s, self._colors[1], size=self._font_size)
-            score_surf, score_rect = self._font.render(str(self._score), self._colors[0], size=self._font_size)
+            text_0_surf, text_0_rect = TextRenderer.render(self._font, "0" * len_0s, self._colors[1], self._font_size)
+            score_surf, score_rect = TextRenderer.render(self._font, str(self._score), self._colors[0], self._font_size)
 
             spacing_2_surfs = self._font.get_rect("0" + str(self._score)[0], size=self._font_size).width - self._font.get_rect("0", size=self._font_size).width - self._font.get_rect(str(self._score)[0], size=self._font_size).width
 
@@ -1,5 +1,7 @@
 import pygame as pg
 import pygame.freetype as pgft
+from .text_renderer import TextRenderer
+from ..render import DirtyTracker
 from scripts import scale_position, scale_dimension, BASE_RESOLUTION
 
 class Text:
@@ -13,11 +15,13 @@ class Text:
         self._base_size = self._size
         self._base_pos = self._pos
         self._base_resolution = base_rslt
+        self._dirty_tracker = DirtyTracker()
         self.render()
     
     def render(self) -> None:
-        self._text_surf, self._text_rect = self._font.render(self._text, self._color, size=self._size)
+        self._text_surf, self._text_rect = TextRenderer.render(self._font, self._text, self._color, self._size)
         setattr(self._text_rect, self._pos_attr, self._pos)
+        self._dirty_tracker.mark()
     
     def draw(self, screen: pg.Surface) -> None:
         screen.blit(self._text_surf, self._text_rect)
@@ -28,5 +32,9 @@ class Text:
         self.render()
 
     def set_text(self, new_text: str) -> None:
+        if new_text == self._text: return
+
         self._text = new_text
         self.render()
+
+    def get_dirty_rects(self) -> list[pg.Rect]: return self._dirty_tracker.collect(self._text_rect)
@@ -0,0 +1,61 @@
+import pygame as pg
+import pygame.freetype as pgft
+from .glyph_atlas import GlyphAtlas
+from collections import OrderedDict
+
+class TextRenderer:
+    """Renders the texts of the widgets ('Text', 'ScoreText', 'TextButton'...) with caches, instead of 'pgft.Font.render' every time.
+
+        Texts with the default style are composed from a 'GlyphAtlas' per (font, size, color), so a changing text (FPS, score) only
+        blits glyphs already rasterized. Styled (strong...) or rotated texts can't be composed glyph by glyph, as the style is applied
+        to the whole string, so they are cached whole. Both caches are LRUs, and the returned surfaces mustn't be changed.
+    """
+    _atlases: OrderedDict[tuple[int, float, tuple[int, ...]], GlyphAtlas] = OrderedDict()
+    _max_atlases = 64
+    _texts: OrderedDict[tuple[int, str, tuple[int, ...], float, int, int], tuple[pg.Surface, pg.Rect]] = OrderedDict()
+    _max_texts = 256
+    _enabled = True
+
+    @classmethod
+    def render(self, font: pgft.Font, text: str, color: tuple[int, ...] | None, size: float = 0, style: int = pgft.STYLE_DEFAULT, rotation: int = 0) -> tuple[pg.Surface, pg.Rect]:
+        """Returns the surface and a new rect of 'text', like 'font.render(text, color, None, style, rotation, size)'."""
+        color = tuple(font.fgcolor if color is None else color)
+
+        if not self._enabled:
+            return font.render(text, color, None, style, rotation, size)
+
+        if style == pgft.STYLE_DEFAULT and rotation == 0:
+            return self._get_atlas(font, size, color).render(text)
+
+        key = (id(font), text, color, size, style, rotation)
+        rendered = self._texts.get(key)
+
+        if rendered is None:
+            rendered = self._texts[key] = font.render(text, color, None, style, rotation, size)
+            if len(self._texts) > self._max_texts:
+                self._texts.popitem(last=False)
+        else:
+            self._texts.move_to_end(key)
+
+        return rendered[0], rendered[1].copy()
+
+    @classmethod
+    def set_enabled(self, enabled: bool) -> None:
+        """Enables or disables the caches (disabled, every text is rendered by the font, used by the benchmarks)."""
+        self._enabled = enabled
+        self._atlases.clear()
+        self._texts.clear()
+
+    @classmethod
+    def _get_atlas(self, font: pgft.Font, size: float, color: tuple[int, ...]) -> GlyphAtlas:
+        key = (id(font), size, color)
+        atlas = self._atlases.get(key)
+
+        if atlas is None:
+            atlas = self._atlases[key] = GlyphAtlas(font, size, color)
+            if len(self._atlases) > self._max_atlases:
+                self._atlases.popitem(last=False)
+        else:
+            self._atlases.move_to_end(key)
+
+        return atlas
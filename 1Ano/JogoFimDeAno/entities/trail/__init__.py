@@ -0,0 +1,2 @@
+from .trail_history import TrailHistory
+from .trail_renderer import TrailRenderer
@@ -0,0 +1,77 @@
+from math import ceil
+from typing import Any, Callable, Iterator
+
+class TrailHistory:
+    """Fixed capacity ring buffer with the samples of a trail (tracker), keyed by absolute timestamps.
+
+        Only one sample is kept for each 'spacing' seconds, on a fixed grid of the trail's clock (the newest one keeps following the
+        current position), so at any framerate from 1 / 'spacing' up there are as many samples, and the memory and the draw cost
+        don't grow with the framerate.
+    """
+    def __init__(self, lifetime: float, spacing: float = 1 / 60) -> None:
+        self._lifetime = lifetime
+        self._spacing = spacing
+        self._capacity = ceil(lifetime / spacing - 1e-9) + 2 # The samples of a lifetime + the live one + the one being expired
+        self._values: list[Any] = [None] * self._capacity
+        self._times: list[float] = [0.0] * self._capacity
+        self._start = 0 # Index of the oldest sample
+        self._length = 0
+        self._time = 0.0
+        self._next_commit_time = 0.0
+
+    def advance(self, dt: float) -> None:
+        """Advances the trail's clock and expires the samples older than the lifetime (amortized O(1))."""
+        self._time += dt
+
+        while self._length > 0 and self._time - self._times[self._start] >= self._lifetime - 1e-9: # Tolerance for the float error accumulated by the clock
+            self._values[self._start] = None
+            self._start = (self._start + 1) % self._capacity
+            self._length -= 1
+
+    def record(self, value: Any) -> None:
+        """Records the current sample. Before the next time of the grid, the last one is just replaced."""
+        if self._length > 0 and self._time < self._next_commit_time - 1e-9: # Tolerance for the float error accumulated by the clock
+            newest = (self._start + self._length - 1) % self._capacity
+        else:
+            if self._length == self._capacity: # Full, the oldest one is overwritten
+                self._start = (self._start + 1) % self._capacity
+                self._length -= 1
+
+            newest = (self._start + self._length) % self._capacity
+            self._length += 1
+            self._next_commit_time += self._spacing
+            if self._next_commit_time <= self._time: # After a long frame the grid starts again from now
+                self._next_commit_time = self._time + self._spacing
+
+        self._values[newest] = value
+        self._times[newest] = self._time
+
+    def items(self) -> Iterator[tuple[Any, float]]:
+        """Iterates over the samples (oldest first) with their ages in seconds."""
+        for i in range(self._length):
+            index = (self._start + i) % self._capacity
+            yield (self._values[index], self._time - self._times[index])
+
+    def remap(self, function: Callable[[Any, float], Any]) -> None:
+        """Replaces each sample by 'function(sample, age)', used to reposition the samples after a resize."""
+        for i in range(self._length):
+            index = (self._start + i) % self._capacity
+            self._values[index] = function(self._values[index], self._time - self._times[index])
+
+    def clear(self) -> None:
+        self._values = [None] * self._capacity
+        self._start = 0
+        self._length = 0
+        self._time = 0.0
+        self._next_commit_time = 0.0
+
+    def __len__(self) -> int: return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(self._length):
+            yield self._values[(self._start + i) % self._capacity]
+
+    def __getitem__(self, i: int) -> Any:
+        if not -self._length <= i < self._length: raise IndexError("TrailHistory: Index out of range.")
+
+        return self._values[(self._start + i % self._length) % self._capacity]
@@ -0,0 +1,72 @@
+import pygame as pg
+from scripts import get_diagonal_line, COLORS
+
+class TrailRenderer:
+    """Draws a fading trail of circles (like the Player's tracker) reusing the same buffer between frames."""
+    def __init__(self, initial_alpha: int, min_spacing: int = 2, growth_factor: float = 1.25) -> None:
+        self._initial_alpha = initial_alpha
+        self._min_spacing = min_spacing # pixels
+        self._growth_factor = growth_factor
+        self._buffer = pg.Surface((0, 0), pg.SRCALPHA)
+        self._ramps: dict[int, tuple[list[int], list[int]]] = {}
+        self._ramps_radius = 0.0
+
+    def draw(self, screen: pg.Surface, points: list[tuple[float, float]], radius: float, color: tuple[int, int, int]) -> None:
+        """Draws the trail with the 'points' (oldest first) on the 'screen'.
+
+            Points closer than 'min_spacing' pixels from the last drawn point are skipped, because they would be covered by the next circle and its connection.
+            So the amount of draws depends on the length of the trail in pixels and not on the framerate.
+        """
+        len_points = len(points)
+        if len_points < 2: return
+
+        xs = [ p[0] for p in points ]
+        ys = [ p[1] for p in points ]
+        topleft = (round(min(xs) - radius), round(min(ys) - radius))
+        area = pg.Rect(0, 0, round(max(xs) + radius) - topleft[0], round(max(ys) + radius) - topleft[1])
+
+        self._reserve_buffer(area.size)
+        self._buffer.fill(COLORS["BLANK"], area)
+
+        alphas, radii = self._get_ramps(len_points, radius)
+        last_point: tuple[int, int] | None = None
+        last_radius = 0
+
+        for j in range(len_points):
+            point = (round(xs[j] - topleft[0]), round(ys[j] - topleft[1]))
+
+            if last_point is not None and j != len_points - 1 and abs(point[0] - last_point[0]) + abs(point[1] - last_point[1]) < self._min_spacing: continue
+
+            col = (*color, alphas[j])
+            pg.draw.circle(self._buffer, col, point, radii[j])
+            if last_point is not None:
+                pg.draw.polygon(self._buffer, col, get_diagonal_line(last_point, last_radius, point, radii[j]))
+
+            last_point = point
+            last_radius = radii[j]
+
+        screen.blit(self._buffer, topleft, area)
+
+    def _reserve_buffer(self, size: tuple[int, int]) -> None:
+        """Grows the buffer only when the trail doesn't fit on it, with some margin to avoid reallocating every frame."""
+        if size[0] <= self._buffer.width and size[1] <= self._buffer.height: return
+
+        new_size = (max(self._buffer.width, round(size[0] * self._growth_factor)), max(self._buffer.height, round(size[1] * self._growth_factor)))
+        self._buffer = pg.Surface(new_size, pg.SRCALPHA)
+
+    def _get_ramps(self, length: int, radius: float) -> tuple[list[int], list[int]]:
+        """Returns the alpha and radius of each index of a trail with 'length' points, calculated once per length."""
+        if radius != self._ramps_radius: # The radius only changes on resize
+            self._ramps.clear()
+            self._ramps_radius = radius
+
+        ramps = self._ramps.get(length)
+
+        if ramps is None:
+            ramps = (
+                [ round(self._initial_alpha / length * j) for j in range(length) ],
+                [ round(radius / length * j) for j in range(length) ]
+            )
+            self._ramps[length] = ramps
+
+        return ramps
@@ -1,13 +1,36 @@
 from os import environ
+from sys import argv
 environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1" # Hide Pygame Support Message
+if "--headless" in argv: # The drivers are read when pygame (and the mixer, in 'scripts') initializes
+    environ["SDL_VIDEODRIVER"] = "dummy"
+    environ["SDL_AUDIODRIVER"] = "dummy"
+
+startup_profiler = None
+if "--startup-profile" in argv: # Started before the imports, to time them too
+    # Loaded by its path, importing it from 'entities' would import the whole game before it starts. It's kept in 'sys.modules'
+    # by its name, so 'entities.profiler' gets this same module later
+    from importlib.util import module_from_spec, spec_from_file_location
+    from os.path import dirname, join
+    from sys import modules
+    spec = spec_from_file_location("entities.profiler.startup_profiler", join(dirname(__file__), "entities", "profiler", "startup_profiler.py"))
+    startup_profiler_module = modules[spec.name] = module_from_spec(spec)
+    spec.loader.exec_module(startup_profiler_module)
+    startup_profiler = startup_profiler_module.StartupProfiler.start()
 
 import pygame as pg
 import pygame.freetype as pgft
-from scripts import BASE_RESOLUTION, INITIAL_MAX_FPS, FONT, COLORS, get_file_path, play_random_bg_music, get_music_volume, set_music_volume
-from entities import Player, RandomObstaclesManager, LevelObstaclesManager, get_obstacle_list, get_3p_obstacle_list, ButtonGroup, CircularImageButton, PauseButton, ReturnButton, TextButton, Text, ScoreText, Organizer, OrganizerDirection, OrganizerOrientation, LevelsOrganizer, Limiter, Line, GradientLine, BackgroundGetter, CustomEventHandler, CustomEventList, EventPauser, AchievementsGrid, AchievementsDrawer, AchievementsHandler, PerfectionDrawer, MouseHandler
+from scripts import BASE_RESOLUTION, INITIAL_MAX_FPS, GAME_TICK, COLORS, get_font
+from entities import Player, get_obstacle_list, get_3p_obstacle_list, ButtonGroup, CircularImageButton, PauseButton, ReturnButton, TextButton, Text, ScoreText, Organizer, OrganizerDirection, OrganizerOrientation, Limiter, Line, GradientLine, BackgroundGetter, CustomEventList, AchievementsDrawer, AchievementsHandler, PerfectionDrawer, MouseHandler, DirtyRectRenderer, ResizeScheduler, AssetManager, MusicScheduler, SaveStore, FrameProfiler, ProfilerOverlay, StartupProfiler, InputHandler, ScriptedInput
+from argparse import ArgumentParser, Namespace
+from json import dumps as json_dumps
 from enum import IntEnum, auto
-from time import time
-from typing import Any
+from random import randrange
+from time import perf_counter, time
+from typing import Any, Callable
+# The obstacles managers, 'LevelsOrganizer', 'AchievementsGrid' and the simulation are imported by the windows that use them (see 'entities')
+
+if startup_profiler != None:
+    startup_profiler.mark("imports")
 
 class DeltaTimeCalculator:
     """Class that calculates automatically the 'deltatime' to the framerate independence."""
@@ -37,16 +60,18 @@ class WindowsKeys(IntEnum):
     SHOWACHIEVEMENTS = auto()
 
 class Game:
-    def __init__(self) -> None:
-        pg.init()
+    def __init__(self, startup_profiler: "StartupProfiler | None" = None) -> None:
+        pg.display.init() # The mixer (the slowest to start) only starts with the musics, after the first frame
 
         self.__screen: pg.Surface = pg.display.set_mode(BASE_RESOLUTION, pg.RESIZABLE)
         pg.display.set_caption("Duet")
-        icon_img = pg.image.load(get_file_path("../images/icon.png")).convert_alpha()
+        AssetManager.preload() # Reads and decodes the images while the main menu starts
+        icon_img = AssetManager.get_image("icon.png")
         pg.display.set_icon(icon_img)
         self.__clock: pg.time.Clock = pg.time.Clock()
         self.__MAX_FPS = INITIAL_MAX_FPS
-        self.__FONT = FONT
+        self.__MAX_TICKS_TIME = 0.25 # The most game time a frame simulates, after a long frame the game slows down instead
+        self.__FONT = get_font()
         self.__current_window = WindowsKeys.MAINMENU
         self.__windows = {
             WindowsKeys.MAINMENU : self.main_menu,
@@ -61,8 +86,20 @@ class Game:
         self._rnd_mode_settings = [2, [COLORS["RED"], COLORS["BLUE"]], get_obstacle_list]
         self.__start_level = 0
         self.__show_fps = True
+        self.__animated_backgrounds = True
+        self.__dirty_rendering = False # Menus only redraw the areas that changed (see '_render_menu')
+        self.__renderer = DirtyRectRenderer()
+        self.__resize_scheduler = ResizeScheduler(self.__screen.get_size()) # The windows only get a resize when the size settles
         self.__delta_time = DeltaTimeCalculator()
         self.__achievements_drawer = AchievementsDrawer(self.__screen.size, self.__FONT, 20, 16, 10, COLORS["WHITE"], (100, 100, 100))
+        self.__profiler_overlay = ProfilerOverlay(self.__FONT, (10, BASE_RESOLUTION[1] - 10), "bottomleft") # F3 in the game modes
+        self.__startup_profiler = startup_profiler # '--startup-profile', reported after the first frame
+        self.__scripted_input: ScriptedInput | None = None # See 'run_window'
+        self.__scripted_input_time = 0.0
+        self.__first_frame = True
+
+        if self.__startup_profiler != None:
+            self.__startup_profiler.mark("Game()")
 
     def run(self) -> None:
         while self.__current_window != WindowsKeys.QUIT:
@@ -73,8 +110,27 @@ class Game:
             if window == None: break
             else: window()
         
+        SaveStore.flush() # The progress still being saved in the background
         pg.quit()
 
+    def run_window(self, window: WindowsKeys, scripted_input: ScriptedInput | None = None) -> None:
+        """Runs only 'window', until it changes to another one (the checks of the game modes use it, see 'benchmarks.replay').
+
+            With 'scripted_input' the game follows it instead of the keyboard and the mouse, advanced by the real time once a frame
+            (like pygame's input, which only changes when the events are read).
+        """
+        self.__current_window = window
+        self.__scripted_input = scripted_input
+        self.__scripted_input_time = perf_counter()
+        InputHandler.set_scripted_input(scripted_input)
+        self.__delta_time.set_actual_time()
+
+        try:
+            self.__windows[window]()
+        finally:
+            self.__scripted_input = None
+            InputHandler.set_scripted_input(None)
+
     def main_menu(self) -> None:
         def game_bt_func(): self.__current_window = WindowsKeys.SETGAMEMODE # Some "Game" Class function to edit these properties
         def settings_bt_func(): self.__current_window = WindowsKeys.SETTINGS
@@ -90,8 +146,21 @@ class Game:
         
         self._resize_objects((game_title, fps_text, game_start, game_settings, player_background), self.__screen.get_size()) # Maybe try to find a better way later
 
+        def draw_frame(screen: pg.Surface) -> None:
+            screen.fill(COLORS["BLACK"])
+            background.draw(screen)
+            player_background.draw(screen)
+            game_title.draw(screen)
+            game_start.draw(screen)
+            game_settings.draw(screen)
+
+            if self.__show_fps:
+                fps_text.draw(screen)
+
+        self.__renderer.request_full_redraw()
+
         while self.__current_window == WindowsKeys.MAINMENU:
-            for event in pg.event.get():
+            for event in self._get_events():
                 if event.type == pg.QUIT:
                     self.__current_window = WindowsKeys.QUIT
                 
@@ -101,48 +170,45 @@ class Game:
                 
                 if event.type == pg.VIDEORESIZE:
                     self._resize_objects((game_title, fps_text, background), event.size)
+                    self.__renderer.request_full_redraw()
 
                 game_start.update_by_event(event)
                 game_settings.update_by_event(event)
                 player_background.update_by_event(event)
 
             self.__clock.tick(self.__MAX_FPS)
-            self.__screen.fill(COLORS["BLACK"])
 
             dt = self.__delta_time.get_dt()
 
-            background.update(dt)
-            background.draw(self.__screen)
-
+            if self.__animated_backgrounds:
+                background.update(dt)
             player_background.update(dt)
-            player_background.draw(self.__screen)
-
-            game_title.draw(self.__screen)
             game_start.update(dt)
             game_settings.update(dt)
-            game_start.draw(self.__screen)
-            game_settings.draw(self.__screen)
 
             if self.__show_fps:
                 fps_text.set_text(f"FPS: {(dt ** -1):.1f}")
-                fps_text.draw(self.__screen)
+
+            self._render_menu(draw_frame, (player_background, game_title, game_start, game_settings, fps_text))
             
             MouseHandler.update_cursor()
-            play_random_bg_music()
-            
-            pg.display.flip()
 
     def main_game_random(self) -> None:
+        from entities import Gameplay, RandomObstaclesManager, ReplayRecorder, ReplayLibrary
+
         def return_menu_func():
             if pause_button.is_paused:
                 self.__current_window = WindowsKeys.MAINMENU
         player = Player([i // 2 for i in BASE_RESOLUTION], self._rnd_mode_settings[0], 20)
         player.set_circle_colors(self._rnd_mode_settings[1])
-        pause_button = PauseButton((50, 50), (BASE_RESOLUTION[0] - 10, 10), "topright", EventPauser.toggle_timers, (255, 255, 255), 15)
-        return_menu_button = ReturnButton((50, 50), (BASE_RESOLUTION[0] - 70, 10), "topright", return_menu_func, (255, 255, 255))
-        obstacle_manager = RandomObstaclesManager(player.get_center(), player.get_normal_distance(), player.get_angular_speed(), 3, self._rnd_mode_settings[2])
+        seed = randrange(2 ** 31) # Of the obstacles, kept in the replay
+        obstacle_manager = RandomObstaclesManager(player.get_center(), player.get_normal_distance(), player.get_angular_speed(), 3, self._rnd_mode_settings[2], seed)
+        recorder = ReplayRecorder("random", 1, player.get_amount(), seed, GAME_TICK, self.__screen.get_size())
+        tick_time = 0.0
+        restarted = False
+        replay_saved = False
         remaining_lives = 0
-        heart_img = pg.image.load(get_file_path("../images/heart.svg")).convert_alpha() # Improve this later
+        heart_img = AssetManager.get_image("heart.svg")
         lives_count = Organizer([ heart_img for _ in range(obstacle_manager.get_remaining_lives()) ], [ 40 for _ in range(obstacle_manager.get_remaining_lives()) ], OrganizerDirection.HORIZONTAL, OrganizerOrientation.MIDDLE, 10, "topleft", (10, 10))
         score = 0
         score_text = ScoreText(score, (60, 60, 60), (255, 255, 255), self.__FONT, 20, (10, 55), "topleft", 10)
@@ -152,7 +218,6 @@ class Game:
         background = BackgroundGetter.random_background(self.__screen.get_size())
         warn_text = Text("Novos Obstáculos Gerados", self.__FONT, (255, 255, 255), (400, 200), "center", 30)
         show_warn = False
-        player_collided = False
         grad_line = GradientLine(
             [
                 (255, 255, 255, 0), 
@@ -165,269 +230,280 @@ class Game:
             (800, 300),
             300
         )
-        game_ended = False
-        def restart_btn_event():
-            obstacle_manager.reset_manager()
-            CustomEventHandler.post_event(CustomEventList.NEWGENERATIONWARNING)
-            CustomEventHandler.post_event(CustomEventList.RESETGAME)
+        def disable_warning():
+            nonlocal show_warn
+            show_warn = False
+        def save_replay():
+            nonlocal replay_saved
+            if replay_saved or recorder.get_amount_ticks() == 0: return
+            replay_saved = True
+            ReplayLibrary.save(recorder.get_replay(gameplay.get_result()))
+        def end_game():
+            nonlocal show_warn
+            show_warn = False
+            save_replay()
+            best_score = obstacle_manager.get_best_score()
+            collisions = obstacle_manager.get_player_collision_count()
+            best_score_text.set_text(f"Melhor Pontuação: {best_score}")
+            collision_count.set_text(f"Colisões: {collisions}")
+            if best_score >= 100:
+                if len(self._rnd_mode_settings[1]) == 2:
+                    AchievementsHandler.unlock_achievement(3)
+                elif len(self._rnd_mode_settings[1]) == 3:
+                    AchievementsHandler.unlock_achievement(4)
+
+                if best_score >= 1000:
+                    if len(self._rnd_mode_settings[1]) == 2:
+                        AchievementsHandler.unlock_achievement(5)
+                    elif len(self._rnd_mode_settings[1]) == 3:
+                        AchievementsHandler.unlock_achievement(6)
+        def restart_btn_event(): # A new game (with its own seed and replay), the window starts again
+            nonlocal restarted
+            restarted = True
         def return_btn_event():
             self.__current_window = WindowsKeys.MAINMENU
         game_end_restart_btn = TextButton((400, 500), "center", restart_btn_event, "Reiniciar", self.__FONT, (255, 255, 255), (60, 60, 60), pgft.STYLE_STRONG, size_font=30, padding_by_size=(140, 40))
         game_end_return_btn = TextButton((400, 550), "center", return_btn_event, "Retornar", self.__FONT, (255, 255, 255), (60, 60, 60), pgft.STYLE_STRONG, size_font=30, padding_by_size=(140, 40))
 
+        def handle_game_event(event: pg.event.Event): # The HUD's part of the events posted by the gameplay
+            nonlocal show_warn, remaining_lives
+            if event.type in (CustomEventList.NEWGENERATIONWARNING, CustomEventList.CHECKPOINTREACHED):
+                remaining_lives = obstacle_manager.get_remaining_lives()
+                lives_count.change_surfaces([heart_img for _ in range(remaining_lives)], [ 40 for _ in range(remaining_lives) ])
+                warn_text.set_text("Novos Obstáculos Gerados" if event.type == CustomEventList.NEWGENERATIONWARNING else "Ponto de Controle Alcançado")
+                gameplay.get_timers().set_timer(disable_warning, 1)
+                show_warn = True
+
+            if event.type == CustomEventList.PLAYERCOLLISION:
+                if gameplay.check_player_lost():
+                    warn_text.set_text("Você perdeu todas as suas Vidas!")
+                    show_warn = True
+
+                remaining_lives = obstacle_manager.get_remaining_lives()
+                lives_count.change_surfaces([heart_img for _ in range(remaining_lives)], [ 40 for _ in range(remaining_lives) ])
+
+        gameplay = Gameplay(player, obstacle_manager, recorder=recorder, on_event=handle_game_event, on_end=end_game)
+        pause_button = PauseButton((50, 50), (BASE_RESOLUTION[0] - 10, 10), "topright", gameplay.get_timers().toggle_pause, (255, 255, 255), 15) # The timers are in game time, paused with the game
+        return_menu_button = ReturnButton((50, 50), (BASE_RESOLUTION[0] - 70, 10), "topright", return_menu_func, (255, 255, 255))
+
         self._resize_objects( # Maybe add this to a list
-            (pause_button, return_menu_button, score_text, best_score_text, collision_count, fps_text, player, warn_text, lives_count, grad_line, game_end_restart_btn, game_end_return_btn, self.__achievements_drawer), 
+            (pause_button, return_menu_button, score_text, best_score_text, collision_count, fps_text, player, warn_text, lives_count, grad_line, game_end_restart_btn, game_end_return_btn, self.__achievements_drawer, self.__profiler_overlay), 
             self.__screen.get_size()
         )
         obstacle_manager.resize(self.__screen.get_size(), player.get_center(), player.get_normal_distance())
 
-        while self.__current_window == WindowsKeys.MAINGAMERANDOM:
-            for event in pg.event.get():
-                if event.type == pg.QUIT:
-                    self.__current_window = WindowsKeys.QUIT
-                
-                pause_button.update_by_event(event)
-                return_menu_button.update_by_event(event)
-                player.update_by_event(event)
-                self.__achievements_drawer.update_by_event(event)
+        while self.__current_window == WindowsKeys.MAINGAMERANDOM and not restarted:
+            FrameProfiler.start_frame()
 
-                if event.type == pg.VIDEORESIZE:
-                    obstacle_manager.resize(event.size, player.get_center(), player.get_normal_distance())
-                    self._resize_objects((score_text, best_score_text, collision_count, fps_text, background, warn_text, lives_count, grad_line, game_end_restart_btn, game_end_return_btn), event.size)
-                
-                if event.type == CustomEventList.NEWGENERATIONWARNING:
-                    remaining_lives = obstacle_manager.get_remaining_lives()
-                    lives_count.change_surfaces([heart_img for _ in range(remaining_lives)], [ 40 for _ in range(remaining_lives) ])
-                    warn_text.set_text("Novos Obstáculos Gerados")
-                    pg.time.set_timer(CustomEventList.DISABLEWARNING, 1000, 1)
-                    EventPauser.add_event(CustomEventList.DISABLEWARNING, 1000, 1)
-                    show_warn = True
+            with FrameProfiler.phase("events"):
+                for event in self._get_events(Gameplay.GAME_EVENTS):
+                    if event.type == pg.QUIT:
+                        self.__current_window = WindowsKeys.QUIT
                 
-                if event.type == CustomEventList.DISABLEWARNING:
-                    show_warn = False
+                    pause_button.update_by_event(event)
+                    return_menu_button.update_by_event(event)
+                    self.__achievements_drawer.update_by_event(event)
+                    self.__profiler_overlay.update_by_event(event)
+
+                    if event.type == pg.VIDEORESIZE:
+                        with self.__resize_scheduler.measure(type(obstacle_manager).__name__):
+                            gameplay.resize(event.size)
+                        self._resize_objects((score_text, best_score_text, collision_count, fps_text, background, warn_text, lives_count, grad_line, game_end_restart_btn, game_end_return_btn, self.__profiler_overlay), event.size)
+                    elif not pause_button.is_paused:
+                        gameplay.update_by_event(event)
                 
-                if event.type == CustomEventList.PLAYERCOLLISION: # Maybe handle this on the player's class:
-                    if obstacle_manager.check_player_lost():
-                        pg.time.set_timer(CustomEventList.RANDOMGAMEEND, 500, 1)
-                        EventPauser.add_event(CustomEventList.RANDOMGAMEEND, 500, 1)
-                        warn_text.set_text("Você perdeu todas as suas Vidas!")
-                        show_warn = True
-                    else: # THIS REALLY NEED TO BE BETTER
-                        pg.time.set_timer(CustomEventList.RESETGAME, 500, 1)
-                        EventPauser.add_event(CustomEventList.RESETGAME, 500, 1)
-
-                    player_collided = True
-                    player.add_lost_particles(event.indexes)
-                    remaining_lives = obstacle_manager.get_remaining_lives()
-                    lives_count.change_surfaces([heart_img for _ in range(remaining_lives)], [ 40 for _ in range(remaining_lives) ])
-                
-                if event.type == CustomEventList.RESETGAME:
-                    game_ended = False
-                    player_collided = False
-                    player.reset_movements()
-                    obstacle_manager.reset()
-                
-                if event.type == CustomEventList.RANDOMGAMEEND:
-                    show_warn = False
-                    game_ended = True
-                    best_score = obstacle_manager.get_best_score()
-                    collisions = obstacle_manager.get_player_collision_count()
-                    best_score_text.set_text(f"Melhor Pontuação: {best_score}")
-                    collision_count.set_text(f"Colisões: {collisions}")
-                    if best_score >= 100:
-                        if len(self._rnd_mode_settings[1]) == 2:
-                            AchievementsHandler.unlock_achievement(3)
-                        elif len(self._rnd_mode_settings[1]) == 3:
-                            AchievementsHandler.unlock_achievement(4)
-
-                        if best_score >= 1000:
-                            if len(self._rnd_mode_settings[1]) == 2:
-                                AchievementsHandler.unlock_achievement(5)
-                            elif len(self._rnd_mode_settings[1]) == 3:
-                                AchievementsHandler.unlock_achievement(6)
-                
-                if game_ended:
-                    game_end_restart_btn.update_by_event(event)
-                    game_end_return_btn.update_by_event(event)
+                    if gameplay.is_game_ended():
+                        game_end_restart_btn.update_by_event(event)
+                        game_end_return_btn.update_by_event(event)
 
-            keys = pg.key.get_pressed()
+                keys = pg.key.get_pressed()
 
-            if keys[pg.K_LSHIFT] and keys[pg.K_ESCAPE]:
-                self.__current_window = WindowsKeys.MAINMENU
+                if keys[pg.K_LSHIFT] and keys[pg.K_ESCAPE]:
+                    self.__current_window = WindowsKeys.MAINMENU
 
-            self.__clock.tick(self.__MAX_FPS)
-            self.__screen.fill(COLORS["BLACK"])
+            with FrameProfiler.phase("tick"):
+                self.__clock.tick(self.__MAX_FPS)
 
             dt = self.__delta_time.get_dt()
 
-            EventPauser.update(dt)
+            if not pause_button.is_paused:
+                tick_time = self._run_game_ticks(tick_time, dt, lambda: gameplay.tick(GAME_TICK))
 
-            background.update(dt)
-            background.draw(self.__screen)
+            with FrameProfiler.phase("background"):
+                self.__screen.fill(COLORS["BLACK"])
+                background.update(dt)
+                background.draw(self.__screen)
 
-            pause_button.draw(self.__screen)
+            with FrameProfiler.phase("HUD"):
+                pause_button.draw(self.__screen)
 
             if pause_button.is_paused:
-                return_menu_button.draw(self.__screen)
-            elif not game_ended: # Improve this later
-                if not player_collided:
-                    player.update(dt)
-                    obstacle_manager.update(dt)
-                    obstacle_manager.check_collision(player)
-                else:
-                    player.update_lost_particles(dt)
-
-                score = obstacle_manager.get_score()
-                
-                score_text.set_score(score)
-
-            player.draw(self.__screen) # Improve this draws later
-            obstacle_manager.draw(self.__screen)
-            lives_count.draw(self.__screen)
-            score_text.draw(self.__screen)
-            if game_ended: # Improve this later
-                grad_line.draw(self.__screen)
-                best_score_text.draw(self.__screen)
-                collision_count.draw(self.__screen)
-                game_end_restart_btn.draw(self.__screen)
-                game_end_return_btn.draw(self.__screen)
+                with FrameProfiler.phase("HUD"):
+                    return_menu_button.draw(self.__screen)
+            elif not gameplay.is_game_ended(): # Improve this later
+                with FrameProfiler.phase("HUD"):
+                    score = obstacle_manager.get_score()
+                    
+                    score_text.set_score(score)
 
-            if show_warn:
-                warn_text.draw(self.__screen)
+            with FrameProfiler.phase("player"):
+                player.draw(self.__screen) # Improve this draws later
+            with FrameProfiler.phase("obstacles"):
+                obstacle_manager.draw(self.__screen)
 
-            if self.__show_fps:
-                fps_text.set_text(f"FPS: {(dt ** -1):.1f}")
-                fps_text.draw(self.__screen)
+            with FrameProfiler.phase("HUD"):
+                lives_count.draw(self.__screen)
+                score_text.draw(self.__screen)
+                if gameplay.is_game_ended(): # Improve this later
+                    grad_line.draw(self.__screen)
+                    best_score_text.draw(self.__screen)
+                    collision_count.draw(self.__screen)
+                    game_end_restart_btn.draw(self.__screen)
+                    game_end_return_btn.draw(self.__screen)
+
+                if show_warn:
+                    warn_text.draw(self.__screen)
+
+                if self.__show_fps:
+                    fps_text.set_text(f"FPS: {(dt ** -1):.1f}")
+                    fps_text.draw(self.__screen)
 
-            self.__achievements_drawer.update(dt)
-            self.__achievements_drawer.draw(self.__screen)
+            with FrameProfiler.phase("achievements"):
+                self.__achievements_drawer.update(dt)
+                self.__achievements_drawer.draw(self.__screen)
+
+            self._draw_profiler_overlay(dt)
             
             MouseHandler.update_cursor()
-            play_random_bg_music()
             
-            pg.display.flip()
+            with FrameProfiler.phase("flip"):
+                self._flip()
+
+            FrameProfiler.end_frame()
+
+        save_replay()
 
     def main_game_level(self) -> None:
+        from entities import Gameplay, LevelObstaclesManager, ReplayRecorder, ReplayLibrary
+
         def return_menu_func():
             if pause_button.is_paused:
                 self.__current_window = WindowsKeys.MAINMENU
         player = Player([i // 2 for i in BASE_RESOLUTION], 2, 20)
         player.set_circle_colors([COLORS["RED"], COLORS["BLUE"]])
-        pause_button = PauseButton((50, 50), (BASE_RESOLUTION[0] - 10, 10), "topright", EventPauser.toggle_timers, (255, 255, 255), 15)
-        return_menu_button = ReturnButton((50, 50), (BASE_RESOLUTION[0] - 70, 10), "topright", return_menu_func, (255, 255, 255))
         perfection_drawer = PerfectionDrawer((50, 50), 30, COLORS["GREEN"], COLORS["RED"], COLORS["WHITE"], self.__start_level, difference_expansion=5, repetition_time=1)
         obstacle_manager = LevelObstaclesManager(player.get_center(), player.get_normal_distance(), player.get_angular_speed(), self.__start_level, perfection_drawer)
+        recorder = ReplayRecorder("level", self.__start_level, player.get_amount(), 0, GAME_TICK, self.__screen.get_size())
+        tick_time = 0.0
         collision_count = Text("Colisões: 0", self.__FONT, (255, 255, 255), (10, 90), size=20)
         fps_text = Text("FPS: ", self.__FONT, (100, 100, 100), (10, 115), size=15)
         background = BackgroundGetter.random_background(self.__screen.get_size())
         warn_text = Text("Nível: 0", self.__FONT, (255, 255, 255), (400, 200), "center", 30)
         show_warn = False
-        player_collided = False
+        def disable_warning():
+            nonlocal show_warn
+            show_warn = False
+        def handle_game_event(event: pg.event.Event): # The HUD's part of the events posted by the gameplay
+            nonlocal show_warn
+            if event.type == CustomEventList.NEWLEVELWARNING:
+                warn_text.set_text(f"Nível: {event.level}")
+                gameplay.get_timers().set_timer(disable_warning, 1)
+                show_warn = True
+
+        gameplay = Gameplay(player, obstacle_manager, perfection_drawer, recorder, on_event=handle_game_event)
+        pause_button = PauseButton((50, 50), (BASE_RESOLUTION[0] - 10, 10), "topright", gameplay.get_timers().toggle_pause, (255, 255, 255), 15) # The timers are in game time, paused with the game
+        return_menu_button = ReturnButton((50, 50), (BASE_RESOLUTION[0] - 70, 10), "topright", return_menu_func, (255, 255, 255))
 
-        self._resize_objects((pause_button, return_menu_button, collision_count, fps_text, player, warn_text, perfection_drawer, self.__achievements_drawer), self.__screen.get_size())
+        self._resize_objects((pause_button, return_menu_button, collision_count, fps_text, player, warn_text, perfection_drawer, self.__achievements_drawer, self.__profiler_overlay), self.__screen.get_size())
         obstacle_manager.resize(self.__screen.get_size(), player.get_center(), player.get_normal_distance())
 
         while self.__current_window == WindowsKeys.MAINGAMELEVEL:
-            for event in pg.event.get():
-                if event.type == pg.QUIT:
-                    self.__current_window = WindowsKeys.QUIT
-                
-                pause_button.update_by_event(event)
-                return_menu_button.update_by_event(event)
-                player.update_by_event(event)
-                self.__achievements_drawer.update_by_event(event)
+            FrameProfiler.start_frame()
 
-                if event.type == pg.VIDEORESIZE:
-                    obstacle_manager.resize(event.size, player.get_center(), player.get_normal_distance())
-                    self._resize_objects((collision_count, fps_text, background, warn_text, perfection_drawer), event.size)
-                
-                if event.type == CustomEventList.NEWLEVELWARNING:
-                    warn_text.set_text(f"Nível: {event.level}")
-                    pg.time.set_timer(CustomEventList.DISABLEWARNING, 1000, 1)
-                    EventPauser.add_event(CustomEventList.DISABLEWARNING, 1000, 1) # Maybe we can get this better with the "EventHandler"
-                    show_warn = True
-                    perfection_drawer.reset(obstacle_manager.get_actual_level())
-                
-                if event.type == CustomEventList.DISABLEWARNING:
-                    show_warn = False
+            with FrameProfiler.phase("events"):
+                for event in self._get_events(Gameplay.GAME_EVENTS):
+                    if event.type == pg.QUIT:
+                        self.__current_window = WindowsKeys.QUIT
                 
-                if event.type == CustomEventList.PLAYERCOLLISION: # Maybe handle this on the player's class
-                    pg.time.set_timer(CustomEventList.RESETGAME, 500, 1)
-                    EventPauser.add_event(CustomEventList.RESETGAME, 500, 1)
-                    player_collided = True
-                    player.add_lost_particles(event.indexes)
-                
-                if event.type == CustomEventList.RESETGAME:
-                    player_collided = False
-                    player.reset_movements()
-                    obstacle_manager.reset()
-                    perfection_drawer.reset(obstacle_manager.get_actual_level())
-                    perfection_drawer.check_movements()
-                
-                if event.type == CustomEventList.RANDOMGAMEEND:
-                    self.__current_window = WindowsKeys.MAINMENU
+                    pause_button.update_by_event(event)
+                    return_menu_button.update_by_event(event)
+                    self.__achievements_drawer.update_by_event(event)
+                    self.__profiler_overlay.update_by_event(event)
 
-                if event.type == pg.KEYDOWN:
-                    if event.key in [pg.K_a, pg.K_d, pg.K_SPACE, pg.K_LSHIFT] and not pause_button.is_paused:
-                        perfection_drawer.update_movements()
-                
-                if event.type == pg.MOUSEBUTTONDOWN:
-                    if event.button == 1 and not pause_button.is_paused:
-                        perfection_drawer.update_movements()
+                    if event.type == pg.VIDEORESIZE:
+                        with self.__resize_scheduler.measure(type(obstacle_manager).__name__):
+                            gameplay.resize(event.size)
+                        self._resize_objects((collision_count, fps_text, background, warn_text, perfection_drawer, self.__profiler_overlay), event.size)
+                    elif not pause_button.is_paused:
+                        gameplay.update_by_event(event)
 
-            keys = pg.key.get_pressed()
+                keys = pg.key.get_pressed()
 
-            if keys[pg.K_LSHIFT] and keys[pg.K_ESCAPE]:
-                self.__current_window = WindowsKeys.MAINMENU
+                if keys[pg.K_LSHIFT] and keys[pg.K_ESCAPE]:
+                    self.__current_window = WindowsKeys.MAINMENU
 
-            self.__clock.tick(self.__MAX_FPS)
-            self.__screen.fill(COLORS["BLACK"])
+            with FrameProfiler.phase("tick"):
+                self.__clock.tick(self.__MAX_FPS)
 
             dt = self.__delta_time.get_dt()
 
-            EventPauser.update(dt)
+            if not pause_button.is_paused:
+                tick_time = self._run_game_ticks(tick_time, dt, lambda: gameplay.tick(GAME_TICK))
+
+            with FrameProfiler.phase("background"):
+                self.__screen.fill(COLORS["BLACK"])
+                background.update(dt)
+                background.draw(self.__screen)
 
-            background.update(dt)
-            background.draw(self.__screen)
+            with FrameProfiler.phase("HUD"):
+                pause_button.draw(self.__screen)
 
-            pause_button.draw(self.__screen)
+            with FrameProfiler.phase("achievements"):
+                self.__achievements_drawer.update(dt)
+                self.__achievements_drawer.draw(self.__screen)
 
-            self.__achievements_drawer.update(dt)
-            self.__achievements_drawer.draw(self.__screen)
-            perfection_drawer.update(dt)
-            perfection_drawer.draw(self.__screen)
+            with FrameProfiler.phase("HUD"):
+                perfection_drawer.update(dt)
+                perfection_drawer.draw(self.__screen)
 
             if pause_button.is_paused:
-                player.draw(self.__screen)
-                obstacle_manager.draw(self.__screen)
-                return_menu_button.draw(self.__screen)
+                with FrameProfiler.phase("player"):
+                    player.draw(self.__screen)
+                with FrameProfiler.phase("obstacles"):
+                    obstacle_manager.draw(self.__screen)
+                with FrameProfiler.phase("HUD"):
+                    return_menu_button.draw(self.__screen)
             else:
-                if not player_collided:
-                    player.update(dt)
-                    obstacle_manager.update(dt)
-                    obstacle_manager.check_collision(player)
-                else:
-                    player.update_lost_particles(dt)
-
-                player.draw(self.__screen)
-                obstacle_manager.draw(self.__screen)
+                with FrameProfiler.phase("player"):
+                    player.draw(self.__screen)
+                with FrameProfiler.phase("obstacles"):
+                    obstacle_manager.draw(self.__screen)
+
+                with FrameProfiler.phase("HUD"):
+                    collisions = obstacle_manager.get_player_collision_count()
+                    collision_count.set_text(f"Colisões: {collisions}")
 
-                collisions = obstacle_manager.get_player_collision_count()
-                collision_count.set_text(f"Colisões: {collisions}")
+            with FrameProfiler.phase("HUD"):
+                collision_count.draw(self.__screen)
 
-            collision_count.draw(self.__screen)
+                if show_warn:
+                    warn_text.draw(self.__screen)
 
-            if show_warn:
-                warn_text.draw(self.__screen)
+                if self.__show_fps:
+                    fps_text.set_text(f"FPS: {(dt ** -1):.1f}")
+                    fps_text.draw(self.__screen)
 
-            if self.__show_fps:
-                fps_text.set_text(f"FPS: {(dt ** -1):.1f}")
-                fps_text.draw(self.__screen)
+            self._draw_profiler_overlay(dt)
             
             MouseHandler.update_cursor()
-            play_random_bg_music()
             
-            pg.display.flip()
+            with FrameProfiler.phase("flip"):
+                self._flip()
+
+            FrameProfiler.end_frame()
+
+        if recorder.get_amount_ticks() > 0:
+            ReplayLibrary.save(recorder.get_replay(gameplay.get_result()))
 
     def set_gamemode(self) -> None:
         def return_menu_func():
@@ -463,8 +539,20 @@ class Game:
 
         self._resize_objects((player_background, fps_text, buttongroup, return_menu_button), self.__screen.get_size())
 
+        def draw_frame(screen: pg.Surface) -> None:
+            screen.fill(COLORS["BLACK"])
+            background.draw(screen)
+            player_background.draw(screen)
+            buttongroup.draw(screen)
+            return_menu_button.draw(screen)
+
+            if self.__show_fps:
+                fps_text.draw(screen)
+
+        self.__renderer.request_full_redraw()
+
         while self.__current_window == WindowsKeys.SETGAMEMODE:
-            for event in pg.event.get():
+            for event in self._get_events():
                 if event.type == pg.QUIT:
                     self.__current_window = WindowsKeys.QUIT
                 
@@ -477,35 +565,30 @@ class Game:
                 
                 if event.type == pg.VIDEORESIZE:
                     self._resize_objects((fps_text, background, return_menu_button), event.size)
+                    self.__renderer.request_full_redraw()
 
                 player_background.update_by_event(event)
                 buttongroup.update_by_event(event)
                 return_menu_button.update_by_event(event)
 
             self.__clock.tick(self.__MAX_FPS)
-            self.__screen.fill(COLORS["BLACK"])
 
             dt = self.__delta_time.get_dt()
 
-            background.update(dt)
-            background.draw(self.__screen)
-
+            if self.__animated_backgrounds:
+                background.update(dt)
             player_background.update(dt)
-            player_background.draw(self.__screen)
-
-            buttongroup.draw(self.__screen)
-            return_menu_button.draw(self.__screen)
 
             if self.__show_fps:
                 fps_text.set_text(f"FPS: {(dt ** -1):.1f}")
-                fps_text.draw(self.__screen)
+
+            self._render_menu(draw_frame, (player_background, buttongroup, return_menu_button, fps_text))
             
             MouseHandler.update_cursor()
-            play_random_bg_music()
-            
-            pg.display.flip()
 
     def set_level(self) -> None:
+        from entities import LevelsOrganizer
+
         def return_menu_func():
             self.__current_window = WindowsKeys.SETGAMEMODE
         def set_level(n: int): 
@@ -526,8 +609,22 @@ class Game:
 
         self._resize_objects((player_background, fps_text, levels_organizer, division_line, level_text, return_menu_button), self.__screen.get_size())
 
+        def draw_frame(screen: pg.Surface) -> None:
+            screen.fill(COLORS["BLACK"])
+            background.draw(screen)
+            player_background.draw(screen)
+            levels_organizer.draw(screen)
+            level_text.draw(screen)
+            division_line.draw(screen)
+            return_menu_button.draw(screen)
+
+            if self.__show_fps:
+                fps_text.draw(screen)
+
+        self.__renderer.request_full_redraw()
+
         while self.__current_window == WindowsKeys.SETLEVEL:
-            for event in pg.event.get():
+            for event in self._get_events():
                 if event.type == pg.QUIT:
                     self.__current_window = WindowsKeys.QUIT
                 
@@ -540,37 +637,30 @@ class Game:
                 
                 if event.type == pg.VIDEORESIZE:
                     self._resize_objects((fps_text, background, division_line, level_text, return_menu_button), event.size)
+                    self.__renderer.request_full_redraw()
 
                 player_background.update_by_event(event)
                 levels_organizer.update_by_event(event)
                 return_menu_button.update_by_event(event)
 
             self.__clock.tick(self.__MAX_FPS)
-            self.__screen.fill(COLORS["BLACK"])
 
             dt = self.__delta_time.get_dt()
 
-            background.update(dt)
-            background.draw(self.__screen)
-
+            if self.__animated_backgrounds:
+                background.update(dt)
             player_background.update(dt)
-            player_background.draw(self.__screen)
-
-            levels_organizer.draw(self.__screen)
-            level_text.draw(self.__screen)
-            division_line.draw(self.__screen)
-            return_menu_button.draw(self.__screen)
 
             if self.__show_fps:
                 fps_text.set_text(f"FPS: {(dt ** -1):.1f}")
-                fps_text.draw(self.__screen)
+
+            self._render_menu(draw_frame, (player_background, levels_organizer, level_text, division_line, return_menu_button, fps_text))
             
             MouseHandler.update_cursor()
-            play_random_bg_music()
-
-            pg.display.flip()
 
     def show_achievements(self) -> None:
+        from entities import AchievementsGrid
+
         def return_menu_func():
             self.__current_window = WindowsKeys.SETGAMEMODE
         fps_text = Text("FPS: ", self.__FONT, (100, 100, 100), (10, 10), size=15)
@@ -580,8 +670,19 @@ class Game:
         
         self._resize_objects((fps_text, achievement_grid, return_menu_button), self.__screen.get_size()) # Maybe try to find a better way later
 
+        def draw_frame(screen: pg.Surface) -> None:
+            screen.fill(COLORS["BLACK"])
+            background.draw(screen)
+            achievement_grid.draw(screen)
+            return_menu_button.draw(screen)
+
+            if self.__show_fps:
+                fps_text.draw(screen)
+
+        self.__renderer.request_full_redraw()
+
         while self.__current_window == WindowsKeys.SHOWACHIEVEMENTS:
-            for event in pg.event.get():
+            for event in self._get_events():
                 if event.type == pg.QUIT:
                     self.__current_window = WindowsKeys.QUIT
                 
@@ -591,6 +692,7 @@ class Game:
                 
                 if event.type == pg.VIDEORESIZE:
                     self._resize_objects((fps_text, background, achievement_grid, return_menu_button), event.size)
+                    self.__renderer.request_full_redraw()
                 
                 achievement_grid.update_by_event(event)
                 return_menu_button.update_by_event(event)
@@ -601,30 +703,30 @@ class Game:
                 self.__current_window = WindowsKeys.SETGAMEMODE
 
             self.__clock.tick(self.__MAX_FPS)
-            self.__screen.fill(COLORS["BLACK"])
 
             dt = self.__delta_time.get_dt()
 
-            background.update(dt)
-            background.draw(self.__screen)
-
-            achievement_grid.draw(self.__screen)
-            return_menu_button.draw(self.__screen)
+            if self.__animated_backgrounds:
+                background.update(dt)
 
             if self.__show_fps:
                 fps_text.set_text(f"FPS: {(dt ** -1):.1f}")
-                fps_text.draw(self.__screen)
+
+            self._render_menu(draw_frame, (achievement_grid, return_menu_button, fps_text))
             
             MouseHandler.update_cursor()
-            play_random_bg_music()
-            
-            pg.display.flip()
 
     def settings(self) -> None:
         def return_menu_func():
             self.__current_window = WindowsKeys.MAINMENU
         def toggle_fps_visibility():
             self.__show_fps = not self.__show_fps
+            self.__renderer.request_full_redraw()
+        def toggle_animated_backgrounds():
+            self.__animated_backgrounds = not self.__animated_backgrounds
+        def toggle_dirty_rendering():
+            self.__dirty_rendering = not self.__dirty_rendering
+            self.__renderer.request_full_redraw()
         def set_max_fps(amount: float):
             if amount == 300:
                 self.__MAX_FPS = 0
@@ -633,23 +735,42 @@ class Game:
                 self.__MAX_FPS = amount
                 limiter_fps_text.set_text(f"Máx. FPS: {self.__MAX_FPS:.1f}")
         def set_volume_all(volume: float):
-            set_music_volume(volume)
+            MusicScheduler.set_volume(volume)
             volume_text.set_text(f"Volume: {round(volume * 100)}%")
         fps_text = Text("FPS: ", self.__FONT, (100, 100, 100), (10, 10), size=15)
         background = BackgroundGetter.random_background(self.__screen.get_size())
         toggle_fps_vsblt_btn = TextButton((200, 200), "topleft", toggle_fps_visibility, "Mostrar FPS", self.__FONT, COLORS["WHITE"], (80, 80, 80), size_font=20, padding=(15, 15))
+        toggle_animated_bg_btn = TextButton((200, 480), "topleft", toggle_animated_backgrounds, "Fundo Animado", self.__FONT, COLORS["WHITE"], (80, 80, 80), size_font=20, padding=(15, 15))
+        toggle_dirty_rendering_btn = TextButton((380, 480), "topleft", toggle_dirty_rendering, "Renderização Otimizada", self.__FONT, COLORS["WHITE"], (80, 80, 80), size_font=20, padding=(15, 15))
         limiter_fps = Limiter((165, 50), (225, 300), "topleft", (50, 50, 50), COLORS["WHITE"], 1, 300, 300 if self.__MAX_FPS == 0 else self.__MAX_FPS, set_max_fps)
         limiter_fps_text = Text("Máx. FPS: ", self.__FONT, COLORS["WHITE"], (425, 325), "midleft", 30)
-        volume_limiter = Limiter((165, 50), (225, 400), "topleft", (50, 50, 50), COLORS["WHITE"], 0.0, 1.0, get_music_volume(), set_volume_all)
+        volume_limiter = Limiter((165, 50), (225, 400), "topleft", (50, 50, 50), COLORS["WHITE"], 0.0, 1.0, MusicScheduler.get_volume(), set_volume_all)
         volume_text = Text("", self.__FONT, COLORS["WHITE"], (425, 425), "midleft", 30)
         return_menu_button = ReturnButton((50, 50), (BASE_RESOLUTION[0] - 20, 20), "topright", return_menu_func, (255, 255, 255))
         set_max_fps(limiter_fps.get_actual_value())
         set_volume_all(volume_limiter.get_actual_value())
         
-        self._resize_objects((fps_text, toggle_fps_vsblt_btn, limiter_fps, limiter_fps_text, volume_limiter, volume_text, return_menu_button), self.__screen.get_size())
+        self._resize_objects((fps_text, toggle_fps_vsblt_btn, toggle_animated_bg_btn, toggle_dirty_rendering_btn, limiter_fps, limiter_fps_text, volume_limiter, volume_text, return_menu_button), self.__screen.get_size())
+
+        def draw_frame(screen: pg.Surface) -> None:
+            screen.fill(COLORS["BLACK"])
+            background.draw(screen)
+            toggle_fps_vsblt_btn.draw(screen)
+            toggle_animated_bg_btn.draw(screen)
+            toggle_dirty_rendering_btn.draw(screen)
+            limiter_fps_text.draw(screen)
+            volume_text.draw(screen)
+            limiter_fps.draw(screen)
+            volume_limiter.draw(screen)
+            return_menu_button.draw(screen)
+
+            if self.__show_fps:
+                fps_text.draw(screen)
+
+        self.__renderer.request_full_redraw()
 
         while self.__current_window == WindowsKeys.SETTINGS:
-            for event in pg.event.get():
+            for event in self._get_events():
                 if event.type == pg.QUIT:
                     self.__current_window = WindowsKeys.QUIT
                 
@@ -659,44 +780,167 @@ class Game:
                 
                 if event.type == pg.VIDEORESIZE:
                     self._resize_objects((fps_text, background, limiter_fps, limiter_fps_text, volume_limiter, volume_text, return_menu_button), event.size)
+                    self.__renderer.request_full_redraw()
                     
                 toggle_fps_vsblt_btn.update_by_event(event)
+                toggle_animated_bg_btn.update_by_event(event)
+                toggle_dirty_rendering_btn.update_by_event(event)
                 limiter_fps.update_by_event(event)
                 volume_limiter.update_by_event(event)
                 return_menu_button.update_by_event(event)
 
             self.__clock.tick(self.__MAX_FPS)
-            self.__screen.fill(COLORS["BLACK"])
 
             dt = self.__delta_time.get_dt()
 
-            background.update(dt)
-            background.draw(self.__screen)
-
-            toggle_fps_vsblt_btn.draw(self.__screen)
-
-            limiter_fps_text.draw(self.__screen)
-            volume_text.draw(self.__screen)
-
+            if self.__animated_backgrounds:
+                background.update(dt)
             limiter_fps.update(dt)
-            limiter_fps.draw(self.__screen)
             volume_limiter.update(dt)
-            volume_limiter.draw(self.__screen)
-            return_menu_button.draw(self.__screen)
 
             if self.__show_fps:
                 fps_text.set_text(f"FPS: {(dt ** -1):.1f}")
-                fps_text.draw(self.__screen)
+
+            self._render_menu(draw_frame, (toggle_fps_vsblt_btn, toggle_animated_bg_btn, toggle_dirty_rendering_btn, limiter_fps_text, volume_text, limiter_fps, volume_limiter, return_menu_button, fps_text))
             
             MouseHandler.update_cursor()
-            play_random_bg_music()
-            
-            pg.display.flip()
 
-    @staticmethod
-    def _resize_objects(objects: list[Any], resolution: tuple[int, int]) -> None:
-        for obj in objects:
-            obj.resize(resolution)
+    def _draw_profiler_overlay(self, dt: float) -> None:
+        """Updates and draws the profiler's overlay (F3), its own cost is the "profiler" phase."""
+        with FrameProfiler.phase("profiler"):
+            self.__profiler_overlay.set_frame_budget(self.__MAX_FPS)
+            self.__profiler_overlay.set_rebuild_costs(self.__resize_scheduler.get_rebuild_costs())
+            self.__profiler_overlay.update(dt)
+            self.__profiler_overlay.draw(self.__screen)
+
+    def _render_menu(self, draw_frame: Callable[[pg.Surface], None], widgets: tuple[Any, ...]) -> None:
+        """Draws a menu's frame: fully and flipping the display, or with the 'DirtyRectRenderer' if the optimized rendering is enabled.
+
+            An animated background changes the whole screen, so with it the renderer always redraws the full frame.
+        """
+        if self.__dirty_rendering and not self.__resize_scheduler.is_settling():
+            self.__renderer.render(self.__screen, draw_frame, widgets, self.__animated_backgrounds)
+            self._on_frame_presented()
+        else:
+            draw_frame(self.__screen)
+            self._flip()
+
+    def _get_events(self, exclude: tuple[int, ...] = ()) -> list[pg.event.Event]:
+        """Returns the window's events with the resizes coalesced by the 'ResizeScheduler' (just one 'pg.VIDEORESIZE' when the size settles).
+
+            While a resize is settling the windows draw on the scheduler's canvas (with the last good size) instead of the display.
+            The events of the types in 'exclude' stay in the queue (the game modes' ticks get them).
+        """
+        events = self.__resize_scheduler.filter_events(pg.event.get(exclude=exclude))
+        self.__screen = self.__resize_scheduler.get_target()
+
+        if self.__scripted_input != None:
+            now = perf_counter()
+            for key in self.__scripted_input.advance(now - self.__scripted_input_time):
+                events.append(pg.event.Event(pg.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+            self.__scripted_input_time = now
+
+        for event in events:
+            MusicScheduler.update_by_event(event)
+
+        return events
+
+    def _run_game_ticks(self, tick_time: float, dt: float, game_tick: Callable[[], None]) -> float:
+        """Runs a 'game_tick' for each 'GAME_TICK' seconds of the frame's 'dt' and returns the time left for the next frame ('tick_time' is the last one's).
+
+            The gameplay always advances in the same fixed steps, whatever the framerate, so a run is played again exactly from its
+            input (see 'ReplayRecorder').
+        """
+        tick_time = min(tick_time + dt, self.__MAX_TICKS_TIME)
+        while tick_time >= GAME_TICK:
+            game_tick()
+            tick_time -= GAME_TICK
+
+        return tick_time
+
+    def _flip(self) -> None:
+        self.__resize_scheduler.present()
+        pg.display.flip()
+        self._on_frame_presented()
+
+    def _resize_objects(self, objects: list[Any], resolution: tuple[int, int]) -> None:
+        self.__resize_scheduler.resize_objects(objects, resolution)
+
+    def _on_frame_presented(self) -> None:
+        """Once the first frame is on the screen, prints the startup report ('--startup-profile') and starts the musics."""
+        if not self.__first_frame: return
+        self.__first_frame = False
+
+        if self.__startup_profiler != None:
+            self.__startup_profiler.finish("primeiro frame")
+            print(self.__startup_profiler.report())
+            self.__startup_profiler = None
+
+        MusicScheduler.start()
+
+def run_headless(args: Namespace) -> int:
+    """Runs a 'Simulation' (or validates the levels) without a window and prints the results as JSON, returning the exit code."""
+    from entities import Simulation, Replay, ReplayRecorder, ReplayPlayer, validate_levels
+
+    pg.init()
+    pg.display.set_mode(BASE_RESOLUTION)
+
+    if args.validate_levels != None:
+        reports = validate_levels(args.validate_levels or None, args.dt)
+        print(json_dumps(reports, indent=4, ensure_ascii=False))
+        pg.quit()
+        return 0 if all(report["valid"] for report in reports) else 1
+
+    if args.replay != None:
+        replay = Replay.load(args.replay)
+        replay_player = ReplayPlayer(replay, args.render)
+        if args.seek != None:
+            replay_player.seek(args.seek)
+        else:
+            replay_player.run()
+
+        summary = replay_player.get_simulation().get_summary()
+        if replay.get_result() != None and args.seek == None:
+            summary["same_as_recorded"] = replay_player.get_simulation().get_result() == replay.get_result() # The playback got the recorded run's result
+        print(json_dumps(summary, indent=4, ensure_ascii=False))
+        replay_player.close()
+        pg.quit()
+        return 0 if summary.get("same_as_recorded", True) else 1
+
+    timeline = []
+    if args.random_input:
+        timeline = ScriptedInput.random_timeline(args.seed, args.frames * args.dt, (pg.K_a, pg.K_d, pg.K_SPACE, pg.K_LSHIFT))
+
+    recorder = ReplayRecorder(args.mode, args.level, args.players, args.seed, args.dt) if args.record != None else None
+    simulation = Simulation(args.mode, args.level, args.players, args.seed, args.dt, timeline, render=args.render, recorder=recorder)
+    print(json_dumps(simulation.run(args.frames), indent=4, ensure_ascii=False))
+    simulation.close()
+
+    if recorder != None:
+        recorder.get_replay(simulation.get_result()).save(args.record)
+
+    pg.quit()
+    return 0
 
 if __name__ == '__main__':
-    Game().run()
+    parser = ArgumentParser(description="Duet")
+    parser.add_argument("--headless", action="store_true", help="simula o jogo sem janela, com um passo de tempo fixo")
+    parser.add_argument("--mode", choices=("random", "level"), default="random", help="modo simulado (padrão: random)")
+    parser.add_argument("--level", type=int, default=1, help="nível inicial do modo level")
+    parser.add_argument("--players", type=int, choices=(2, 3), default=2, help="círculos do modo random")
+    parser.add_argument("--frames", type=int, default=36000, help="máximo de frames simulados")
+    parser.add_argument("--dt", type=float, default=1 / 60, help="passo de tempo fixo, em segundos")
+    parser.add_argument("--seed", type=int, default=0, help="semente dos obstáculos e da entrada aleatória")
+    parser.add_argument("--random-input", action="store_true", help="pressiona teclas aleatórias (reproduzíveis pela semente)")
+    parser.add_argument("--render", action="store_true", help="também desenha os frames (numa superfície fora da tela)")
+    parser.add_argument("--startup-profile", action="store_true", help="mostra o tempo até o primeiro frame, por fase e por módulo importado")
+    parser.add_argument("--record", metavar="ARQUIVO", help="grava a simulação num replay")
+    parser.add_argument("--replay", metavar="ARQUIVO", help="reproduz um replay gravado (ignora as opções da simulação)")
+    parser.add_argument("--seek", type=float, metavar="SEGUNDOS", help="com --replay, pula para esse tempo do replay e para nele")
+    parser.add_argument("--validate-levels", type=int, nargs="*", metavar="LEVEL", help="valida os níveis de levels.json (todos, se nenhum for dado)")
+    args = parser.parse_args()
+
+    if args.headless:
+        raise SystemExit(run_headless(args))
+
+    Game(startup_profiler).run()
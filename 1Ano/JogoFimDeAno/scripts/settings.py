@@ -1,12 +1,8 @@
-import pygame.mixer as pgmx
 import pygame.freetype as pgft
 from json import load as json_load
 from math import sin, cos, atan2, pi
-from random import choice
-from os import listdir, path
-
-pgft.init() # Needed for the FreeType library initialize
-pgmx.init() # Initialize Song
+from os import path
+from typing import Any
 
 BASE_RESOLUTION: tuple[int, int] = (800, 600) # Base Resolution of the screen
 
@@ -83,6 +79,7 @@ def convert_decimal_to_roman(num: int) -> str | None:
     return roman_number
 
 INITIAL_MAX_FPS: float = 60.0
+GAME_TICK: float = 1 / 120 # The fixed step of the game modes' gameplay, whatever the framerate (their replays are recorded by tick)
 COLORS: dict[str, tuple[int, int, int, int | None]] = {
     "BLACK" : (0, 0, 0),
     "GRAY" : (20, 20, 20),
@@ -92,37 +89,38 @@ COLORS: dict[str, tuple[int, int, int, int | None]] = {
     "BLUE" : (35, 172, 255),
     "BLANK" : (0, 0, 0, 0)
 }
-FONT: pgft.Font = pgft.Font(get_file_path("../fonts/inter.ttf"))
 OBSTACLES_HEIGHT: int = 30
 INITIAL_ALPHA_TRACKER: int = 50
 
-with open(get_file_path("../data/levels.json")) as file:
-    LEVELS: dict[str, list[int]] = json_load(file)
+# The font and the data files are only loaded on first use, so importing 'scripts' doesn't slow the start
+_font: pgft.Font | None = None
+_data_files: dict[str, Any] = {}
+
+def get_font() -> pgft.Font:
+    global _font
+
+    if _font is None:
+        if not pgft.get_init(): pgft.init() # Needed for the FreeType library initialize
+        _font = pgft.Font(get_file_path("../fonts/inter.ttf"))
+
+    return _font
 
-with open(get_file_path("../data/levels_perfection.json")) as file:
-    LEVELS_PERFECTION: dict[str, bool] = json_load(file)
+def _load_data(file_name: str) -> Any:
+    """Returns the content of a json file of the "data" folder, reading it only the first time (the same object is shared)."""
+    data = _data_files.get(file_name)
 
-with open(get_file_path("../data/player_perfection_levels.json")) as file:
-    LEVELS_PERFECTION_UNLOCKED: dict[str, bool] = json_load(file)
+    if data is None:
+        with open(get_file_path(f"../data/{file_name}")) as file:
+            data = _data_files[file_name] = json_load(file)
 
-with open(get_file_path("../data/achievements.json")) as file:
-    ACHIEVEMENTS: dict[str, dict[str, str | bool | int]] = json_load(file)
+    return data
 
-with open(get_file_path("../data/player_achievements_unlocked.json")) as file:
-    ACHIEVEMENTS_UNLOCKED: dict[str, bool] = json_load(file)
+def get_levels() -> dict[str, list[int]]: return _load_data("levels.json")
 
-BACKGROUNDMUSICS: list[str] = [
-    i for i in listdir(get_file_path("../audio/backgroundmusics"))
-]
+def get_levels_perfection() -> dict[str, int]: return _load_data("levels_perfection.json")
 
-def play_random_bg_music() -> None:
-    if not pgmx.music.get_busy():
-        music_path = get_file_path(f"../audio/backgroundmusics/{choice(BACKGROUNDMUSICS)}")
-        pgmx.music.load(music_path)
-        pgmx.music.play(1, 0, 500)
+def get_levels_perfection_unlocked() -> dict[str, bool]: return _load_data("player_perfection_levels.json")
 
-def get_music_volume() -> float:
-    return pgmx.music.get_volume()
+def get_achievements() -> dict[str, dict[str, str | bool | int]]: return _load_data("achievements.json")
 
-def set_music_volume(volume: float) -> None:
-    pgmx.music.set_volume(volume)
+def get_achievements_unlocked() -> dict[str, bool]: return _load_data("player_achievements_unlocked.json")